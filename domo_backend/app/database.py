@@ -1,4 +1,7 @@
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import text
+from app.services.search import search_schema_statements
+from app.services.recruitment_search import RECRUITMENT_SCHEMA_STATEMENTS
 
 DATABASE_URL = "postgresql://user:password@db:5432/project_db"
 
@@ -8,5 +11,49 @@ def get_db():
     with Session(engine) as session:
         yield session
 
+# create_all()은 이미 존재하는 테이블을 수정하지 않으므로,
+# 기존 테이블에 추가된 컬럼/인덱스는 여기에 멱등(IF NOT EXISTS) SQL로 추가합니다.
+SCHEMA_UPGRADES = [
+    # files.latest_version_id (최신 버전 비정규화) + 기존 데이터 채우기
+    "ALTER TABLE files ADD COLUMN IF NOT EXISTS latest_version_id INTEGER",
+    """
+    UPDATE files f SET latest_version_id = v.id
+    FROM (
+        SELECT DISTINCT ON (file_id) id, file_id
+        FROM file_versions
+        ORDER BY file_id, version DESC
+    ) v
+    WHERE v.file_id = f.id AND f.latest_version_id IS NULL
+    """,
+
+    # project_events 반복 일정 + 캘린더 구간 조회 인덱스
+    "ALTER TABLE project_events ADD COLUMN IF NOT EXISTS recurrence_rule VARCHAR",
+    "ALTER TABLE project_events ADD COLUMN IF NOT EXISTS recurrence_until TIMESTAMP WITHOUT TIME ZONE",
+    "CREATE INDEX IF NOT EXISTS ix_project_events_project_start ON project_events (project_id, start_datetime)",
+
+    # chat_messages.client_id (WebSocket 전송 멱등성)
+    "ALTER TABLE chat_messages ADD COLUMN IF NOT EXISTS client_id VARCHAR(64)",
+    # 멱등성 키는 프로젝트별 (project_id, user_id, client_id) — 예전 (user_id, client_id) 인덱스는 교체
+    "DROP INDEX IF EXISTS ux_chat_messages_user_client",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_chat_messages_project_user_client ON chat_messages (project_id, user_id, client_id)",
+    # 채팅 기록 커서 페이지네이션 (project_id, id)
+    "CREATE INDEX IF NOT EXISTS ix_chat_messages_project_id_id ON chat_messages (project_id, id)",
+
+    # 안 읽은 게시글/카드 댓글 수 (project_id, id) / (card_id, id)
+    "CREATE INDEX IF NOT EXISTS ix_posts_project_id_id ON posts (project_id, id)",
+    "CREATE INDEX IF NOT EXISTS ix_card_comments_card_id_id ON card_comments (card_id, id)",
+
+    # 통합 검색: search_vector 생성 컬럼 + GIN(tsvector / pg_trgm) 인덱스
+    *search_schema_statements(),
+
+    # 모집 공고: 목록 필터 복합 인덱스 + 제목/설명 트라이그램 인덱스
+    *RECRUITMENT_SCHEMA_STATEMENTS,
+]
+
+
 def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
\ No newline at end of file
+    SQLModel.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        for statement in SCHEMA_UPGRADES:
+            conn.execute(text(statement))
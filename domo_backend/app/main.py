@@ -7,7 +7,11 @@ import asyncio
 from fastapi.staticfiles import StaticFiles
 
 #routers
-from app.routers import auth, workspace, board, schedule, file, activity, user, voice, chat, post, community, match
+from app.routers import auth, workspace, board, schedule, file, activity, user, voice, chat, post, community, match, media, search, unread
+from app.services import thumbnails, storage_gc, view_counter, recruitment_scheduler, chat_archive
+from app.services.chat_bus import chat_writer
+from app.services.storage import storage, LocalStorage
+from app.utils.origin import origins
 
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -29,6 +33,14 @@ async def lifespan(app: FastAPI):
     create_db_and_tables()
     print("✅ [Database] Ready.", flush=True)
 
+    # 1-1. 파일 저장소 준비 (오브젝트 스토리지면 버킷 확인/생성)
+    print(f"🗄️  [Storage] Using {type(storage).__name__}...", flush=True)
+    storage.setup()
+    storage_gc.start()
+    view_counter.start()
+    recruitment_scheduler.start()
+    chat_archive.start()
+
     # 2. VectorWave 연결 (재시도 로직 강화)
     if initialize_database:
         print("🌊 [VectorWave] Connecting to Weaviate...", flush=True)
@@ -62,6 +74,12 @@ async def lifespan(app: FastAPI):
     print("===============================================\n", flush=True)
     yield
     print("\n👋 Server Shutting Down...", flush=True)
+    await storage_gc.stop()
+    await chat_archive.stop()
+    await recruitment_scheduler.stop()
+    await view_counter.stop()
+    await chat_writer.stop()
+    thumbnails.shutdown()
 
 
 app = FastAPI(
@@ -71,22 +89,20 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-origins = [
-    "http://localhost:3000",      # 프론트엔드 개발 서버
-    "http://localhost:3001",      # (혹시 포트가 다를 경우 대비)
-    "http://127.0.0.1:3000",
-    "*"                           # 테스트용 (보안상 나중엔 특정 도메인만 허용 추천)
-]
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,        # 허용할 출처 목록
     allow_credentials=True,       # 쿠키/인증 정보 포함 허용
     allow_methods=["*"],          # 모든 HTTP 메서드(GET, POST, OPTIONS 등) 허용
     allow_headers=["*"],          # 모든 헤더 허용
+    expose_headers=["X-Next-Cursor"],  # 커서 페이지네이션 헤더를 프론트에서 읽을 수 있도록
 )
 
-app.mount("/static", StaticFiles(directory="/app/uploads"), name="static")
+if isinstance(storage, LocalStorage):
+    app.mount("/static", StaticFiles(directory=storage.root), name="static")
+else:
+    # 오브젝트 스토리지: /static/... 요청을 presigned URL로 리다이렉트
+    app.include_router(media.static_router)
 
 #routers
 app.include_router(auth.router, prefix="/api/auth")
@@ -101,6 +117,9 @@ app.include_router(chat.router, prefix="/api")
 app.include_router(post.router, prefix="/api")
 app.include_router(community.router, prefix="/api")
 app.include_router(match.router, prefix="/api")
+app.include_router(media.router, prefix="/api")
+app.include_router(search.router, prefix="/api")
+app.include_router(unread.router, prefix="/api")
 
 @app.get("/")
 def read_root():
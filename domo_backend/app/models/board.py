@@ -2,7 +2,7 @@ from typing import Optional, List
 from datetime import datetime
 from sqlmodel import SQLModel, Field, Relationship
 from app.models.user import User
-from sqlalchemy import ForeignKey # 순환 참조용
+from sqlalchemy import ForeignKey, Index # 순환 참조용
 
 
 class CardFileLink(SQLModel, table=True):
@@ -127,6 +127,10 @@ class Card(SQLModel, table=True):
 
 class CardComment(SQLModel, table=True):
     __tablename__ = "card_comments"
+    __table_args__ = (
+        # 카드별 댓글 조회 / 안 읽은 댓글 수 (card_id = ? AND id > ?)
+        Index("ix_card_comments_card_id_id", "card_id", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     card_id: int = Field(foreign_key="cards.id")
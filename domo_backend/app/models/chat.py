@@ -1,17 +1,46 @@
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from datetime import datetime
 from app.models.user import User
 
 class ChatMessage(SQLModel, table=True):
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # 프로젝트별 채팅 기록 페이지네이션 (project_id = ? AND id < ? ORDER BY id DESC)
+        Index("ix_chat_messages_project_id_id", "project_id", "id"),
+        # WebSocket 전송 멱등성 (같은 프로젝트에 같은 사람이 같은 client_id로 재전송하면 한 번만 저장)
+        Index("ux_chat_messages_project_user_client", "project_id", "user_id", "client_id", unique=True),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    project_id: int = Field(foreign_key="projects.id", index=True)
+    project_id: int = Field(foreign_key="projects.id")
     user_id: int = Field(foreign_key="users.id")
 
     content: str
+    client_id: Optional[str] = Field(default=None, max_length=64)
     created_at: datetime = Field(default_factory=datetime.now)
 
     user: Optional[User] = Relationship()
     project: Optional["Project"] = Relationship(back_populates="chats")
+
+
+class ChatArchiveSegment(SQLModel, table=True):
+    """오래된 채팅 메시지를 프로젝트/월 단위로 압축해 저장소에 옮겨 둔 묶음 (id 구간)"""
+    __tablename__ = "chat_archive_segments"
+    __table_args__ = (
+        # 과거 기록 조회: project_id = ? AND first_message_id < ? ORDER BY last_message_id DESC
+        Index("ix_chat_archive_segments_project_last", "project_id", "last_message_id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    project_id: int = Field(foreign_key="projects.id")
+    month: str = Field(max_length=7)  # 예: 2026-03
+    first_message_id: int
+    last_message_id: int
+    message_count: int
+    storage_key: str = Field(unique=True)  # chat-archive/{project_id}/{month}/{first}-{last}.jsonl.gz
+    size: int = 0
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    project: Optional["Project"] = Relationship(back_populates="chat_archives")
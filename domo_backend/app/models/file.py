@@ -21,14 +21,18 @@ class FileMetadata(SQLModel, table=True):
     versions: List["FileVersion"] = Relationship(back_populates="file_metadata")
     project: Optional["Project"] = Relationship(back_populates="files")
 
-    # ✅ [추가 2] "최신 버전"을 자동으로 계산하는 프로퍼티
-    # 스키마(FileResponse)가 'latest_version'이라는 이름을 찾을 때 이 함수가 실행됩니다.
-    @property
-    def latest_version(self):
-        if not self.versions:
-            return None
-        # 버전 숫자(version)를 기준으로 내림차순 정렬 후 첫 번째 것 반환
-        return sorted(self.versions, key=lambda v: v.version, reverse=True)[0]
+    # ✅ 최신 버전 (업로드 시 갱신되는 비정규화 컬럼)
+    # 목록/카드 응답마다 versions 전체를 불러와 정렬하지 않도록 최신 버전 ID를 직접 들고 있습니다.
+    # (files ↔ file_versions 순환 FK를 피하기 위해 FK 제약은 두지 않음)
+    latest_version_id: Optional[int] = Field(default=None)
+    latest_version: Optional["FileVersion"] = Relationship(
+        sa_relationship_kwargs={
+            "primaryjoin": "foreign(FileMetadata.latest_version_id) == FileVersion.id",
+            "uselist": False,
+            "viewonly": True,
+            "lazy": "selectin"
+        }
+    )
 
 
 # 2. 파일 버전 (실제 물리적 파일 정보)
@@ -39,7 +43,7 @@ class FileVersion(SQLModel, table=True):
     file_id: int = Field(foreign_key="files.id", index=True)
 
     version: int = Field(default=1)  # v1, v2, ...
-    saved_path: str  # 서버에 저장된 실제 경로 (UUID 등으로 변환됨)
+    saved_path: str  # 저장소 키 (files/{uuid}.ext, 예전 데이터는 /app/uploads/... 절대 경로)
     file_size: int  # 바이트 단위
 
     uploader_id: int = Field(foreign_key="users.id")  # 버전을 올린 사람
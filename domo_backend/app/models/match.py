@@ -1,7 +1,7 @@
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 from sqlmodel import SQLModel, Field, Relationship, Column, Enum as SQLEnum
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index
 import enum
 
 if TYPE_CHECKING:
@@ -91,6 +91,10 @@ class TechStack(SQLModel, table=True):
 class PositionSlot(SQLModel, table=True):
     """모집 포지션 슬롯 테이블"""
     __tablename__ = "position_slots"
+    __table_args__ = (
+        # 포지션 필터 (recruitment_id = ? AND position IN (...))
+        Index("ix_position_slots_recruitment_position", "recruitment_id", "position"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     recruitment_id: int = Field(foreign_key="recruitments.id", ondelete="CASCADE")
@@ -105,6 +109,10 @@ class PositionSlot(SQLModel, table=True):
 class Recruitment(SQLModel, table=True):
     """모집 공고 테이블"""
     __tablename__ = "recruitments"
+    __table_args__ = (
+        # 목록 조회 (status / region / category 필터 + 최신순)
+        Index("ix_recruitments_status_region_category_created", "status", "region", "category", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", ondelete="CASCADE")
@@ -194,3 +202,12 @@ class Seminar(SQLModel, table=True):
 
     # Relationships
     user: Optional["User"] = Relationship(back_populates="seminars")
+
+
+class SeminarParticipant(SQLModel, table=True):
+    """세미나 참가자 테이블 (같은 사람이 두 번 참가 신청하지 못하도록 복합 PK)"""
+    __tablename__ = "seminar_participants"
+
+    seminar_id: int = Field(foreign_key="seminars.id", primary_key=True, ondelete="CASCADE")
+    user_id: int = Field(foreign_key="users.id", primary_key=True, ondelete="CASCADE")
+    created_at: datetime = Field(default_factory=datetime.now)
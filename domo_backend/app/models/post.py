@@ -1,10 +1,15 @@
 from typing import Optional, List
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from datetime import datetime
 from app.models.user import User  # User 모델 참조를 위해
 
 class Post(SQLModel, table=True):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 프로젝트별 게시글 조회 / 안 읽은 글 수 (project_id = ? AND id > ?)
+        Index("ix_posts_project_id_id", "project_id", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     project_id: int = Field(foreign_key="projects.id")
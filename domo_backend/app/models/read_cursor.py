@@ -0,0 +1,24 @@
+from enum import Enum
+from typing import Optional
+from datetime import datetime
+from sqlmodel import SQLModel, Field, Relationship
+
+
+class ReadChannel(str, Enum):
+    chat = "chat"                    # 프로젝트 채팅 (chat_messages)
+    posts = "posts"                  # 프로젝트 게시판 (posts)
+    card_comments = "card_comments"  # 보드 카드 댓글 (card_comments)
+
+
+class ReadCursor(SQLModel, table=True):
+    """사용자가 프로젝트의 각 채널에서 마지막으로 읽은 id (이보다 큰 id = 안 읽음)"""
+    __tablename__ = "read_cursors"
+
+    user_id: int = Field(primary_key=True, foreign_key="users.id")
+    project_id: int = Field(primary_key=True, foreign_key="projects.id")
+    channel: str = Field(primary_key=True, max_length=20)  # ReadChannel 값
+
+    last_read_id: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+    project: Optional["Project"] = Relationship(back_populates="read_cursors")
@@ -1,5 +1,6 @@
 from typing import Optional
 from datetime import time, datetime
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 
 
@@ -16,6 +17,10 @@ class Schedule(SQLModel, table=True):
 
 class ProjectEvent(SQLModel, table=True):
     __tablename__ = "project_events"
+    __table_args__ = (
+        # 캘린더 구간 조회 (project_id = ? AND start_datetime < ?)
+        Index("ix_project_events_project_start", "project_id", "start_datetime"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     project_id: int = Field(foreign_key="projects.id")
@@ -27,6 +32,11 @@ class ProjectEvent(SQLModel, table=True):
     start_datetime: datetime
     end_datetime: datetime
 
+    # 반복 일정 (RRULE, 예: FREQ=WEEKLY;BYDAY=MO;COUNT=10) - 첫 회차가 start/end_datetime
+    recurrence_rule: Optional[str] = None
+    # 마지막 회차의 종료 시각 (끝없는 반복이면 None) - 구간 조회용
+    recurrence_until: Optional[datetime] = None
+
     created_by: int = Field(foreign_key="users.id")
     created_at: datetime = Field(default_factory=datetime.now)
     project: Optional["Project"] = Relationship(back_populates="events")
\ No newline at end of file
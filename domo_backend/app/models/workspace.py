@@ -57,6 +57,11 @@ class Project(SQLModel, table=True):
     posts: List["Post"] = Relationship(back_populates="project", sa_relationship_kwargs={"cascade": "all, delete"})
     chats: List["ChatMessage"] = Relationship(back_populates="project",
                                               sa_relationship_kwargs={"cascade": "all, delete"})
+    # 압축 파일은 참조가 없어지면 저장소 GC가 정리
+    chat_archives: List["ChatArchiveSegment"] = Relationship(back_populates="project",
+                                                             sa_relationship_kwargs={"cascade": "all, delete"})
+    read_cursors: List["ReadCursor"] = Relationship(back_populates="project",
+                                                    sa_relationship_kwargs={"cascade": "all, delete"})
     events: List["ProjectEvent"] = Relationship(back_populates="project",
                                                 sa_relationship_kwargs={"cascade": "all, delete"})
     files: List["FileMetadata"] = Relationship(back_populates="project",
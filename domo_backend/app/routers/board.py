@@ -26,6 +26,7 @@ from app.utils.logger import log_activity
 from vectorwave import *
 from fastapi import WebSocket, WebSocketDisconnect
 from app.utils.connection_manager import board_event_manager
+from app.services import unread
 
 router = APIRouter(tags=["Board & Cards"])
 
@@ -723,6 +724,7 @@ async def create_comment(card_id: int, comment_data: CardCommentCreate, user_id:
     db.add(new_comment)
     db.commit()
     db.refresh(new_comment)
+    unread.invalidate_project(project_id)
 
     # 🔥 [SSE] jsonable_encoder 사용
     await board_event_manager.broadcast(project_id, {
@@ -1,42 +1,103 @@
 # app/routers/chat.py
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session, select
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from fastapi.responses import StreamingResponse
 from app.database import get_db
 from app.models.chat import ChatMessage
+from app.models.session import UserSession
 from app.models.user import User
+from app.models.workspace import Project, WorkspaceMember
 from app.schemas import ChatMessageResponse, ChatMessageCreate
 from app.routers.workspace import get_current_user_id
+from app.services import chat_archive, unread
+from app.services.chat_bus import chat_bus, chat_writer, message_payload, PendingMessage
+from app.utils.origin import is_allowed_websocket_origin
 from vectorwave import vectorize
 import asyncio
 import json
 
 router = APIRouter(tags=["Project Chat"])
 
-# 1. 채팅 메시지 목록 조회 (Polling용)
-# 프론트엔드: 1~3초마다 이 API를 호출해서 새로운 메시지가 있는지 확인합니다.
+# 채팅 기록 한 번에 조회할 수 있는 최대 개수
+MAX_PAGE_SIZE = 100
+
+# WebSocket 채팅 제한
+MAX_CONTENT_LENGTH = 4000
+MAX_CLIENT_ID_LENGTH = 64
+HISTORY_LIMIT = 200
+
+
+def _user_brief(user: User) -> dict:
+    return {
+        "id": user.id,
+        "email": user.email,
+        "name": user.name,
+        "nickname": user.nickname,
+        "is_student_verified": user.is_student_verified,
+        "profile_image": user.profile_image
+    }
+
+
+def _archived_responses(db: Session, records: List[dict]) -> List[ChatMessageResponse]:
+    if not records:
+        return []
+    users = {
+        user.id: user
+        for user in db.exec(select(User).where(User.id.in_({r["user_id"] for r in records}))).all()
+    }
+    return [
+        ChatMessageResponse(**record, user=users.get(record["user_id"]))
+        for record in records
+    ]
+
+
+# 1. 채팅 메시지 목록 조회 (id 커서 페이지네이션)
+# - 기본: 최신 limit개
+# - before_id: 그 이전(과거) 메시지 limit개 → 위로 스크롤하며 과거 기록 불러오기
+# - after_id: 그 이후 메시지를 오래된 것부터 limit개 → 놓친 메시지 따라잡기 (Polling)
+# (project_id, id) 인덱스 범위 스캔이라 기록이 아무리 많아도 페이지 비용이 일정합니다.
+# 핫 테이블로 모자라면 보관(아카이브)된 세그먼트에서 이어서 읽습니다.
+# 결과는 항상 시간순(과거 -> 현재)입니다.
 @router.get("/projects/{project_id}/chat", response_model=List[ChatMessageResponse])
 def get_chat_messages(
         project_id: int,
-        limit: int = 50,
-        after_id: int = 0,  # 👈 핵심: 이 ID 이후의 메시지만 가져오기 (최적화)
+        limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+        after_id: int = 0,
+        before_id: Optional[int] = None,
         db: Session = Depends(get_db),
         user_id: int = Depends(get_current_user_id)
 ):
+    if after_id > 0 and before_id is not None:
+        raise HTTPException(status_code=400, detail="after_id와 before_id는 함께 사용할 수 없습니다.")
+
     query = select(ChatMessage).where(ChatMessage.project_id == project_id)
 
-    # 마지막으로 받은 메시지 이후의 것만 조회 (대역폭 절약)
     if after_id > 0:
-        query = query.where(ChatMessage.id > after_id)
+        archived = chat_archive.read_after(db, project_id, after_id, limit)
+        messages = []
+        if len(archived) < limit:
+            cursor = archived[-1]["id"] if archived else after_id
+            messages = db.exec(
+                query.where(ChatMessage.id > cursor).order_by(ChatMessage.id.asc()).limit(limit - len(archived))
+            ).all()
+        return _archived_responses(db, archived) + list(messages)
 
-    # 최신순 정렬 -> 다시 시간순 정렬
-    messages = db.exec(query.order_by(ChatMessage.created_at.desc()).limit(limit)).all()
+    if before_id is not None:
+        query = query.where(ChatMessage.id < before_id)
+    messages = db.exec(query.order_by(ChatMessage.id.desc()).limit(limit)).all()
+
+    archived = []
+    if len(messages) < limit:
+        cursor = messages[-1].id if messages else before_id
+        archived = chat_archive.read_before(db, project_id, cursor, limit - len(messages))
 
     # 시간순으로 정렬해서 반환 (과거 -> 현재)
-    return list(reversed(messages))
+    return _archived_responses(db, archived) + list(reversed(messages))
+
 
 # 2. 채팅 메시지 전송 (일반 HTTP POST)
 @router.post("/projects/{project_id}/chat", response_model=ChatMessageResponse)
@@ -61,65 +122,180 @@ def send_chat_message(
     db.add(new_msg)
     db.commit()
     db.refresh(new_msg)
+    unread.invalidate_project(project_id)
+
+    # WebSocket / SSE 구독자에게 전달
+    chat_bus.publish_threadsafe(project_id, {
+        "type": "message",
+        "message": message_payload(
+            new_msg.id, project_id, user_id, new_msg.content, new_msg.created_at, None, _user_brief(user)
+        )
+    })
 
     return new_msg
 
-# ✅ [신규] SSE 기반 실시간 채팅 스트림
+# ✅ SSE 기반 실시간 채팅 스트림 (수신 전용)
 @router.get("/projects/{project_id}/chat/stream")
 async def stream_chat_messages(
         project_id: int,
-        request: Request,
-        db: Session = Depends(get_db)
+        request: Request
 ):
     """
     Server-Sent Events (SSE) 엔드포인트
-    클라이언트가 연결하면, 1초마다 DB를 확인해서 새로운 메시지가 있으면 '푸시'해줍니다.
+    채팅 버스를 구독해 새 메시지가 저장되는 즉시 '푸시'해줍니다. (DB 폴링 없음)
     """
+    queue = chat_bus.subscribe(project_id)
 
     async def event_generator():
-        # 처음 연결 시점의 가장 마지막 메시지 ID를 가져옵니다.
-        last_msg = db.exec(
+        try:
+            while True:
+                if await request.is_disconnected():
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=15.0)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    break
+                if event.get("type") == "message":
+                    yield f"data: {json.dumps(event['message'], ensure_ascii=False)}\n\n"
+        finally:
+            chat_bus.unsubscribe(project_id, queue)
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
+# ✅ WebSocket 채팅 (양방향)
+# 접속 시 한 번만 Origin/인증/권한 확인 → 이후 메시지는 인증 쿼리 없이 배치 저장 + 버스로 전달
+#   보내기:  {"type": "send", "client_id": "<클라이언트가 만든 고유값>", "content": "..."}
+#   받기:    {"type": "ack", "client_id", "id", "created_at"}   (같은 client_id 재전송 시 같은 id)
+#            {"type": "message", "message": {...}}              (본인 메시지 포함)
+#            {"type": "history", "messages": [...], "has_more"} (접속 시 after_id 이후 메시지)
+#            {"type": "error", "client_id"?, "detail"}
+def _authenticate_chat(db: Session, session_id: Optional[str], project_id: int) -> Optional[User]:
+    if not session_id:
+        return None
+    session = db.get(UserSession, session_id)
+    if not session or session.expires_at < datetime.now():
+        return None
+    project = db.get(Project, project_id)
+    if not project or not db.get(WorkspaceMember, (project.workspace_id, session.user_id)):
+        return None
+    return db.get(User, session.user_id)
+
+
+def _history_after(db: Session, project_id: int, after_id: int) -> List[dict]:
+    """접속 시 보낼 after_id 이후 메시지 (HISTORY_LIMIT + 1개까지 읽어 has_more 판단)
+    get_chat_messages와 같이 보관된 세그먼트 → 핫 테이블 순서로 이어서 읽음"""
+    limit = HISTORY_LIMIT + 1
+    archived = chat_archive.read_after(db, project_id, after_id, limit)
+    history = [
+        message_payload(r["id"], r["project_id"], r["user_id"], r["content"], r["created_at"], r["client_id"], None)
+        for r in archived
+    ]
+    if len(history) < limit:
+        cursor = archived[-1]["id"] if archived else after_id
+        messages = db.exec(
             select(ChatMessage)
             .where(ChatMessage.project_id == project_id)
-            .order_by(ChatMessage.id.desc())
-            .limit(1)
-        ).first()
+            .where(ChatMessage.id > cursor)
+            .order_by(ChatMessage.id.asc())
+            .limit(limit - len(history))
+        ).all()
+        history += [
+            message_payload(m.id, m.project_id, m.user_id, m.content, m.created_at, m.client_id, None)
+            for m in messages
+        ]
+    return history
+
+
+@router.websocket("/ws/projects/{project_id}/chat")
+async def chat_websocket(
+        websocket: WebSocket,
+        project_id: int,
+        after_id: Optional[int] = None,
+        db: Session = Depends(get_db)
+):
+    # 다른 사이트가 로그인한 멤버의 쿠키로 소켓을 여는 것(CSWSH) 방지
+    if not is_allowed_websocket_origin(websocket.headers.get("origin"), websocket.headers.get("host")):
+        await websocket.close(code=4403)
+        return
+
+    # 동기 DB 조회는 스레드풀에서 (이벤트 루프를 막지 않도록)
+    user = await run_in_threadpool(_authenticate_chat, db, websocket.cookies.get("session_id"), project_id)
+    if not user:
+        await websocket.close(code=4403)
+        return
 
-        last_id = last_msg.id if last_msg else 0
+    user_id = user.id
+    user_info = _user_brief(user)
+    await websocket.accept()
 
-        # 연결이 끊기지 않는 동안 계속 루프를 돕니다.
+    # 놓친 메시지를 조회하기 전에 먼저 구독 (그 사이 메시지가 빠지지 않도록, 중복은 id로 제거)
+    queue = chat_bus.subscribe(project_id)
+    try:
+        if after_id is not None:
+            history = await run_in_threadpool(_history_after, db, project_id, after_id)
+            await websocket.send_json({
+                "type": "history",
+                "messages": history[:HISTORY_LIMIT],
+                "has_more": len(history) > HISTORY_LIMIT
+            })
+    finally:
+        # 연결이 유지되는 동안 DB 커넥션을 잡고 있지 않도록
+        await run_in_threadpool(db.close)
+
+    async def forward():
         while True:
-            # 클라이언트 연결이 끊겼는지 체크
-            if await request.is_disconnected():
-                break
-
-            # 1. 새로운 메시지가 있는지 조회 (마지막 ID보다 큰 것)
-            # 주의: 실제 프로덕션에서는 Redis 등을 쓰지만, 간단하게 DB 폴링으로 구현합니다.
-            new_messages = db.exec(
-                select(ChatMessage)
-                .where(ChatMessage.project_id == project_id)
-                .where(ChatMessage.id > last_id)
-                .order_by(ChatMessage.id.asc())
-            ).all()
+            event = await queue.get()
+            if event is None:
+                # 너무 밀려서 버스에서 끊김 → 재접속(after_id)으로 따라잡도록
+                await websocket.close(code=1013)
+                return
+            await websocket.send_json(event)
 
-            # 2. 새 메시지가 있으면 전송
-            if new_messages:
-                for msg in new_messages:
-                    # 보낼 데이터를 JSON 문자열로 변환
-                    data = json.dumps({
-                        "id": msg.id,
-                        "content": msg.content,
-                        "user_id": msg.user_id,
-                        "created_at": msg.created_at.isoformat()
-                    }, ensure_ascii=False)
+    def reply(event: dict):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            pass
 
-                    # SSE 형식 (data: {json}\n\n)에 맞춰 전송
-                    yield f"data: {data}\n\n"
+    sender = asyncio.create_task(forward())
+    try:
+        while True:
+            try:
+                data = json.loads(await websocket.receive_text())
+            except ValueError:
+                data = None
+            kind = data.get("type") if isinstance(data, dict) else None
 
-                    # 마지막 ID 갱신
-                    last_id = msg.id
+            if kind == "ping":
+                reply({"type": "pong"})
+                continue
+            if kind != "send":
+                reply({"type": "error", "detail": "알 수 없는 메시지 형식입니다."})
+                continue
 
-            # 3. 1초 대기 (서버 부하 방지)
-            await asyncio.sleep(1)
+            client_id = data.get("client_id")
+            content = data.get("content")
+            if not isinstance(client_id, str) or not 0 < len(client_id) <= MAX_CLIENT_ID_LENGTH:
+                reply({"type": "error", "detail": f"client_id는 1~{MAX_CLIENT_ID_LENGTH}자 문자열이어야 합니다."})
+                continue
+            if not isinstance(content, str) or not content.strip() or len(content) > MAX_CONTENT_LENGTH:
+                reply({"type": "error", "client_id": client_id, "detail": f"메시지는 1~{MAX_CONTENT_LENGTH}자여야 합니다."})
+                continue
 
-    return StreamingResponse(event_generator(), media_type="text/event-stream")
\ No newline at end of file
+            chat_writer.submit(PendingMessage(
+                project_id=project_id,
+                user_id=user_id,
+                content=content,
+                client_id=client_id,
+                user=user_info,
+                reply=queue
+            ))
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        sender.cancel()
+        chat_bus.unsubscribe(project_id, queue)
@@ -2,7 +2,6 @@
 
 import os
 import uuid
-import shutil
 from typing import List, Optional
 from datetime import datetime
 
@@ -20,12 +19,13 @@ from app.schemas import (
     CommunityCommentUpdate
 )
 from app.utils.logger import log_activity
+from app.services import thumbnails
+from app.services.storage import storage
 from vectorwave import vectorize
 
 router = APIRouter(tags=["Community"])
 
-UPLOAD_DIR = "/app/uploads/community"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+UPLOAD_PREFIX = "community"
 
 # ---------------------------------------------------------
 # 📋 게시글 목록 조회 (전체 공개)
@@ -79,13 +79,12 @@ def create_community_post(
             raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다.")
 
         file_ext = os.path.splitext(file.filename)[1]
-        filename = f"{uuid.uuid4().hex}{file_ext}"
-        file_path = os.path.join(UPLOAD_DIR, filename)
+        key = f"{UPLOAD_PREFIX}/{uuid.uuid4().hex}{file_ext}"
 
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        storage.put(key, file.file, file.content_type)
+        thumbnails.schedule_thumbnails(key)
 
-        image_url = f"/static/community/{filename}"
+        image_url = storage.url(key)
 
     # 2. 게시글 저장
     new_post = CommunityPost(
@@ -196,19 +195,19 @@ def delete_community_post(
     if post.user_id != user_id:
         raise HTTPException(status_code=403, detail="작성자만 삭제할 수 있습니다.")
 
-    # 이미지 파일도 삭제 (선택 사항)
-    if post.image_url:
-        try:
-            filename = os.path.basename(post.image_url)
-            file_path = os.path.join(UPLOAD_DIR, filename)
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except Exception:
-            pass # 파일 삭제 실패는 무시
-
+    image_url = post.image_url
     db.delete(post)
     db.commit()
 
+    # 이미지 파일도 삭제 (실패해도 게시글 삭제는 유지, 남은 파일은 저장소 GC가 정리)
+    if image_url:
+        key = storage.normalize_key(image_url)
+        try:
+            storage.delete(key)
+            thumbnails.remove_thumbnails(key)
+        except Exception as e:
+            print(f"⚠️ [Community] Failed to delete image {key}: {e}")
+
     return {"message": "게시글이 삭제되었습니다."}
 
 # ---------------------------------------------------------
@@ -2,35 +2,124 @@
 
 import os
 import uuid
-import shutil
+import asyncio
 from typing import List
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks, Request, Header
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import FileResponse  # 👈 파일 전송용
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session, select, desc
-
+from sqlalchemy.orm import contains_eager
 from app.database import get_db
 from app.routers.workspace import get_current_user_id
 from app.models.file import FileMetadata, FileVersion
 from app.models.workspace import Project
 from app.models.user import User
-from app.schemas import FileResponse as FileSchema, FileVersionResponse
+from app.schemas import FileResponse as FileSchema, FileVersionResponse, ResumableUploadCreate, \
+    ResumableUploadResponse
 from app.utils.logger import log_activity
 from app.utils.connection_manager import board_event_manager
+from app.services import upload_session
+from app.services.upload_session import UploadSessionError
+from app.services.file_transfer import version_file_response, stored_object_response
+from app.services import thumbnails
+from app.services.storage import storage
 from vectorwave import vectorize
 
 router = APIRouter(tags=["Files"])
 
-UPLOAD_DIR = "/app/uploads/files"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# 프로젝트 파일의 저장소 키 접두어 (files/{uuid}.ext)
+UPLOAD_PREFIX = "files"
+
+
+def _new_file_key(filename: str) -> str:
+    return f"{UPLOAD_PREFIX}/{uuid.uuid4()}{os.path.splitext(filename)[1]}"
+
+
+# =================================================================
+# 🧩 공통: 저장된 파일을 FileMetadata/FileVersion으로 등록
+# - 같은 이름의 파일이 있으면 새 버전(v+1), 없으면 v1 생성
+# =================================================================
+def register_file_version(
+        db: Session,
+        project_id: int,
+        filename: str,
+        saved_path: str,
+        file_size: int,
+        user_id: int
+):
+    existing_file = db.exec(
+        select(FileMetadata)
+        .where(FileMetadata.project_id == project_id)
+        .where(FileMetadata.filename == filename)
+    ).first()
+
+    current_version_num = 1
+    target_file_id = None
+
+    if existing_file:
+        if existing_file.latest_version:
+            current_version_num = existing_file.latest_version.version + 1
+
+        target_file_id = existing_file.id
+        existing_file.updated_at = datetime.now()
+        db.add(existing_file)
+    else:
+        new_file = FileMetadata(
+            project_id=project_id,
+            filename=filename,
+            owner_id=user_id
+        )
+        db.add(new_file)
+        db.commit()
+        db.refresh(new_file)
+        target_file_id = new_file.id
+        existing_file = new_file
+
+    new_version = FileVersion(
+        file_id=target_file_id,
+        version=current_version_num,
+        saved_path=saved_path,
+        file_size=file_size,
+        uploader_id=user_id
+    )
+    db.add(new_version)
+    db.flush()
+
+    # 최신 버전 포인터 갱신 (목록 조회 시 정렬 없이 바로 조인)
+    existing_file.latest_version_id = new_version.id
+    db.add(existing_file)
+    db.commit()
+    db.refresh(new_version)
+
+    response_data = FileSchema(
+        id=existing_file.id,
+        project_id=existing_file.project_id,
+        filename=existing_file.filename,
+        owner_id=existing_file.owner_id,
+        created_at=existing_file.created_at,
+        latest_version=FileVersionResponse(
+            id=new_version.id,
+            version=new_version.version,
+            file_size=new_version.file_size,
+            created_at=new_version.created_at,
+            uploader_id=new_version.uploader_id
+        )
+    )
+    return response_data, current_version_num
+
 
 # =================================================================
 # 📥 1. 파일 다운로드 (특정 버전) - [복구됨]
 # =================================================================
-@router.get("/files/download/{version_id}")
+@router.api_route("/files/download/{version_id}", methods=["GET", "HEAD"])
 @vectorize(search_description="Download file version", capture_return_value=False)
-def download_file_version(version_id: int, db: Session = Depends(get_db)):
+def download_file_version(
+        version_id: int,
+        request: Request,
+        inline: bool = False,  # True면 브라우저에서 바로 재생/미리보기 (동영상 탐색 등)
+        db: Session = Depends(get_db)
+):
     # 1. 버전 정보 조회
     version = db.get(FileVersion, version_id)
     if not version:
@@ -42,14 +131,16 @@ def download_file_version(version_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="파일 정보를 찾을 수 없습니다.")
 
     # 3. 실제 파일 존재 여부 확인
-    if not os.path.exists(version.saved_path):
+    if not storage.exists(storage.normalize_key(version.saved_path)):
         raise HTTPException(status_code=404, detail="서버에 실제 파일이 존재하지 않습니다.")
 
     # 4. 다운로드 제공 (파일명: v1_원래이름.ext)
-    return FileResponse(
-        path=version.saved_path,
+    #    ETag/Last-Modified 조건부 요청(304)과 Range 요청(206)을 함께 처리합니다.
+    return version_file_response(
+        request,
+        version,
         filename=f"v{version.version}_{file_meta.filename}",
-        media_type="application/octet-stream"
+        inline=inline
     )
 
 # =================================================================
@@ -75,6 +166,29 @@ def get_file_history(
 
     return versions
 
+# =================================================================
+# 🖼️ 파일 버전 썸네일 (이미지 파일만)
+# =================================================================
+@router.get("/files/versions/{version_id}/thumbnail")
+def get_file_version_thumbnail(
+        version_id: int,
+        size: str = "md",
+        db: Session = Depends(get_db)
+):
+    if size not in thumbnails.THUMBNAIL_SIZES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 사이즈입니다. ({', '.join(thumbnails.THUMBNAIL_SIZES)})")
+
+    version = db.get(FileVersion, version_id)
+    if not version or not thumbnails.is_image_path(version.saved_path):
+        raise HTTPException(status_code=404, detail="미리보기를 제공하지 않는 파일입니다.")
+
+    # 썸네일이 아직 없거나 원본이 작으면 원본을 그대로 사용
+    key = thumbnails.resolve_variant(storage.normalize_key(version.saved_path), size)
+    if not key:
+        raise HTTPException(status_code=404, detail="서버에 실제 파일이 존재하지 않습니다.")
+
+    return stored_object_response(key, headers={"cache-control": "private, max-age=86400"})
+
 # =================================================================
 # 📤 3. 파일 업로드 API (단건 & 배치)
 # =================================================================
@@ -93,73 +207,12 @@ async def upload_file(
 
     user = db.get(User, user_id)
 
-    file_ext = os.path.splitext(file.filename)[1]
-    saved_filename = f"{uuid.uuid4()}{file_ext}"
-    saved_path = os.path.join(UPLOAD_DIR, saved_filename)
-
-    with open(saved_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    file_size = os.path.getsize(saved_path)
+    saved_path = _new_file_key(file.filename)
+    file_size = await run_in_threadpool(storage.put, saved_path, file.file, file.content_type)
+    thumbnails.schedule_thumbnails(saved_path)
 
-    existing_file = db.exec(
-        select(FileMetadata)
-        .where(FileMetadata.project_id == project_id)
-        .where(FileMetadata.filename == file.filename)
-    ).first()
-
-    current_version_num = 1
-    target_file_id = None
-
-    if existing_file:
-        last_version = db.exec(
-            select(FileVersion)
-            .where(FileVersion.file_id == existing_file.id)
-            .order_by(desc(FileVersion.version))
-        ).first()
-
-        if last_version:
-            current_version_num = last_version.version + 1
-
-        target_file_id = existing_file.id
-        existing_file.updated_at = datetime.now()
-        db.add(existing_file)
-    else:
-        new_file = FileMetadata(
-            project_id=project_id,
-            filename=file.filename,
-            owner_id=user_id
-        )
-        db.add(new_file)
-        db.commit()
-        db.refresh(new_file)
-        target_file_id = new_file.id
-        existing_file = new_file
-
-    new_version = FileVersion(
-        file_id=target_file_id,
-        version=current_version_num,
-        saved_path=saved_path,
-        file_size=file_size,
-        uploader_id=user_id
-    )
-    db.add(new_version)
-    db.commit()
-    db.refresh(new_version)
-
-    response_data = FileSchema(
-        id=existing_file.id,
-        project_id=existing_file.project_id,
-        filename=existing_file.filename,
-        owner_id=existing_file.owner_id,
-        created_at=existing_file.created_at,
-        latest_version=FileVersionResponse(
-            id=new_version.id,
-            version=new_version.version,
-            file_size=new_version.file_size,
-            created_at=new_version.created_at,
-            uploader_id=new_version.uploader_id
-        )
+    response_data, current_version_num = register_file_version(
+        db, project_id, file.filename, saved_path, file_size, user_id
     )
 
     action_msg = "업로드" if current_version_num == 1 else f"새 버전(v{current_version_num}) 업데이트"
@@ -177,6 +230,20 @@ async def upload_file(
 
     return response_data
 
+# 배치 업로드 시 동시에 저장소에 쓰는 파일 수 (너무 크면 디스크/네트워크 I/O 경합)
+BATCH_WRITE_CONCURRENCY = 8
+
+
+def _save_upload_to_storage(file: UploadFile):
+    saved_path = _new_file_key(file.filename)
+    try:
+        return saved_path, storage.put(saved_path, file.file, file.content_type)
+    except Exception:
+        # 쓰다 만 파일이 남지 않도록
+        storage.delete(saved_path)
+        raise
+
+
 @router.post("/projects/{project_id}/files/batch", response_model=List[FileSchema])
 @vectorize(search_description="Batch upload files", capture_return_value=True)
 async def upload_files_batch(
@@ -190,87 +257,105 @@ async def upload_files_batch(
         raise HTTPException(status_code=404, detail="Project not found")
 
     user = db.get(User, user_id)
-    results = []
-
-    for file in files:
-        file_ext = os.path.splitext(file.filename)[1]
-        saved_filename = f"{uuid.uuid4()}{file_ext}"
-        saved_path = os.path.join(UPLOAD_DIR, saved_filename)
-
-        with open(saved_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-
-        file_size = os.path.getsize(saved_path)
-
-        existing_file = db.exec(
-            select(FileMetadata)
-            .where(FileMetadata.project_id == project_id)
-            .where(FileMetadata.filename == file.filename)
-        ).first()
-
-        current_version_num = 1
-        target_file_id = None
-
-        if existing_file:
-            last_version = db.exec(
-                select(FileVersion)
-                .where(FileVersion.file_id == existing_file.id)
-                .order_by(desc(FileVersion.version))
-            ).first()
-            if last_version:
-                current_version_num = last_version.version + 1
-            target_file_id = existing_file.id
-            existing_file.updated_at = datetime.now()
-            db.add(existing_file)
-        else:
-            new_file = FileMetadata(
-                project_id=project_id,
-                filename=file.filename,
-                owner_id=user_id
+
+    # 1. 디스크 쓰기는 병렬로 (동시 실행 수 제한)
+    #    → 전체 소요 시간이 '파일별 시간의 합'이 아니라 '가장 느린 파일' 수준이 됩니다.
+    semaphore = asyncio.Semaphore(BATCH_WRITE_CONCURRENCY)
+
+    async def save(file: UploadFile):
+        async with semaphore:
+            return await run_in_threadpool(_save_upload_to_storage, file)
+
+    results = await asyncio.gather(*(save(f) for f in files), return_exceptions=True)
+    saved = [r for r in results if not isinstance(r, BaseException)]
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        # 하나라도 실패하면 이미 저장한 파일은 DB에 등록되지 않으므로 정리
+        for saved_path, _ in saved:
+            await run_in_threadpool(storage.delete, saved_path)
+        raise errors[0]
+
+    try:
+        # 2. 같은 이름의 기존 파일을 한 번에 조회 (최신 버전은 selectin으로 함께 로드)
+        filenames = {f.filename for f in files}
+        existing_files = {
+            f.filename: f for f in db.exec(
+                select(FileMetadata)
+                .where(FileMetadata.project_id == project_id)
+                .where(FileMetadata.filename.in_(filenames))
+            ).all()
+        }
+        next_version = {
+            name: (f.latest_version.version + 1 if f.latest_version else 1)
+            for name, f in existing_files.items()
+        }
+
+        # 3. 새 파일 메타데이터 생성 (한 번의 flush로 INSERT)
+        for name in filenames - existing_files.keys():
+            existing_files[name] = FileMetadata(project_id=project_id, filename=name, owner_id=user_id)
+            next_version[name] = 1
+        db.add_all(existing_files.values())
+        db.flush()
+
+        # 4. 버전 생성 (같은 배치 안에 같은 이름이 여러 번 있으면 순서대로 v+1)
+        new_versions = []
+        for file, (saved_path, file_size) in zip(files, saved):
+            file_meta = existing_files[file.filename]
+            version = FileVersion(
+                file_id=file_meta.id,
+                version=next_version[file.filename],
+                saved_path=saved_path,
+                file_size=file_size,
+                uploader_id=user_id
             )
-            db.add(new_file)
-            db.commit()
-            db.refresh(new_file)
-            target_file_id = new_file.id
-            existing_file = new_file
-
-        new_version = FileVersion(
-            file_id=target_file_id,
-            version=current_version_num,
-            saved_path=saved_path,
-            file_size=file_size,
-            uploader_id=user_id
+            next_version[file.filename] += 1
+            new_versions.append((file_meta, version))
+
+        db.add_all([v for _, v in new_versions])
+        db.flush()
+
+        now = datetime.now()
+        for file_meta, version in new_versions:
+            file_meta.latest_version_id = version.id
+            file_meta.updated_at = now
+
+        results = [
+            FileSchema(
+                id=file_meta.id,
+                project_id=file_meta.project_id,
+                filename=file_meta.filename,
+                owner_id=file_meta.owner_id,
+                created_at=file_meta.created_at,
+                latest_version=FileVersionResponse(
+                    id=version.id,
+                    version=version.version,
+                    file_size=version.file_size,
+                    created_at=version.created_at,
+                    uploader_id=version.uploader_id
+                )
+            ) for file_meta, version in new_versions
+        ]
+
+        # 5. 활동 로그는 배치 전체에 대해 한 줄로 요약
+        names = [f.filename for f in files]
+        summary = ", ".join(names[:3]) + (f" 외 {len(names) - 3}개" if len(names) > 3 else "")
+        log_activity(
+            db=db, user_id=user_id, workspace_id=project.workspace_id, action_type="UPLOAD",
+            content=f"💾 '{user.name}'님이 파일 {len(names)}개를 업로드했습니다. ({summary})",
+            commit=False
         )
-        db.add(new_version)
+
+        # 6. 메타데이터/버전/로그를 하나의 트랜잭션으로 커밋
         db.commit()
-        db.refresh(new_version)
-
-        results.append(FileSchema(
-            id=existing_file.id,
-            project_id=existing_file.project_id,
-            filename=existing_file.filename,
-            owner_id=existing_file.owner_id,
-            created_at=existing_file.created_at,
-            latest_version=FileVersionResponse(
-                id=new_version.id,
-                version=new_version.version,
-                file_size=new_version.file_size,
-                created_at=new_version.created_at,
-                uploader_id=new_version.uploader_id
-            )
-        ))
+    except Exception:
+        db.rollback()
+        # DB에 등록되지 못한 파일은 저장소에서도 정리
+        for saved_path, _ in saved:
+            storage.delete(saved_path)
+        raise
 
-        try:
-            action_msg = "업로드" if current_version_num == 1 else f"새 버전(v{current_version_num}) 업데이트"
-            log_activity(
-                db=db,
-                user_id=user_id,
-                workspace_id=project.workspace_id,
-                action_type="UPLOAD",
-                content=f"💾 '{user.name}'님이 파일 '{file.filename}'을(를) {action_msg}했습니다."
-            )
-        except Exception:
-            pass
+    for saved_path, _ in saved:
+        thumbnails.schedule_thumbnails(saved_path)
 
     # 🔥 [SSE] 배치 알림 (jsonable_encoder 사용)
     if results:
@@ -283,39 +368,183 @@ async def upload_files_batch(
     return results
 
 
+# =================================================================
+# ⏯️ 4. 이어 올리기 (Resumable Upload)
+# 세션 생성 → 청크 PUT (Content-Range) → 완료(complete) 순서로 진행합니다.
+# 연결이 끊기면 GET으로 offset을 확인한 뒤 그 위치부터 다시 보내면 됩니다.
+# =================================================================
+
+def _session_response(session: upload_session.UploadSession) -> ResumableUploadResponse:
+    return ResumableUploadResponse(
+        upload_id=session.upload_id,
+        project_id=session.project_id,
+        filename=session.filename,
+        total_size=session.total_size,
+        offset=session.offset,
+        expires_at=datetime.fromisoformat(session.expires_at)
+    )
+
+
+def _get_owned_session(upload_id: str, user_id: int) -> upload_session.UploadSession:
+    session = upload_session.load_session(upload_id)
+    if not session or session.is_expired():
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없거나 만료되었습니다.")
+    if session.user_id != user_id:
+        raise HTTPException(status_code=403, detail="본인이 시작한 업로드만 이어서 진행할 수 있습니다.")
+    return session
+
+
+@router.post("/projects/{project_id}/files/uploads", response_model=ResumableUploadResponse)
+@vectorize(search_description="Start resumable file upload", capture_return_value=True)
+def create_upload_session(
+        project_id: int,
+        data: ResumableUploadCreate,
+        user_id: int = Depends(get_current_user_id),
+        db: Session = Depends(get_db)
+):
+    project = db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    filename = os.path.basename(data.filename)
+    if not filename:
+        raise HTTPException(status_code=400, detail="파일명이 올바르지 않습니다.")
+
+    session = upload_session.create_session(project_id, user_id, filename, data.total_size)
+    return _session_response(session)
+
+
+@router.get("/files/uploads/{upload_id}", response_model=ResumableUploadResponse)
+def get_upload_session(
+        upload_id: str,
+        user_id: int = Depends(get_current_user_id)
+):
+    """현재까지 받은 offset 조회 (재연결 후 이어 보낼 위치 확인용)"""
+    return _session_response(_get_owned_session(upload_id, user_id))
+
+
+@router.put("/files/uploads/{upload_id}", response_model=ResumableUploadResponse)
+async def upload_chunk(
+        upload_id: str,
+        request: Request,
+        content_range: str = Header(None),
+        user_id: int = Depends(get_current_user_id)
+):
+    session = _get_owned_session(upload_id, user_id)
+
+    try:
+        byte_range = upload_session.parse_content_range(content_range, session.total_size)
+        start, end = byte_range if byte_range else (session.offset, None)
+
+        # 파일 쓰기/fsync는 블로킹이므로 스레드풀에서 (이벤트 루프를 막지 않도록)
+        writer = upload_session.ChunkWriter(session, start, end)
+        await run_in_threadpool(writer.open)
+        try:
+            async for chunk in request.stream():
+                await run_in_threadpool(writer.write, chunk)
+            writer.finish()
+        except UploadSessionError:
+            await run_in_threadpool(writer.abort)
+            raise
+        finally:
+            await run_in_threadpool(writer.close)
+    except UploadSessionError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    return _session_response(session)
+
+
+@router.post("/files/uploads/{upload_id}/complete", response_model=FileSchema)
+@vectorize(search_description="Complete resumable file upload", capture_return_value=True)
+async def complete_upload_session(
+        upload_id: str,
+        user_id: int = Depends(get_current_user_id),
+        db: Session = Depends(get_db)
+):
+    session = _get_owned_session(upload_id, user_id)
+
+    if not session.is_complete:
+        raise HTTPException(
+            status_code=409,
+            detail=f"아직 업로드가 끝나지 않았습니다. ({session.offset}/{session.total_size} bytes)"
+        )
+
+    project = db.get(Project, session.project_id)
+    if not project:
+        upload_session.delete_session(session)
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    user = db.get(User, user_id)
+
+    # 조립이 끝난 .part 파일을 저장소로 이동 (S3면 멀티파트 업로드로 전송)
+    saved_path = _new_file_key(session.filename)
+    try:
+        await run_in_threadpool(
+            upload_session.finalize_part, session, lambda part_path: storage.put_file(saved_path, part_path)
+        )
+    except UploadSessionError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    thumbnails.schedule_thumbnails(saved_path)
+
+    response_data, current_version_num = register_file_version(
+        db, session.project_id, session.filename, saved_path, session.total_size, user_id
+    )
+
+    action_msg = "업로드" if current_version_num == 1 else f"새 버전(v{current_version_num}) 업데이트"
+    log_activity(
+        db=db, user_id=user_id, workspace_id=project.workspace_id, action_type="UPLOAD",
+        content=f"💾 '{user.name}'님이 파일 '{session.filename}'을(를) {action_msg}했습니다."
+    )
+
+    await board_event_manager.broadcast(session.project_id, {
+        "type": "FILE_UPLOADED",
+        "user_id": user_id,
+        "data": jsonable_encoder(response_data)
+    })
+
+    return response_data
+
+
+@router.delete("/files/uploads/{upload_id}")
+def cancel_upload_session(
+        upload_id: str,
+        user_id: int = Depends(get_current_user_id)
+):
+    session = _get_owned_session(upload_id, user_id)
+    upload_session.delete_session(session)
+    return {"message": "업로드가 취소되었습니다."}
+
+
 @router.get("/projects/{project_id}/files", response_model=List[FileSchema])
 @vectorize(search_description="List project files", capture_return_value=True)
 def get_project_files(
         project_id: int,
         db: Session = Depends(get_db)
 ):
-    files = db.exec(select(FileMetadata).where(FileMetadata.project_id == project_id)).all()
-
-    results = []
-    for f in files:
-        latest_v = db.exec(
-            select(FileVersion)
-            .where(FileVersion.file_id == f.id)
-            .order_by(desc(FileVersion.version))
-        ).first()
-
-        if latest_v:
-            results.append(FileSchema(
-                id=f.id,
-                project_id=f.project_id,
-                filename=f.filename,
-                owner_id=f.owner_id,
-                created_at=f.created_at,
-                latest_version=FileVersionResponse(
-                    id=latest_v.id,
-                    version=latest_v.version,
-                    file_size=latest_v.file_size,
-                    created_at=latest_v.created_at,
-                    uploader_id=latest_v.uploader_id
-                )
-            ))
+    # 최신 버전을 함께 조인해서 한 번의 쿼리로 조회 (파일별 추가 쿼리 없음)
+    files = db.exec(
+        select(FileMetadata)
+        .join(FileMetadata.latest_version)
+        .where(FileMetadata.project_id == project_id)
+        .options(contains_eager(FileMetadata.latest_version))
+    ).all()
 
-    return results
+    return [
+        FileSchema(
+            id=f.id,
+            project_id=f.project_id,
+            filename=f.filename,
+            owner_id=f.owner_id,
+            created_at=f.created_at,
+            latest_version=FileVersionResponse(
+                id=f.latest_version.id,
+                version=f.latest_version.version,
+                file_size=f.latest_version.file_size,
+                created_at=f.latest_version.created_at,
+                uploader_id=f.latest_version.uploader_id
+            )
+        ) for f in files
+    ]
 
 @router.delete("/files/{file_id}")
 @vectorize(search_description="Delete file", capture_return_value=True)
@@ -335,11 +564,12 @@ async def delete_file(
     # 1. 버전 정보(자식) 먼저 삭제
     versions = db.exec(select(FileVersion).where(FileVersion.file_id == file_id)).all()
     for v in versions:
-        if os.path.exists(v.saved_path):
-            try:
-                os.remove(v.saved_path)
-            except OSError:
-                pass
+        key = storage.normalize_key(v.saved_path)
+        try:
+            storage.delete(key)
+        except Exception as e:
+            print(f"⚠️ 파일 삭제 실패 ({key}): {e}")
+        thumbnails.remove_thumbnails(key)
         db.delete(v)
 
     # 2. 메타데이터(부모) 삭제
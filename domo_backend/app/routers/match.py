@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Cookie
+from fastapi import (
+    APIRouter, Depends, HTTPException, Query, Cookie, Response, Request, WebSocket, WebSocketDisconnect, BackgroundTasks
+)
 from sqlmodel import Session, select
+from sqlalchemy import func, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 from typing import Optional, List
 from datetime import datetime, timedelta
+import os
 import secrets
 
 from app.database import get_db
@@ -10,14 +17,24 @@ from app.models.session import UserSession
 from app.models.workspace import Workspace, WorkspaceMember
 from app.models.invitation import Invitation
 from app.models.match import (
-    Recruitment, Application, Seminar, TechStack, PositionSlot,
+    Recruitment, Application, Seminar, SeminarParticipant, TechStack, PositionSlot,
     RecruitmentTechStack, RecruitmentStatus, ApplicationStatus,
     RecruitmentCategory, JeonbukRegion, RecruitmentPosition
 )
+from app.services.recruitment_search import (
+    paginate_recruitments, position_filter, tech_stack_filter, split_values, RecruitmentQueryError
+)
+from app.services.view_counter import view_counter
+from app.services import recommendation
+from app.services.tech_stacks import tech_stack_cache, TechStackError
+from app.services.workspace_templates import apply_template, resolve_template, TemplateError
+from app.utils.email import send_workspace_welcome_email
+from app.utils.logger import log_activity
+from app.utils.connection_manager import match_event_manager
 from app.schemas import (
-    RecruitmentCreate, RecruitmentUpdate, RecruitmentResponse, RecruitmentStatusUpdate,
+    RecruitmentCreate, RecruitmentUpdate, RecruitmentResponse, RecruitmentStatusUpdate, RecommendedRecruitmentResponse,
     ApplicationCreate, ApplicationResponse, ApplicationStatusUpdate,
-    SeminarCreate, SeminarResponse, TechStackResponse, PositionSlotResponse, UserBrief
+    SeminarCreate, SeminarResponse, TechStackResponse, PositionSlotResponse, UserBrief, WorkspaceBootstrapRequest
 )
 
 router = APIRouter(prefix="/match", tags=["Match"])
@@ -48,9 +65,30 @@ def get_current_user_id(session_id: str = Cookie(None), db: Session = Depends(ge
 # 헬퍼 함수
 # ============================================
 
-def recruitment_to_response(recruitment: Recruitment, db: Session) -> dict:
-    """Recruitment 모델을 응답 형식으로 변환"""
-    user = db.get(User, recruitment.user_id)
+# 목록 조회 시 작성자/기술 스택/포지션을 관계별 IN 쿼리 한 번씩으로 미리 로드 (N+1 방지)
+RECRUITMENT_LOAD_OPTIONS = (
+    selectinload(Recruitment.user),
+    selectinload(Recruitment.tech_stacks),
+    selectinload(Recruitment.position_slots),
+)
+APPLICATION_LOAD_OPTIONS = (selectinload(Application.user),)
+SEMINAR_LOAD_OPTIONS = (selectinload(Seminar.user),)
+
+
+def user_brief(user: Optional[User]) -> Optional[dict]:
+    if not user:
+        return None
+    return {
+        "id": user.id,
+        "email": user.email,
+        "name": user.name,
+        "profile_image": user.profile_image
+    }
+
+
+def recruitment_to_response(recruitment: Recruitment) -> dict:
+    """Recruitment 모델을 응답 형식으로 변환 (관계는 RECRUITMENT_LOAD_OPTIONS로 미리 로드)"""
+    user = recruitment.user
     return {
         "id": recruitment.id,
         "user_id": recruitment.user_id,
@@ -74,9 +112,9 @@ def recruitment_to_response(recruitment: Recruitment, db: Session) -> dict:
     }
 
 
-def application_to_response(application: Application, db: Session) -> dict:
-    """Application 모델을 응답 형식으로 변환"""
-    user = db.get(User, application.user_id)
+def application_to_response(application: Application) -> dict:
+    """Application 모델을 응답 형식으로 변환 (지원자는 APPLICATION_LOAD_OPTIONS로 미리 로드)"""
+    user = application.user
     return {
         "id": application.id,
         "recruitment_id": application.recruitment_id,
@@ -88,12 +126,26 @@ def application_to_response(application: Application, db: Session) -> dict:
         "created_at": application.created_at,
         "updated_at": application.updated_at,
         "user_name": user.name if user else None,
-        "user": {
-            "id": user.id,
-            "email": user.email,
-            "name": user.name,
-            "profile_image": user.profile_image
-        } if user else None
+        "user": user_brief(user)
+    }
+
+
+def seminar_to_response(seminar: Seminar) -> dict:
+    """Seminar 모델을 응답 형식으로 변환 (작성자는 SEMINAR_LOAD_OPTIONS로 미리 로드)"""
+    return {
+        "id": seminar.id,
+        "user_id": seminar.user_id,
+        "title": seminar.title,
+        "description": seminar.description,
+        "region": seminar.region,
+        "date": seminar.date,
+        "time": seminar.time,
+        "location": seminar.location,
+        "max_participants": seminar.max_participants,
+        "current_participants": seminar.current_participants,
+        "tech_stacks": seminar.tech_stacks_json,
+        "created_at": seminar.created_at,
+        "user": user_brief(seminar.user)
     }
 
 
@@ -101,20 +153,41 @@ def application_to_response(application: Application, db: Session) -> dict:
 # 모집 공고 API
 # ============================================
 
+@router.websocket("/ws")
+async def match_events_endpoint(websocket: WebSocket):
+    """모집 상태 변경 등 매칭 페이지 실시간 이벤트 수신"""
+    await match_event_manager.connect(websocket)
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        match_event_manager.disconnect(websocket)
+
+
 @router.get("/recruitments", response_model=List[RecruitmentResponse])
 def get_recruitments(
+    response: Response,
     region: Optional[str] = None,
     category: Optional[str] = None,
     position: Optional[str] = None,
     status: Optional[str] = None,
     tech_stack: Optional[str] = None,
+    position_match: str = "any",
+    tech_stack_match: str = "any",
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """모집 공고 목록 조회"""
-    query = select(Recruitment)
+    """
+    모집 공고 목록 조회
+    - position / tech_stack은 콤마로 여러 개 지정 (예: tech_stack=React,TypeScript)
+      *_match=any(하나라도 포함, 기본) / all(모두 포함)
+    - search가 있으면 관련도순, 없으면 최신순
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 내려줌 (page 대신 cursor 사용 권장)
+    """
+    query = select(Recruitment).options(*RECRUITMENT_LOAD_OPTIONS)
 
     # 필터링
     if region and region != "all":
@@ -123,20 +196,28 @@ def get_recruitments(
         query = query.where(Recruitment.category == category)
     if status:
         query = query.where(Recruitment.status == status)
-    if search:
-        query = query.where(
-            (Recruitment.title.ilike(f"%{search}%")) |
-            (Recruitment.description.ilike(f"%{search}%"))
-        )
 
-    # 정렬 (최신순)
-    query = query.order_by(Recruitment.created_at.desc())
+    # 포지션 / 기술 스택 / 검색 / 정렬 / 페이징
+    try:
+        positions = split_values(position)
+        if positions:
+            query = query.where(position_filter(positions, position_match))
+        tech_stacks = split_values(tech_stack)
+        if tech_stacks:
+            query = query.where(tech_stack_filter(tech_stacks, tech_stack_match))
+
+        recruitments, next_cursor = paginate_recruitments(
+            db, query, search, limit,
+            cursor=cursor,
+            offset=(page - 1) * limit
+        )
+    except RecruitmentQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # 페이징
-    offset = (page - 1) * limit
-    recruitments = db.exec(query.offset(offset).limit(limit)).all()
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
-    return [recruitment_to_response(r, db) for r in recruitments]
+    return [recruitment_to_response(r) for r in recruitments]
 
 
 @router.get("/recruitments/me", response_model=List[RecruitmentResponse])
@@ -147,16 +228,49 @@ def get_my_recruitments(
     """내 모집 공고 목록 조회"""
     recruitments = db.exec(
         select(Recruitment)
+        .options(*RECRUITMENT_LOAD_OPTIONS)
         .where(Recruitment.user_id == user_id)
         .order_by(Recruitment.created_at.desc())
     ).all()
 
-    return [recruitment_to_response(r, db) for r in recruitments]
+    return [recruitment_to_response(r) for r in recruitments]
+
+
+@router.get("/recommendations", response_model=List[RecommendedRecruitmentResponse])
+def get_recommendations(
+    limit: int = Query(20, ge=1, le=recommendation.CACHE_TOP_N),
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    맞춤 모집 공고 추천
+    지난 지원 이력의 기술 스택/포지션과 모집 중인 포지션의 유사도 + 지역 + 최신순으로 정렬
+    (지원 이력이 없으면 최신 공고 위주)
+    """
+    ranked = recommendation.recommend(db, user_id, limit)
+    if not ranked:
+        return []
+
+    recruitments = db.exec(
+        select(Recruitment)
+        .options(*RECRUITMENT_LOAD_OPTIONS)
+        .where(Recruitment.id.in_([rid for rid, _ in ranked]))
+    ).all()
+    by_id = {r.id: r for r in recruitments}
+
+    # 캐시된 뒤 삭제된 공고는 건너뜀
+    return [
+        {**recruitment_to_response(by_id[rid]), "score": score}
+        for rid, score in ranked
+        if rid in by_id
+    ]
 
 
 @router.get("/recruitments/{recruitment_id}", response_model=RecruitmentResponse)
 def get_recruitment(
     recruitment_id: int,
+    request: Request,
+    session_id: str = Cookie(None),
     db: Session = Depends(get_db)
 ):
     """모집 공고 상세 조회"""
@@ -165,13 +279,13 @@ def get_recruitment(
     if not recruitment:
         raise HTTPException(status_code=404, detail="모집글을 찾을 수 없습니다.")
 
-    # 조회수 증가
-    recruitment.view_count += 1
-    db.add(recruitment)
-    db.commit()
-    db.refresh(recruitment)
+    # 조회수 증가 (메모리에 모았다가 주기적으로 DB 반영 — 조회 요청이 행을 잠그지 않음)
+    viewer_key = session_id or (request.client.host if request.client else None)
+    view_counter.record(recruitment_id, viewer_key)
 
-    return recruitment_to_response(recruitment, db)
+    response = recruitment_to_response(recruitment)
+    response["view_count"] += view_counter.pending(recruitment_id)
+    return response
 
 
 @router.post("/recruitments", response_model=RecruitmentResponse)
@@ -181,15 +295,11 @@ def create_recruitment(
     db: Session = Depends(get_db)
 ):
     """모집 공고 생성"""
-    # 기술 스택 처리 (없으면 생성)
-    tech_stacks = []
-    for stack_name in data.tech_stacks:
-        stack = db.exec(select(TechStack).where(TechStack.name == stack_name)).first()
-        if not stack:
-            stack = TechStack(name=stack_name)
-            db.add(stack)
-            db.flush()
-        tech_stacks.append(stack)
+    # 기술 스택 처리 (캐시에서 id 확인, 없는 이름만 한 번에 생성)
+    try:
+        tech_stack_ids, created_stacks = tech_stack_cache.resolve(db, data.tech_stacks)
+    except TechStackError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # 모집 공고 생성
     recruitment = Recruitment(
@@ -205,10 +315,14 @@ def create_recruitment(
         reference_url=data.reference_url,
         status=RecruitmentStatus.recruiting
     )
-    recruitment.tech_stacks = tech_stacks
     db.add(recruitment)
     db.flush()
 
+    if tech_stack_ids:
+        db.execute(insert(RecruitmentTechStack).values([
+            {"recruitment_id": recruitment.id, "tech_stack_id": stack_id} for stack_id in tech_stack_ids
+        ]))
+
     # 포지션 슬롯 생성
     for slot_data in data.position_slots:
         slot = PositionSlot(
@@ -220,9 +334,11 @@ def create_recruitment(
         db.add(slot)
 
     db.commit()
+    tech_stack_cache.add(created_stacks)
+    recommendation.invalidate_recruitments()
     db.refresh(recruitment)
 
-    return recruitment_to_response(recruitment, db)
+    return recruitment_to_response(recruitment)
 
 
 @router.put("/recruitments/{recruitment_id}", response_model=RecruitmentResponse)
@@ -250,9 +366,10 @@ def update_recruitment(
     recruitment.updated_at = datetime.now()
     db.add(recruitment)
     db.commit()
+    recommendation.invalidate_recruitments()
     db.refresh(recruitment)
 
-    return recruitment_to_response(recruitment, db)
+    return recruitment_to_response(recruitment)
 
 
 @router.delete("/recruitments/{recruitment_id}", status_code=204)
@@ -272,6 +389,7 @@ def delete_recruitment(
 
     db.delete(recruitment)
     db.commit()
+    recommendation.invalidate_recruitments()
 
 
 @router.patch("/recruitments/{recruitment_id}/status", response_model=RecruitmentResponse)
@@ -294,18 +412,25 @@ def update_recruitment_status(
     recruitment.updated_at = datetime.now()
     db.add(recruitment)
     db.commit()
+    recommendation.invalidate_recruitments()
     db.refresh(recruitment)
 
-    return recruitment_to_response(recruitment, db)
+    return recruitment_to_response(recruitment)
 
 
 @router.post("/recruitments/{recruitment_id}/create-workspace")
 def create_workspace_from_recruitment(
     recruitment_id: int,
+    background_tasks: BackgroundTasks,
+    data: Optional[WorkspaceBootstrapRequest] = None,
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
-    """워크스페이스 생성 및 연동"""
+    """
+    워크스페이스 생성 및 연동
+    워크스페이스 / 멤버 전체 / 템플릿 프로젝트·컬럼 / 초대 링크 / 활동 로그를 한 트랜잭션으로 생성
+    """
+    data = data or WorkspaceBootstrapRequest()
     recruitment = db.get(Recruitment, recruitment_id)
 
     if not recruitment:
@@ -320,6 +445,11 @@ def create_workspace_from_recruitment(
     if recruitment.workspace_id:
         raise HTTPException(status_code=400, detail="이미 워크스페이스가 생성되었습니다.")
 
+    try:
+        template = resolve_template(data.template, recruitment.category)
+    except TemplateError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     # 워크스페이스 생성
     workspace = Workspace(
         name=recruitment.title,
@@ -331,29 +461,23 @@ def create_workspace_from_recruitment(
 
     # 모집 공고에 워크스페이스 연결
     recruitment.workspace_id = workspace.id
+    db.add(recruitment)
 
-    # 생성자를 관리자로 추가
-    owner_member = WorkspaceMember(
-        workspace_id=workspace.id,
-        user_id=user_id,
-        role="admin"
-    )
-    db.add(owner_member)
-
-    # 수락된 지원자들 초대
-    accepted_applications = db.exec(
-        select(Application)
+    # 생성자(관리자) + 수락된 지원자 전원을 INSERT 한 번으로 추가
+    accepted = db.exec(
+        select(Application.user_id, User.email)
+        .join(User, User.id == Application.user_id)
         .where(Application.recruitment_id == recruitment_id)
         .where(Application.status == ApplicationStatus.accepted)
     ).all()
+    members = [{"workspace_id": workspace.id, "user_id": user_id, "role": "admin"}] + [
+        {"workspace_id": workspace.id, "user_id": member_id, "role": "member"}
+        for member_id, _ in accepted if member_id != user_id
+    ]
+    db.execute(pg_insert(WorkspaceMember).values(members).on_conflict_do_nothing())
 
-    for app in accepted_applications:
-        member = WorkspaceMember(
-            workspace_id=workspace.id,
-            user_id=app.user_id,
-            role="member"
-        )
-        db.add(member)
+    # 템플릿 프로젝트/보드 컬럼
+    project_ids = apply_template(db, workspace.id, template) if template else []
 
     # 초대 링크 생성
     invite_token = secrets.token_urlsafe(32)
@@ -366,18 +490,47 @@ def create_workspace_from_recruitment(
     )
     db.add(invitation)
 
+    # 활동 로그 (멤버 수와 관계없이 요약 1건)
+    owner = db.get(User, user_id)
+    log_activity(
+        db=db,
+        user_id=user_id,
+        workspace_id=workspace.id,
+        action_type="CREATE",
+        content=f"🤝 '{owner.name}'님이 모집글 '{recruitment.title}'에서 워크스페이스를 만들고 팀원 {len(members) - 1}명과 함께 시작했습니다.",
+        commit=False
+    )
+
     db.commit()
 
-    import os
     base_url = os.environ.get("FRONTEND_URL", "http://localhost:3000")
     invite_link = f"{base_url}/invite/{invite_token}"
 
+    recipients = [email for member_id, email in accepted if member_id != user_id]
+    if data.notify_members and recipients:
+        background_tasks.add_task(send_workspace_welcome_email, recipients, workspace.name, base_url)
+
     return {
         "workspace_id": workspace.id,
-        "invite_link": invite_link
+        "invite_link": invite_link,
+        "member_count": len(members),
+        "project_ids": project_ids
     }
 
 
+@router.get("/tech-stacks", response_model=List[TechStackResponse])
+def get_tech_stacks(
+    prefix: str = "",
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """기술 스택 자동완성 (접두어, 대소문자 무시)"""
+    return [
+        {"id": entry.id, "name": entry.name, "color": entry.color}
+        for entry in tech_stack_cache.search(db, prefix, limit)
+    ]
+
+
 # ============================================
 # 지원 API
 # ============================================
@@ -399,11 +552,12 @@ def get_applications(
 
     applications = db.exec(
         select(Application)
+        .options(*APPLICATION_LOAD_OPTIONS)
         .where(Application.recruitment_id == recruitment_id)
         .order_by(Application.created_at.desc())
     ).all()
 
-    return [application_to_response(app, db) for app in applications]
+    return [application_to_response(app) for app in applications]
 
 
 @router.post("/recruitments/{recruitment_id}/apply", response_model=ApplicationResponse)
@@ -457,9 +611,10 @@ def create_application(
     )
     db.add(application)
     db.commit()
+    recommendation.invalidate_user(user_id)
     db.refresh(application)
 
-    return application_to_response(application, db)
+    return application_to_response(application)
 
 
 @router.get("/applications/me", response_model=List[ApplicationResponse])
@@ -470,11 +625,12 @@ def get_my_applications(
     """내 지원 목록 조회"""
     applications = db.exec(
         select(Application)
+        .options(*APPLICATION_LOAD_OPTIONS)
         .where(Application.user_id == user_id)
         .order_by(Application.created_at.desc())
     ).all()
 
-    return [application_to_response(app, db) for app in applications]
+    return [application_to_response(app) for app in applications]
 
 
 @router.patch("/applications/{application_id}", response_model=ApplicationResponse)
@@ -496,28 +652,64 @@ def update_application_status(
         raise HTTPException(status_code=403, detail="권한이 없습니다.")
 
     old_status = application.status
-    application.status = data.status
-    application.updated_at = datetime.now()
 
     # 수락 시 filled 증가
+    # 읽고-비교하고-쓰는 대신 조건부 UPDATE 한 번으로 처리 → 동시에 수락해도 정원을 넘기지 않음
     if data.status == ApplicationStatus.accepted and old_status == ApplicationStatus.pending:
-        for slot in recruitment.position_slots:
-            if slot.position == application.position:
-                slot.filled += 1
-                db.add(slot)
-                break
-
-        # 모든 슬롯이 다 채워졌는지 확인
-        all_filled = all(s.filled >= s.total for s in recruitment.position_slots)
-        if all_filled:
+        # 같은 지원서를 동시에 두 번 수락하는 경우 한쪽만 통과
+        claimed = db.exec(
+            update(Application)
+            .where(Application.id == application_id)
+            .where(Application.status == ApplicationStatus.pending)
+            .values(status=ApplicationStatus.accepted, updated_at=datetime.now())
+            .returning(Application.id)
+        ).first()
+        if not claimed:
+            db.rollback()
+            raise HTTPException(status_code=409, detail="이미 처리된 지원서입니다.")
+
+        slot_id = db.exec(
+            update(PositionSlot)
+            .where(PositionSlot.recruitment_id == recruitment.id)
+            .where(PositionSlot.position == application.position)
+            .where(PositionSlot.filled < PositionSlot.total)
+            .values(filled=PositionSlot.filled + 1)
+            .returning(PositionSlot.id)
+        ).first()
+        if not slot_id:
+            # 포지션 슬롯이 아예 없는 지원은 예전처럼 정원 계산 없이 수락
+            has_slot = db.exec(
+                select(PositionSlot.id)
+                .where(PositionSlot.recruitment_id == recruitment.id)
+                .where(PositionSlot.position == application.position)
+            ).first()
+            if has_slot:
+                db.rollback()
+                raise HTTPException(status_code=400, detail="해당 포지션의 정원이 모두 찼습니다.")
+
+        # 모든 슬롯이 다 채워졌는지 확인 (방금 갱신한 값을 DB에서 다시 셈)
+        open_slots = db.exec(
+            select(func.count())
+            .select_from(PositionSlot)
+            .where(PositionSlot.recruitment_id == recruitment.id)
+            .where(PositionSlot.filled < PositionSlot.total)
+        ).one()
+        if open_slots == 0:
             recruitment.status = RecruitmentStatus.closed
             db.add(recruitment)
+    else:
+        application.status = data.status
+        application.updated_at = datetime.now()
+        db.add(application)
 
-    db.add(application)
     db.commit()
     db.refresh(application)
 
-    return application_to_response(application, db)
+    # 충원으로 남은 포지션이 바뀌었으면 추천 인덱스 갱신
+    if application.status == ApplicationStatus.accepted and old_status == ApplicationStatus.pending:
+        recommendation.invalidate_recruitments()
+
+    return application_to_response(application)
 
 
 @router.delete("/applications/{application_id}", status_code=204)
@@ -540,6 +732,7 @@ def cancel_application(
 
     db.delete(application)
     db.commit()
+    recommendation.invalidate_user(user_id)
 
 
 # ============================================
@@ -552,38 +745,14 @@ def get_seminars(
     db: Session = Depends(get_db)
 ):
     """세미나 목록 조회"""
-    query = select(Seminar)
+    query = select(Seminar).options(*SEMINAR_LOAD_OPTIONS)
 
     if region and region != "all":
         query = query.where(Seminar.region == region)
 
     seminars = db.exec(query.order_by(Seminar.date.asc())).all()
 
-    result = []
-    for seminar in seminars:
-        user = db.get(User, seminar.user_id)
-        result.append({
-            "id": seminar.id,
-            "user_id": seminar.user_id,
-            "title": seminar.title,
-            "description": seminar.description,
-            "region": seminar.region,
-            "date": seminar.date,
-            "time": seminar.time,
-            "location": seminar.location,
-            "max_participants": seminar.max_participants,
-            "current_participants": seminar.current_participants,
-            "tech_stacks": seminar.tech_stacks_json,
-            "created_at": seminar.created_at,
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "name": user.name,
-                "profile_image": user.profile_image
-            } if user else None
-        })
-
-    return result
+    return [seminar_to_response(seminar) for seminar in seminars]
 
 
 @router.get("/seminars/{seminar_id}", response_model=SeminarResponse)
@@ -597,27 +766,7 @@ def get_seminar(
     if not seminar:
         raise HTTPException(status_code=404, detail="세미나를 찾을 수 없습니다.")
 
-    user = db.get(User, seminar.user_id)
-    return {
-        "id": seminar.id,
-        "user_id": seminar.user_id,
-        "title": seminar.title,
-        "description": seminar.description,
-        "region": seminar.region,
-        "date": seminar.date,
-        "time": seminar.time,
-        "location": seminar.location,
-        "max_participants": seminar.max_participants,
-        "current_participants": seminar.current_participants,
-        "tech_stacks": seminar.tech_stacks_json,
-        "created_at": seminar.created_at,
-        "user": {
-            "id": user.id,
-            "email": user.email,
-            "name": user.name,
-            "profile_image": user.profile_image
-        } if user else None
-    }
+    return seminar_to_response(seminar)
 
 
 @router.post("/seminars", response_model=SeminarResponse)
@@ -642,27 +791,7 @@ def create_seminar(
     db.commit()
     db.refresh(seminar)
 
-    user = db.get(User, user_id)
-    return {
-        "id": seminar.id,
-        "user_id": seminar.user_id,
-        "title": seminar.title,
-        "description": seminar.description,
-        "region": seminar.region,
-        "date": seminar.date,
-        "time": seminar.time,
-        "location": seminar.location,
-        "max_participants": seminar.max_participants,
-        "current_participants": seminar.current_participants,
-        "tech_stacks": seminar.tech_stacks_json,
-        "created_at": seminar.created_at,
-        "user": {
-            "id": user.id,
-            "email": user.email,
-            "name": user.name,
-            "profile_image": user.profile_image
-        } if user else None
-    }
+    return seminar_to_response(seminar)
 
 
 @router.post("/seminars/{seminar_id}/join", status_code=200)
@@ -677,11 +806,26 @@ def join_seminar(
     if not seminar:
         raise HTTPException(status_code=404, detail="세미나를 찾을 수 없습니다.")
 
-    if seminar.current_participants >= seminar.max_participants:
+    # 1. 참가자 등록 (복합 PK라 같은 사람의 중복 신청은 여기서 막힘)
+    db.add(SeminarParticipant(seminar_id=seminar_id, user_id=user_id))
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="이미 참가 신청한 세미나입니다.")
+
+    # 2. 정원 안에서만 +1 (조건부 UPDATE 한 번이라 동시 신청이 몰려도 초과 예약 없음)
+    joined = db.exec(
+        update(Seminar)
+        .where(Seminar.id == seminar_id)
+        .where(Seminar.current_participants < Seminar.max_participants)
+        .values(current_participants=Seminar.current_participants + 1)
+        .returning(Seminar.current_participants)
+    ).first()
+    if not joined:
+        db.rollback()
         raise HTTPException(status_code=400, detail="참가 인원이 마감되었습니다.")
 
-    seminar.current_participants += 1
-    db.add(seminar)
     db.commit()
 
     return {"message": "참가 신청이 완료되었습니다."}
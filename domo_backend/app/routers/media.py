@@ -0,0 +1,42 @@
+# app/routers/media.py
+
+from fastapi import APIRouter, HTTPException
+
+from app.services.storage import storage
+from app.services.file_transfer import stored_object_response
+from app.services.thumbnails import THUMBNAIL_SIZES, resolve_variant
+
+router = APIRouter(tags=["Media"])
+
+# 로컬 저장소가 아닐 때 /static/{key} 를 대신 처리하는 라우터 (main.py에서 선택적으로 등록)
+static_router = APIRouter(tags=["Media"])
+
+
+# =================================================================
+# 🖼️ 이미지 사이즈별 썸네일
+# /static/community/abc.png → /api/images/md/community/abc.png
+# 썸네일이 아직 생성되지 않았거나 원본이 충분히 작으면 원본을 그대로 내려줍니다.
+# =================================================================
+@router.get("/images/{size}/{path:path}")
+def get_image_variant(size: str, path: str):
+    if size not in THUMBNAIL_SIZES:
+        raise HTTPException(status_code=404, detail=f"지원하지 않는 사이즈입니다. ({', '.join(THUMBNAIL_SIZES)})")
+
+    resolved = resolve_variant(storage.normalize_key(path), size)
+    if not resolved:
+        raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
+
+    return stored_object_response(resolved, headers={"cache-control": "public, max-age=86400"})
+
+
+# =================================================================
+# 🔗 오브젝트 스토리지용 /static 경로
+# 기존 /static/... URL(프로필, 커뮤니티 이미지)을 presigned URL로 넘겨줍니다.
+# =================================================================
+@static_router.get("/static/{path:path}")
+def get_static_object(path: str):
+    key = storage.normalize_key(path)
+    if not storage.exists(key):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+
+    return stored_object_response(key)
@@ -10,6 +10,7 @@ from app.models.user import User
 from app.schemas import PostCreate, PostUpdate, PostResponse, PostCommentCreate, PostCommentResponse
 from app.utils.logger import log_activity
 from app.models.workspace import Project
+from app.services import unread
 
 router = APIRouter(tags=["Project Board"])
 
@@ -37,6 +38,7 @@ def create_post(
     db.add(new_post)
     db.commit()
     db.refresh(new_post)
+    unread.invalidate_project(project_id)
 
     user = db.get(User, user_id)
     project = db.get(Project, project_id)
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select
-from typing import List
-from datetime import time, datetime, timedelta
+from typing import List, Optional
+from datetime import time, datetime, date, timedelta
 
 from app.database import get_db
 from app.routers.workspace import get_current_user_id
@@ -9,9 +10,11 @@ from app.models.schedule import Schedule, ProjectEvent
 from app.models.workspace import WorkspaceMember
 from app.models.user import User
 from app.schemas import ScheduleCreate, ScheduleResponse, FreeTimeSlot, ProjectEventCreate, ProjectEventResponse, \
-    ProjectEventUpdate, ScheduleUpdate
+    ProjectEventUpdate, ScheduleUpdate, AvailabilityHeatmapResponse, MeetingSuggestionRequest, \
+    MeetingSuggestionResponse
 from app.utils.logger import log_activity
 from app.models.workspace import Project
+from app.services import free_time, availability, recurrence, ics_feed, meeting_suggestions
 from vectorwave import *
 
 router = APIRouter(tags=["Schedule & Free Time"])
@@ -27,6 +30,8 @@ def add_schedule(s_data: ScheduleCreate,
     db.add(new_schedule)
     db.commit()
     db.refresh(new_schedule)
+    free_time.invalidate_user(db, user_id)
+    availability.invalidate_member(user_id)
     user = db.get(User, user_id)
 
     log_activity(
@@ -65,6 +70,8 @@ def delete_personal_schedule(
     # 3. 삭제
     db.delete(schedule)
     db.commit()
+    free_time.invalidate_user(db, user_id)
+    availability.invalidate_member(user_id)
 
     return {"message": "개인 일정이 삭제되었습니다."}
 
@@ -83,66 +90,177 @@ def get_my_schedules(
 
 # 2. 특정 워크스페이스 팀원들의 공통 빈 시간 계산 (핵심!)
 @router.get("/workspaces/{workspace_id}/free-time", response_model=List[FreeTimeSlot])
-def get_common_free_time(workspace_id: int, db: Session = Depends(get_db)):
+def get_common_free_time(
+        workspace_id: int,
+        start: time = Query(time(9, 0), description="탐색 시작 시각"),
+        end: time = Query(time(22, 0), description="탐색 종료 시각"),
+        min_minutes: int = Query(30, ge=1, description="최소 빈 시간 (분)"),
+        days: List[int] = Query([0, 1, 2, 3, 4], description="요일 (0:월 ~ 6:일)"),
+        member_ids: Optional[List[int]] = Query(None, description="일부 멤버만 대상으로 계산"),
+        quorum: Optional[int] = Query(None, ge=1, description="최소 몇 명이 비어 있으면 되는지 (기본: 전원)"),
+        week_of: Optional[date] = Query(None, description="프로젝트 일정을 반영할 주 (기본: 이번 주)"),
+        db: Session = Depends(get_db)
+):
     # 1. 워크스페이스 모든 멤버 ID 조회
     members = db.exec(select(WorkspaceMember.user_id).where(WorkspaceMember.workspace_id == workspace_id)).all()
     if not members:
         raise HTTPException(status_code=404, detail="멤버가 없습니다.")
 
-    # 2. 모든 멤버의 시간표 가져오기
-    all_schedules = db.exec(select(Schedule).where(Schedule.user_id.in_(members))).all()
+    # 2. 조건 검증
+    if start >= end:
+        raise HTTPException(status_code=400, detail="시작 시각은 종료 시각보다 빨라야 합니다.")
+    if any(day < 0 or day > 6 for day in days):
+        raise HTTPException(status_code=400, detail="요일은 0(월)~6(일) 사이여야 합니다.")
+    if member_ids and not set(member_ids) <= set(members):
+        raise HTTPException(status_code=400, detail="워크스페이스 멤버가 아닌 사용자가 포함되어 있습니다.")
+
+    target_count = len(set(member_ids)) if member_ids else len(members)
+    if quorum and quorum > target_count:
+        raise HTTPException(status_code=400, detail=f"quorum은 대상 인원({target_count}명)을 넘을 수 없습니다.")
+
+    # 3. 빈 시간 계산 (워크스페이스 단위 캐시 사용)
+    query = free_time.FreeTimeQuery(
+        window_start=free_time.time_to_minutes(start),
+        window_end=free_time.time_to_minutes(end),
+        min_minutes=min_minutes,
+        days=tuple(sorted(set(days))),
+        member_ids=tuple(sorted(set(member_ids))) if member_ids else None,
+        quorum=quorum,
+        week_start=week_of
+    )
+    slots = free_time.get_workspace_free_slots(db, workspace_id, members, query)
+
+    return [
+        FreeTimeSlot(
+            day_of_week=slot.day_of_week,
+            start_time=slot.start_time,
+            end_time=slot.end_time,
+            available_count=slot.available_count
+        )
+        for slot in slots
+    ]
+
 
-    # 3. 빈 시간 계산 로직 (단순화된 버전)
-    # 09:00 ~ 22:00 사이를 비어있는 시간의 후보로 잡고, 수업 시간을 뺍니다.
-    free_slots = []
+# 2-1. 주간 가용성 히트맵 (칸마다 바쁜 인원 수)
+@router.get("/workspaces/{workspace_id}/availability-heatmap", response_model=AvailabilityHeatmapResponse)
+def get_availability_heatmap(
+        workspace_id: int,
+        slot_minutes: int = Query(15, description="칸 크기 (분)"),
+        week_of: Optional[date] = Query(None, description="프로젝트 일정을 반영할 주 (기본: 이번 주)"),
+        db: Session = Depends(get_db)
+):
+    if slot_minutes not in availability.ALLOWED_SLOT_MINUTES:
+        allowed = ", ".join(map(str, availability.ALLOWED_SLOT_MINUTES))
+        raise HTTPException(status_code=400, detail=f"slot_minutes는 {allowed} 중 하나여야 합니다.")
 
-    for day in range(5):  # 월~금
-        # 해당 요일의 모든 팀원 수업 시간 (시작 시간 순 정렬)
-        day_schedules = sorted(
-            [s for s in all_schedules if s.day_of_week == day],
-            key=lambda x: x.start_time
-        )
+    members = db.exec(select(WorkspaceMember.user_id).where(WorkspaceMember.workspace_id == workspace_id)).all()
+    if not members:
+        raise HTTPException(status_code=404, detail="멤버가 없습니다.")
+
+    return availability.build_heatmap(db, workspace_id, members, slot_minutes, week_of)
 
-        current_time = datetime.combine(datetime.today(), time(9, 0))  # 오전 9시 시작
-        end_limit = datetime.combine(datetime.today(), time(22, 0))  # 오후 10시 종료
 
-        for s in day_schedules:
-            s_start = datetime.combine(datetime.today(), s.start_time)
-            s_end = datetime.combine(datetime.today(), s.end_time)
+# 캘린더 한 번에 조회할 수 있는 최대 구간 (반복 일정 펼침 비용 제한)
+MAX_EVENT_RANGE = timedelta(days=366)
 
-            # 수업 시작 전까지 시간이 비어있다면 추가 (최소 30분 이상인 경우만)
-            if s_start > current_time + timedelta(minutes=30):
-                free_slots.append(FreeTimeSlot(
-                    day_of_week=day,
-                    start_time=current_time.time(),
-                    end_time=s_start.time()
-                ))
 
-            # 현재 시간을 수업 종료 시간으로 갱신 (더 늦은 시간 기준)
-            if s_end > current_time:
-                current_time = s_end
+def _apply_recurrence(event: ProjectEvent):
+    """반복 규칙 정규화/검증 + 구간 조회용 recurrence_until 계산"""
+    if event.end_datetime < event.start_datetime:
+        raise HTTPException(status_code=400, detail="종료 시각은 시작 시각보다 빠를 수 없습니다.")
 
-        # 마지막 수업 이후부터 밤 10시까지 비어있다면 추가
-        if end_limit > current_time + timedelta(minutes=30):
-            free_slots.append(FreeTimeSlot(
-                day_of_week=day,
-                start_time=current_time.time(),
-                end_time=end_limit.time()
-            ))
+    event.recurrence_rule = recurrence.normalize_rule(event.recurrence_rule)
+    try:
+        event.recurrence_until = recurrence.series_end(event) if event.recurrence_rule else None
+    except recurrence.RecurrenceError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return free_slots
+
+# 2-2. 회의 시간 추천 (시간표 + 프로젝트 일정 + 카드 마감일)
+@router.post("/workspaces/{workspace_id}/meeting-suggestions", response_model=List[MeetingSuggestionResponse])
+@vectorize(search_description="Suggest meeting slots for workspace", capture_return_value=True)
+def suggest_meeting_slots(
+        workspace_id: int,
+        request: MeetingSuggestionRequest,
+        user_id: int = Depends(get_current_user_id),
+        db: Session = Depends(get_db)
+):
+    members = db.exec(select(WorkspaceMember.user_id).where(WorkspaceMember.workspace_id == workspace_id)).all()
+    if user_id not in members:
+        raise HTTPException(status_code=403, detail="워크스페이스 멤버만 회의 시간을 추천받을 수 있습니다.")
+
+    if request.window_start >= request.window_end:
+        raise HTTPException(status_code=400, detail="시작 시각은 종료 시각보다 빨라야 합니다.")
+    if request.member_ids and not set(request.member_ids) <= set(members):
+        raise HTTPException(status_code=400, detail="워크스페이스 멤버가 아닌 사용자가 포함되어 있습니다.")
+
+    target_members = sorted(set(request.member_ids)) if request.member_ids else list(members)
+    if request.min_available and request.min_available > len(target_members):
+        raise HTTPException(status_code=400, detail=f"min_available은 대상 인원({len(target_members)}명)을 넘을 수 없습니다.")
+
+    if request.project_id is not None:
+        project = db.get(Project, request.project_id)
+        if not project or project.workspace_id != workspace_id:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+    options = meeting_suggestions.MeetingOptions(
+        duration_minutes=request.duration_minutes,
+        start_date=request.start_date,
+        days_ahead=request.days_ahead,
+        window_start=free_time.time_to_minutes(request.window_start),
+        window_end=free_time.time_to_minutes(request.window_end),
+        min_available=request.min_available,
+        project_id=request.project_id,
+        top_k=request.top_k,
+        step_minutes=request.step_minutes
+    )
+    return meeting_suggestions.suggest_meetings(db, workspace_id, target_members, options)
 
 
 @router.get("/projects/{project_id}/events", response_model=List[ProjectEventResponse])
 @vectorize(search_description="List project calendar events", capture_return_value=True)
 def get_project_events(
         project_id: int,
+        range_from: Optional[datetime] = Query(None, alias="from", description="조회 시작 (포함)"),
+        range_to: Optional[datetime] = Query(None, alias="to", description="조회 끝 (미포함)"),
         db: Session = Depends(get_db),
         user_id: int = Depends(get_current_user_id)
 ):
     # (선택) 여기서 사용자가 프로젝트 멤버인지 체크하는 로직을 추가할 수 있습니다.
-    events = db.exec(select(ProjectEvent).where(ProjectEvent.project_id == project_id)).all()
-    return events
+    query = select(ProjectEvent).where(ProjectEvent.project_id == project_id)
+
+    # 구간 없이 호출하면 기존처럼 등록된 일정(반복 일정은 시리즈 1건) 전체를 반환
+    if range_from is None and range_to is None:
+        return db.exec(query.order_by(ProjectEvent.start_datetime)).all()
+
+    if range_from is None or range_to is None:
+        raise HTTPException(status_code=400, detail="from과 to를 함께 지정해야 합니다.")
+    if range_from >= range_to:
+        raise HTTPException(status_code=400, detail="from은 to보다 빨라야 합니다.")
+    if range_to - range_from > MAX_EVENT_RANGE:
+        raise HTTPException(status_code=400, detail="한 번에 조회할 수 있는 기간은 최대 1년입니다.")
+
+    # (project_id, start_datetime) 인덱스로 후보를 좁힌 뒤, 반복 일정은 구간 안의 회차만 펼침
+    events = db.exec(query.where(recurrence.overlaps_window(range_from, range_to))).all()
+    return recurrence.expand_events(events, range_from, range_to)
+
+
+# 1-1. 캘린더 앱 구독용 ICS 피드 (반복 규칙은 RRULE 그대로 내보내고 클라이언트가 펼침)
+@router.get("/projects/{project_id}/events.ics")
+def export_project_events_ics(
+        project_id: int,
+        db: Session = Depends(get_db),
+        user_id: int = Depends(get_current_user_id)
+):
+    project = db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    return StreamingResponse(
+        ics_feed.stream_project_calendar(project_id, project.name),
+        media_type="text/calendar; charset=utf-8",
+        headers={"content-disposition": f'attachment; filename="project-{project_id}.ics"'}
+    )
 
 
 # 2. 프로젝트 일정 등록
@@ -164,10 +282,12 @@ def create_project_event(
         created_by=user_id,
         **event_data.model_dump()
     )
+    _apply_recurrence(new_event)
 
     db.add(new_event)
     db.commit()
     db.refresh(new_event)
+    free_time.invalidate_workspace(project.workspace_id)
 
     # 활동 로그 기록
     user = db.get(User, user_id)
@@ -204,6 +324,7 @@ def delete_project_event(
 
     db.delete(event)
     db.commit()
+    free_time.invalidate_workspace(project.workspace_id)
 
     return {"message": "일정이 삭제되었습니다."}
 
@@ -235,6 +356,8 @@ def update_personal_schedule(
     db.add(schedule)
     db.commit()
     db.refresh(schedule)
+    free_time.invalidate_user(db, user_id)
+    availability.invalidate_member(user_id)
 
     user = db.get(User, user_id)
     log_activity(
@@ -270,6 +393,9 @@ def update_project_event(
         event.start_datetime = event_data.start_datetime
     if event_data.end_datetime is not None:
         event.end_datetime = event_data.end_datetime
+    if event_data.recurrence_rule is not None:
+        event.recurrence_rule = event_data.recurrence_rule
+    _apply_recurrence(event)
 
     db.add(event)
     db.commit()
@@ -277,6 +403,7 @@ def update_project_event(
 
     user = db.get(User, user_id)
     project = db.get(Project, event.project_id)
+    free_time.invalidate_workspace(project.workspace_id)
     log_activity(
         db=db, user_id=user_id, workspace_id=project.workspace_id, action_type="CALENDAR",
         content=f"✏️ '{user.name}'님이 프로젝트 '{project.name}'의 일정 '{event.title}'을(를) 수정했습니다."
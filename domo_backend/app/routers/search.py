@@ -0,0 +1,50 @@
+# app/routers/search.py
+
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+
+from app.database import get_db
+from app.routers.workspace import get_current_user_id
+from app.models.workspace import Project, WorkspaceMember
+from app.schemas import SearchResponse
+from app.services import search
+from vectorwave import vectorize
+
+router = APIRouter(tags=["Search"])
+
+
+# =================================================================
+# 🔎 프로젝트 통합 검색 (카드 / 게시글 / 댓글 / 채팅 / 파일명)
+# =================================================================
+@router.get("/projects/{project_id}/search", response_model=SearchResponse)
+@vectorize(search_description="Full-text search in project", capture_return_value=True)
+def search_project_content(
+        project_id: int,
+        q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+        types: Optional[List[str]] = Query(None, description="검색 대상 (card, post, post_comment, chat, file)"),
+        limit: int = Query(20, ge=1, le=50),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+        user_id: int = Depends(get_current_user_id),
+        db: Session = Depends(get_db)
+):
+    # 1. 프로젝트 멤버 확인
+    project = db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not db.get(WorkspaceMember, (project.workspace_id, user_id)):
+        raise HTTPException(status_code=403, detail="프로젝트 멤버만 검색할 수 있습니다.")
+
+    # 2. 검색 대상 검증
+    if types:
+        unknown = set(types) - set(search.SEARCH_SOURCES)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 검색 대상입니다: {', '.join(sorted(unknown))}")
+
+    # 3. 검색 (점수순 + keyset 페이지네이션)
+    try:
+        hits, next_cursor = search.search_project(db, project_id, q, types, limit, cursor)
+    except search.SearchQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"results": hits, "next_cursor": next_cursor}
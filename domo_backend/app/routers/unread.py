@@ -0,0 +1,42 @@
+# app/routers/unread.py
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import Session
+
+from app.database import get_db
+from app.models.read_cursor import ReadChannel
+from app.models.workspace import Project, WorkspaceMember
+from app.routers.workspace import get_current_user_id
+from app.schemas import ReadCursorUpdate, ReadCursorResponse, UnreadSummaryResponse
+from app.services import unread
+
+router = APIRouter(tags=["Unread"])
+
+
+# 1. 읽음 커서 갱신 (채팅/게시판/카드 댓글을 어디까지 읽었는지, 채널의 최대 id까지만)
+@router.put("/projects/{project_id}/read-cursors/{channel}", response_model=ReadCursorResponse)
+def update_read_cursor(
+        project_id: int,
+        channel: ReadChannel,
+        cursor_data: ReadCursorUpdate,
+        user_id: int = Depends(get_current_user_id),
+        db: Session = Depends(get_db)
+):
+    project = db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
+    if not db.get(WorkspaceMember, (project.workspace_id, user_id)):
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+
+    last_read_id = unread.mark_read(db, user_id, project_id, channel, cursor_data.last_read_id)
+    return ReadCursorResponse(project_id=project_id, channel=channel.value, last_read_id=last_read_id)
+
+
+# 2. 내 모든 프로젝트의 안 읽은 수 요약 (쿼리 1번, 캐시, 채널별 최대 UNREAD_COUNT_CAP)
+@router.get("/users/me/unread", response_model=UnreadSummaryResponse)
+def get_my_unread(
+        user_id: int = Depends(get_current_user_id),
+        db: Session = Depends(get_db)
+):
+    projects = unread.unread_summary(db, user_id)
+    return UnreadSummaryResponse(total=sum(p["total"] for p in projects), projects=projects)
@@ -1,5 +1,4 @@
 import os
-import shutil
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from sqlmodel import Session, select
@@ -10,13 +9,12 @@ from app.models.user import User
 from app.schemas import UserResponse, UserUpdate
 from vectorwave import vectorize
 from app.utils.logger import log_activity
+from app.services import thumbnails
+from app.services.storage import storage
 from datetime import datetime
 
 router = APIRouter(tags=["User"])
 
-UPLOAD_DIR = "/app/uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-
 
 @router.patch("/users/me/profile-image", response_model=UserResponse)
 @vectorize(search_description="Update user profile image", capture_return_value=True)
@@ -36,21 +34,30 @@ def update_profile_image(
 
     # 3. 파일 저장
     file_ext = os.path.splitext(file.filename)[1]
-    filename = f"profile_{user_id}_{uuid.uuid4().hex[:8]}{file_ext}"
-    file_path = os.path.join(UPLOAD_DIR, filename)
+    key = f"profile_{user_id}_{uuid.uuid4().hex[:8]}{file_ext}"
 
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    storage.put(key, file.file, file.content_type)
+    thumbnails.schedule_thumbnails(key)
 
     # 4. DB 업데이트 (접근 가능한 URL 경로로 저장)
     # /static/ 경로로 접근할 수 있게 저장합니다.
-    image_url = f"/static/{filename}"
+    image_url = storage.url(key)
+    old_image = user.profile_image
     user.profile_image = image_url
 
     db.add(user)
     db.commit()
     db.refresh(user)
 
+    # 5. 이전 프로필 사진 정리 (기본 이미지는 공용이므로 유지)
+    if old_image and old_image.startswith("/static/profile_"):
+        old_key = storage.normalize_key(old_image)
+        try:
+            storage.delete(old_key)
+            thumbnails.remove_thumbnails(old_key)
+        except Exception as e:
+            print(f"⚠️ [User] Failed to delete old profile image {old_key}: {e}")
+
     log_activity(
         db=db, user_id=user_id, workspace_id=None, action_type="UPDATE",
         content=f"🖼️ '{user.name}'님이 프로필 사진을 변경했습니다."
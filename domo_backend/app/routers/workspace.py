@@ -13,6 +13,7 @@ from app.schemas import InvitationCreate, InvitationResponse, InvitationInfo
 from datetime import datetime, timedelta
 from typing import Any
 from app.utils.logger import log_activity
+from app.services import free_time
 from vectorwave import *
 from app.schemas import WorkspaceUpdate, ProjectUpdate
 from fastapi.concurrency import run_in_threadpool
@@ -182,6 +183,7 @@ def add_workspace_member(
     )
     db.add(new_member)
     db.commit()
+    free_time.invalidate_workspace(workspace_id)
 
     actor = db.get(User, user_id)
     ws = db.get(Workspace, workspace_id)
@@ -395,6 +397,7 @@ def accept_invitation(
     )
     db.add(new_member)
     db.commit()
+    free_time.invalidate_workspace(invite.workspace_id)
 
     new_comer = db.get(User, user_id)
     ws = db.get(Workspace, invite.workspace_id)
@@ -503,6 +506,7 @@ def remove_workspace_member(
 
     db.delete(member)
     db.commit()
+    free_time.invalidate_workspace(workspace_id)
 
     action = "탈퇴" if user_id == target_user_id else "강퇴"
     return {"message": f"멤버가 성공적으로 {action}처리 되었습니다."}
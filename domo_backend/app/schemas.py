@@ -1,7 +1,8 @@
-from pydantic import BaseModel, EmailStr
-from datetime import time as dt_time, datetime
-from typing import Optional, List
+from pydantic import BaseModel, EmailStr, computed_field
+from datetime import time as dt_time, datetime, date
+from typing import Optional, List, Dict
 from pydantic import Field as PydanticField  # 👈 별칭 사용을 위해 필요
+from app.services.thumbnails import thumbnail_urls
 
 
 # data for register
@@ -26,6 +27,13 @@ class UserResponse(BaseModel):
     nickname: Optional[str] = None
     is_student_verified: bool
     profile_image: Optional[str] = None
+
+    # 사이즈별 썸네일 URL (sm/md/lg)
+    @computed_field
+    @property
+    def profile_image_thumbnails(self) -> Optional[Dict[str, str]]:
+        return thumbnail_urls(self.profile_image)
+
     class Config:
         from_attributes = True
 
@@ -150,6 +158,38 @@ class FreeTimeSlot(BaseModel):
     day_of_week: int
     start_time: dt_time
     end_time: dt_time
+    available_count: Optional[int] = None  # 이 구간에 비어 있는 인원 (구간 내 최솟값)
+
+
+class AvailabilityHeatmapResponse(BaseModel):
+    workspace_id: int
+    week_start: date  # 해당 주 월요일
+    slot_minutes: int
+    member_count: int
+    busy_counts: List[List[int]]  # [요일(0:월)][칸] = 바쁜 인원 수
+
+
+class MeetingSuggestionRequest(BaseModel):
+    duration_minutes: int = PydanticField(60, ge=15, le=480)
+    start_date: Optional[date] = None  # 기본: 오늘
+    days_ahead: int = PydanticField(7, ge=1, le=31)
+    window_start: dt_time = dt_time(9, 0)
+    window_end: dt_time = dt_time(22, 0)
+    member_ids: Optional[List[int]] = None  # 기본: 워크스페이스 전체
+    min_available: Optional[int] = PydanticField(None, ge=1)  # 기본: 전원 참석 가능
+    project_id: Optional[int] = None  # 지정하면 해당 프로젝트의 일정/마감일만 반영
+    top_k: int = PydanticField(5, ge=1, le=20)
+    step_minutes: int = PydanticField(30, ge=5, le=120)
+
+
+class MeetingSuggestionResponse(BaseModel):
+    start_datetime: datetime
+    end_datetime: datetime
+    score: float
+    available_count: int
+    member_count: int
+    overlapping_event_minutes: int
+    upcoming_due_count: int  # 회의 후 3일 안에 마감되는 카드 수
 
 
 class AddMemberRequest(BaseModel):
@@ -184,6 +224,21 @@ class FileResponse(BaseModel):
     latest_version: Optional[FileVersionResponse] = None
 
 
+# 이어 올리기(Resumable Upload) 세션
+class ResumableUploadCreate(BaseModel):
+    filename: str
+    total_size: int = PydanticField(gt=0)
+
+
+class ResumableUploadResponse(BaseModel):
+    upload_id: str
+    project_id: int
+    filename: str
+    total_size: int
+    offset: int  # 서버가 지금까지 받은 바이트 수 (다음 청크의 시작 위치)
+    expires_at: datetime
+
+
 class CardCommentCreate(BaseModel):
     content: str
 
@@ -253,6 +308,7 @@ class ProjectEventCreate(BaseModel):
     description: Optional[str] = None
     start_datetime: datetime
     end_datetime: datetime
+    recurrence_rule: Optional[str] = None  # RRULE (예: FREQ=WEEKLY;BYDAY=MO;COUNT=10)
 
 
 class ProjectEventResponse(BaseModel):
@@ -264,6 +320,8 @@ class ProjectEventResponse(BaseModel):
     end_datetime: datetime
     created_by: int
     created_at: datetime
+    recurrence_rule: Optional[str] = None
+    recurrence_until: Optional[datetime] = None
 
 
 # [게시판 관련 스키마]
@@ -314,6 +372,7 @@ class ChatMessageResponse(BaseModel):
     user_id: int
     content: str
     created_at: datetime
+    client_id: Optional[str] = None
     user: Optional[UserResponse] = None
 
 
@@ -344,6 +403,7 @@ class ProjectEventUpdate(BaseModel):
     description: Optional[str] = None
     start_datetime: Optional[datetime] = None
     end_datetime: Optional[datetime] = None
+    recurrence_rule: Optional[str] = None  # 빈 문자열("")이면 반복 해제
 
 
 # 🔗 [수정] 카드 연결 생성 요청
@@ -430,6 +490,12 @@ class CommunityPostResponse(BaseModel):
     comments: List[CommunityCommentResponse] = []  # 댓글 목록 포함
     user: Optional[UserResponse] = None
 
+    # 사이즈별 썸네일 URL (sm/md/lg) - 피드에서는 원본 대신 이걸 사용
+    @computed_field
+    @property
+    def image_thumbnails(self) -> Optional[Dict[str, str]]:
+        return thumbnail_urls(self.image_url)
+
 
 class CommunityCommentCreate(BaseModel):
     content: str
@@ -595,6 +661,16 @@ class RecruitmentResponse(BaseModel):
         from_attributes = True
 
 
+class RecommendedRecruitmentResponse(RecruitmentResponse):
+    score: float  # 추천 점수 (높을수록 지원 이력과 잘 맞음)
+
+
+class WorkspaceBootstrapRequest(BaseModel):
+    # 미리 만들 프로젝트/보드 템플릿 ("auto"면 모집 카테고리에 맞춤, 없으면 빈 워크스페이스)
+    template: Optional[str] = None
+    notify_members: bool = True  # 합류한 멤버들에게 안내 메일 발송 (끄려면 false)
+
+
 # Application 스키마
 class ApplicationCreate(BaseModel):
     position: RecruitmentPosition
@@ -651,4 +727,44 @@ class SeminarResponse(BaseModel):
     user: Optional[UserBrief] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# [통합 검색]
+class SearchResultItem(BaseModel):
+    type: str  # card | post | post_comment | chat | file
+    id: int
+    title: Optional[str] = None
+    headline: Optional[str] = None  # 일치 부분을 <mark>로 감싼 발췌 (HTML 이스케이프됨)
+    created_at: datetime
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    results: List[SearchResultItem]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달
+
+
+# [읽음 표시 / 안 읽은 수]
+class ReadCursorUpdate(BaseModel):
+    last_read_id: int = PydanticField(ge=0)
+
+
+class ReadCursorResponse(BaseModel):
+    project_id: int
+    channel: str
+    last_read_id: int
+
+
+class ProjectUnreadResponse(BaseModel):
+    project_id: int
+    project_name: str
+    workspace_id: int
+    chat: int
+    posts: int
+    card_comments: int
+    total: int
+
+
+class UnreadSummaryResponse(BaseModel):
+    total: int
+    projects: List[ProjectUnreadResponse]
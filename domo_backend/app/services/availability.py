@@ -0,0 +1,131 @@
+# app/services/availability.py
+
+import time
+from threading import Lock
+from datetime import date
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.models.schedule import Schedule
+from app.services.free_time import (
+    MINUTES_PER_DAY, event_day_intervals, get_week_events, schedule_interval, week_monday
+)
+
+# =================================================================
+# 🔥 주간 가용성 히트맵
+# 한 주(7일)를 slot_minutes 단위 칸으로 나눈 (멤버 × 칸) 점유 행렬을 만들고
+# 열 방향 합으로 "칸마다 바쁜 인원 수"를 구합니다.
+# - 개인 시간표는 매주 반복되므로 멤버별 행(row)을 캐시해 두고,
+#   한 멤버가 시간표를 고치면 그 멤버의 행만 다시 계산합니다.
+#   (다른 워커의 캐시는 무효화되지 않으므로 MEMBER_ROW_TTL_SECONDS 뒤에 다시 계산)
+# - 프로젝트 일정은 해당 주에 한해 모든 멤버를 바쁘게 만드는 한 줄로 계산합니다.
+# =================================================================
+
+ALLOWED_SLOT_MINUTES = (5, 10, 15, 30, 60)
+DAYS_PER_WEEK = 7
+
+
+def slots_per_day(slot_minutes: int) -> int:
+    return MINUTES_PER_DAY // slot_minutes
+
+
+def rasterize(intervals: Iterable[Tuple[int, int, int]], slot_minutes: int) -> np.ndarray:
+    """
+    (요일, 시작분, 종료분) 구간들을 주간 칸 배열(bool)로 변환
+    칸의 일부라도 겹치면 그 칸은 바쁜 것으로 봅니다.
+    """
+    per_day = slots_per_day(slot_minutes)
+    items = np.array(list(intervals), dtype=np.int64).reshape(-1, 3)
+    diff = np.zeros(DAYS_PER_WEEK * per_day + 1, dtype=np.int32)
+    if len(items):
+        offsets = items[:, 0] * per_day
+        starts = offsets + items[:, 1] // slot_minutes
+        ends = offsets + -(-items[:, 2] // slot_minutes)  # 올림
+        valid = ends > starts
+        # 차분 배열 + 누적합 → 구간 개수와 상관없이 한 번의 벡터 연산으로 채움
+        np.add.at(diff, starts[valid], 1)
+        np.add.at(diff, ends[valid], -1)
+    return np.cumsum(diff[:-1]) > 0
+
+
+MEMBER_ROW_TTL_SECONDS = 300
+
+
+class MemberRowCache:
+    """(user_id, slot_minutes) → 개인 시간표 점유 행"""
+
+    def __init__(self, ttl: int = MEMBER_ROW_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = Lock()
+        self._rows: Dict[Tuple[int, int], Tuple[float, np.ndarray]] = {}
+
+    def get_many(self, user_ids: Sequence[int], slot_minutes: int) -> Dict[int, np.ndarray]:
+        now = time.monotonic()
+        with self._lock:
+            entries = {uid: self._rows.get((uid, slot_minutes)) for uid in user_ids}
+        return {uid: entry[1] for uid, entry in entries.items() if entry and entry[0] > now}
+
+    def set(self, user_id: int, slot_minutes: int, row: np.ndarray):
+        with self._lock:
+            self._rows[(user_id, slot_minutes)] = (time.monotonic() + self.ttl, row)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            for key in [key for key in self._rows if key[0] == user_id]:
+                del self._rows[key]
+
+
+member_row_cache = MemberRowCache()
+
+
+def invalidate_member(user_id: int):
+    """개인 시간표가 바뀌면 호출 - 해당 멤버의 행만 다음 요청에서 다시 계산"""
+    member_row_cache.invalidate(user_id)
+
+
+def _member_rows(db: Session, member_ids: Sequence[int], slot_minutes: int) -> Dict[int, np.ndarray]:
+    rows = member_row_cache.get_many(member_ids, slot_minutes)
+    missing = [uid for uid in member_ids if uid not in rows]
+    if not missing:
+        return rows
+
+    intervals: Dict[int, List[Tuple[int, int, int]]] = {uid: [] for uid in missing}
+    for s in db.exec(select(Schedule).where(Schedule.user_id.in_(missing))).all():
+        intervals[s.user_id].append((s.day_of_week, *schedule_interval(s)))
+
+    for uid in missing:
+        row = rasterize(intervals[uid], slot_minutes)
+        member_row_cache.set(uid, slot_minutes, row)
+        rows[uid] = row
+    return rows
+
+
+def build_heatmap(
+        db: Session,
+        workspace_id: int,
+        member_ids: Sequence[int],
+        slot_minutes: int = 15,
+        week_start: date = None
+) -> dict:
+    week_start = week_monday(week_start)
+    per_day = slots_per_day(slot_minutes)
+
+    rows = _member_rows(db, member_ids, slot_minutes)
+    grid = np.vstack([rows[uid] for uid in member_ids]) if member_ids \
+        else np.zeros((0, DAYS_PER_WEEK * per_day), dtype=bool)
+
+    events = get_week_events(db, workspace_id, week_start)
+    event_row = rasterize(event_day_intervals(events, week_start), slot_minutes)
+
+    # (멤버 × 칸) 행렬에 일정 행을 OR로 합친 뒤 열 방향 합 = 칸별 바쁜 인원
+    busy_counts = (grid | event_row).sum(axis=0, dtype=np.int32)
+
+    return {
+        "workspace_id": workspace_id,
+        "week_start": week_start,
+        "slot_minutes": slot_minutes,
+        "member_count": len(member_ids),
+        "busy_counts": busy_counts.reshape(DAYS_PER_WEEK, per_day).tolist(),
+    }
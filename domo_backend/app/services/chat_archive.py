@@ -0,0 +1,307 @@
+# app/services/chat_archive.py
+
+import os
+import gzip
+import json
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from io import BytesIO
+from threading import Lock
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, text
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models.chat import ChatArchiveSegment, ChatMessage
+from app.models.workspace import Project
+from app.services.storage import storage
+
+# =================================================================
+# 🗃️ 채팅 메시지 보관(아카이브)
+# 오래된 메시지를 chat_messages(핫 테이블)에서 빼내 프로젝트/월 단위의
+# gzip 압축 JSONL 파일로 저장소에 옮기고, id 구간을 ChatArchiveSegment에 기록합니다.
+# - 보관 기준: CHAT_ARCHIVE_AFTER_DAYS일 전이 속한 달의 1일 이전 메시지 (한 달은 한 번에 보관)
+# - 파일 업로드 → (세그먼트 기록 + 메시지 삭제)를 한 트랜잭션으로 커밋
+#   → 커밋 전에 실패하면 메시지는 그대로 남고, 올라간 파일은 참조가 없어 저장소 GC가 정리
+# - 조회(get_chat_messages, WebSocket after_id 재전송)는 핫 테이블과 세그먼트를 이어서 읽음
+#   (세그먼트는 바뀌지 않으므로 풀어 둔 내용을 CACHED_SEGMENT_BYTES까지 프로세스 메모리에 캐시)
+# - 주의: 통합 검색은 chat_messages.search_vector만 보므로 보관된 채팅은 검색되지 않음
+# =================================================================
+
+ARCHIVE_INTERVAL_SECONDS = int(os.environ.get("CHAT_ARCHIVE_INTERVAL_SECONDS", 24 * 60 * 60))
+ARCHIVE_AFTER_DAYS = int(os.environ.get("CHAT_ARCHIVE_AFTER_DAYS", 180))
+ARCHIVE_PREFIX = "chat-archive"
+MAX_SEGMENT_MESSAGES = 10_000   # 한 파일에 담는 최대 메시지 수 (보관 작업 / 세그먼트 한 번 읽기의 메모리 상한)
+# 캐시 상한 (풀어 둔 JSON 기준 바이트, 파이썬 객체로는 이보다 몇 배 큼)
+CACHED_SEGMENT_BYTES = int(os.environ.get("CHAT_ARCHIVE_CACHE_BYTES", 16 * 1024 * 1024))
+
+# 여러 워커가 동시에 돌지 않도록 잡는 PostgreSQL advisory lock 키
+ARCHIVE_LOCK_KEY = 710_049
+
+MessageRow = Tuple[int, int, str, datetime, Optional[str]]  # id, user_id, content, created_at, client_id
+
+
+@dataclass
+class ArchiveReport:
+    projects: int = 0
+    segments: int = 0
+    messages: int = 0
+    bytes: int = 0
+
+
+def archive_boundary(now: Optional[datetime] = None) -> datetime:
+    """이 시각 이전 메시지를 보관 (기준일이 속한 달의 1일 0시)"""
+    cutoff = (now or datetime.now()) - timedelta(days=ARCHIVE_AFTER_DAYS)
+    return cutoff.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def segment_key(project_id: int, month: str, first_id: int, last_id: int) -> str:
+    return f"{ARCHIVE_PREFIX}/{project_id}/{month}/{first_id}-{last_id}.jsonl.gz"
+
+
+def _encode(project_id: int, rows: List[MessageRow]) -> bytes:
+    lines = (
+        json.dumps({
+            "id": message_id,
+            "project_id": project_id,
+            "user_id": user_id,
+            "content": content,
+            "created_at": created_at.isoformat(),
+            "client_id": client_id,
+        }, ensure_ascii=False)
+        for message_id, user_id, content, created_at, client_id in rows
+    )
+    return gzip.compress(("\n".join(lines) + "\n").encode("utf-8"))
+
+
+# -----------------------------------------------------------------
+# 보관 작업
+# -----------------------------------------------------------------
+def _split_by_month(rows: List[MessageRow]) -> List[Tuple[str, List[MessageRow]]]:
+    """id순 메시지를 연속된 같은 달끼리 묶음"""
+    groups: List[Tuple[str, List[MessageRow]]] = []
+    for row in rows:
+        month = row[3].strftime("%Y-%m")
+        if not groups or groups[-1][0] != month:
+            groups.append((month, []))
+        groups[-1][1].append(row)
+    return groups
+
+
+def _write_segment(db: Session, project_id: int, month: str, rows: List[MessageRow]) -> int:
+    """세그먼트 파일을 올리고 핫 테이블에서 해당 구간을 지움 (압축 파일 크기 반환)"""
+    first_id, last_id = rows[0][0], rows[-1][0]
+    key = segment_key(project_id, month, first_id, last_id)
+    data = _encode(project_id, rows)
+    storage.put(key, BytesIO(data), "application/gzip")
+
+    db.add(ChatArchiveSegment(
+        project_id=project_id,
+        month=month,
+        first_message_id=first_id,
+        last_message_id=last_id,
+        message_count=len(rows),
+        storage_key=key,
+        size=len(data),
+    ))
+    # id 구간 [first, last]를 빠짐없이 읽었으므로 구간 삭제 = 보관한 메시지 삭제
+    db.execute(
+        delete(ChatMessage)
+        .where(ChatMessage.project_id == project_id)
+        .where(ChatMessage.id >= first_id)
+        .where(ChatMessage.id <= last_id)
+    )
+    db.commit()
+    return len(data)
+
+
+def archive_project(db: Session, project_id: int, boundary: datetime, report: ArchiveReport):
+    while True:
+        # (project_id, id) 인덱스 순서로 오래된 메시지부터 읽다가 기준 이후 메시지에서 멈춤
+        rows = db.exec(
+            select(ChatMessage.id, ChatMessage.user_id, ChatMessage.content,
+                   ChatMessage.created_at, ChatMessage.client_id)
+            .where(ChatMessage.project_id == project_id)
+            .order_by(ChatMessage.id.asc())
+            .limit(MAX_SEGMENT_MESSAGES)
+        ).all()
+        end = next((i for i, row in enumerate(rows) if row[3] >= boundary), len(rows))
+        rows = [tuple(row) for row in rows[:end]]
+        if not rows:
+            return
+
+        for month, group in _split_by_month(rows):
+            report.bytes += _write_segment(db, project_id, month, group)
+            report.segments += 1
+            report.messages += len(group)
+
+        if end < MAX_SEGMENT_MESSAGES:
+            return
+
+
+def archive_messages(now: Optional[datetime] = None) -> ArchiveReport:
+    report = ArchiveReport()
+    boundary = archive_boundary(now)
+
+    with Session(engine) as db:
+        for project_id in db.exec(select(Project.id).order_by(Project.id)).all():
+            oldest = db.exec(
+                select(ChatMessage.created_at)
+                .where(ChatMessage.project_id == project_id)
+                .order_by(ChatMessage.id.asc())
+                .limit(1)
+            ).first()
+            if oldest is None or oldest >= boundary:
+                continue
+            report.projects += 1
+            archive_project(db, project_id, boundary, report)
+
+    return report
+
+
+def run_once(now: Optional[datetime] = None) -> ArchiveReport:
+    """다른 워커가 이미 보관 중이면 건너뜀 (PostgreSQL advisory lock)"""
+    with engine.connect() as conn:
+        use_lock = engine.dialect.name == "postgresql"
+        if use_lock and not conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": ARCHIVE_LOCK_KEY}).scalar():
+            print("⏭️  [Chat Archive] Another worker is archiving. Skipped.", flush=True)
+            return ArchiveReport()
+
+        try:
+            report = archive_messages(now)
+        finally:
+            if use_lock:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": ARCHIVE_LOCK_KEY})
+
+    print(
+        f"🗃️ [Chat Archive] projects={report.projects} segments={report.segments} "
+        f"messages={report.messages} size={report.bytes / (1024 * 1024):.1f}MB",
+        flush=True
+    )
+    return report
+
+
+# -----------------------------------------------------------------
+# 조회 (get_chat_messages / WebSocket after_id 재전송에서 핫 테이블과 이어서)
+# 반환: 시간순(id 오름차순) 메시지 dict 목록
+# -----------------------------------------------------------------
+class SegmentCache:
+    """풀어 둔 세그먼트를 크기 상한 안에서 최근 사용 순으로 보관 (상한보다 큰 세그먼트는 캐시하지 않음)"""
+
+    def __init__(self, max_bytes: int = CACHED_SEGMENT_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._segments: "OrderedDict[str, Tuple[int, Tuple[dict, ...]]]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Optional[Tuple[dict, ...]]:
+        with self._lock:
+            entry = self._segments.get(key)
+            if entry is None:
+                return None
+            self._segments.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, size: int, records: Tuple[dict, ...]):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._segments:
+                return
+            self._segments[key] = (size, records)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (evicted, _) = self._segments.popitem(last=False)
+                self._bytes -= evicted
+
+
+segment_cache = SegmentCache()
+
+
+def _load_segment(key: str) -> Tuple[dict, ...]:
+    records = segment_cache.get(key)
+    if records is not None:
+        return records
+
+    raw = gzip.decompress(storage.get(key))
+    parsed = []
+    for line in raw.decode("utf-8").splitlines():
+        if line:
+            record = json.loads(line)
+            record["created_at"] = datetime.fromisoformat(record["created_at"])
+            parsed.append(record)
+    records = tuple(parsed)
+    segment_cache.put(key, len(raw), records)
+    return records
+
+
+def read_before(db: Session, project_id: int, before_id: Optional[int], limit: int) -> List[dict]:
+    """before_id 이전(없으면 가장 최근 보관분부터) 메시지 limit개"""
+    query = (
+        select(ChatArchiveSegment)
+        .where(ChatArchiveSegment.project_id == project_id)
+        .order_by(ChatArchiveSegment.last_message_id.desc())
+    )
+    if before_id is not None:
+        query = query.where(ChatArchiveSegment.first_message_id < before_id)
+
+    collected: List[dict] = []
+    for segment in db.exec(query).all():
+        records = [r for r in _load_segment(segment.storage_key) if before_id is None or r["id"] < before_id]
+        collected = records[-(limit - len(collected)):] + collected
+        if len(collected) >= limit:
+            break
+    return collected
+
+
+def read_after(db: Session, project_id: int, after_id: int, limit: int) -> List[dict]:
+    """after_id 이후 보관된 메시지를 오래된 것부터 limit개"""
+    segments = db.exec(
+        select(ChatArchiveSegment)
+        .where(ChatArchiveSegment.project_id == project_id)
+        .where(ChatArchiveSegment.last_message_id > after_id)
+        .order_by(ChatArchiveSegment.last_message_id.asc())
+    ).all()
+
+    collected: List[dict] = []
+    for segment in segments:
+        records = [r for r in _load_segment(segment.storage_key) if r["id"] > after_id]
+        collected += records[:limit - len(collected)]
+        if len(collected) >= limit:
+            break
+    return collected
+
+
+# =================================================================
+# ⏰ 주기 실행 (main.py lifespan에서 시작/종료)
+# =================================================================
+_task = None
+
+
+async def _loop():
+    while True:
+        await asyncio.sleep(ARCHIVE_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(run_once)
+        except Exception as e:
+            print(f"❌ [Chat Archive] Failed: {e}", flush=True)
+
+
+def start():
+    global _task
+    if ARCHIVE_INTERVAL_SECONDS > 0 and _task is None:
+        _task = asyncio.create_task(_loop())
+
+
+async def stop():
+    global _task
+    if _task:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
@@ -0,0 +1,207 @@
+# app/services/chat_bus.py
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models.chat import ChatMessage
+from app.services import unread
+
+# =================================================================
+# 💬 채팅 이벤트 버스 + 배치 저장
+# - ChatBus: 프로젝트별 구독자(연결마다 asyncio.Queue)에게 메시지를 바로 전달
+#   (DB 폴링 없음, 워커 프로세스 안에서만 전달)
+# - ChatWriter: WebSocket으로 들어온 메시지를 잠깐(BATCH_WINDOW_SECONDS) 모아
+#   INSERT ... ON CONFLICT (project_id, user_id, client_id) DO NOTHING RETURNING 한 번으로 저장
+#   → 같은 client_id로 재전송된 메시지는 새로 저장하지 않고 기존 id로 ack
+# =================================================================
+
+BATCH_SIZE = 50
+BATCH_WINDOW_SECONDS = 0.02
+SUBSCRIBER_QUEUE_SIZE = 500  # 이보다 밀린 느린 구독자는 연결을 끊음
+
+
+def message_payload(message_id: int, project_id: int, user_id: int, content: str,
+                    created_at: datetime, client_id: Optional[str], user: Optional[dict]) -> dict:
+    return {
+        "id": message_id,
+        "project_id": project_id,
+        "user_id": user_id,
+        "content": content,
+        "created_at": created_at.isoformat(),
+        "client_id": client_id,
+        "user": user,
+    }
+
+
+class ChatBus:
+    def __init__(self):
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def subscribe(self, project_id: int) -> asyncio.Queue:
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(project_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, project_id: int, queue: asyncio.Queue):
+        subscribers = self._subscribers.get(project_id)
+        if subscribers:
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._subscribers[project_id]
+
+    def publish(self, project_id: int, event: dict):
+        """이벤트 루프 스레드에서 호출"""
+        for queue in list(self._subscribers.get(project_id, ())):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # 너무 밀린 구독자는 끊김 신호(None)를 받고, 재접속 시 after_id로 따라잡음
+                self.unsubscribe(project_id, queue)
+                queue.get_nowait()
+                queue.put_nowait(None)
+
+    def publish_threadsafe(self, project_id: int, event: dict):
+        """동기 엔드포인트(스레드풀)에서 호출"""
+        if self._loop and project_id in self._subscribers:
+            self._loop.call_soon_threadsafe(self.publish, project_id, event)
+
+
+chat_bus = ChatBus()
+
+
+# -----------------------------------------------------------------
+# 배치 저장
+# -----------------------------------------------------------------
+@dataclass
+class PendingMessage:
+    project_id: int
+    user_id: int
+    content: str
+    client_id: str
+    user: Optional[dict]
+    reply: asyncio.Queue  # ack를 돌려보낼 연결의 송신 큐 (= 그 연결의 구독 큐)
+
+    def respond(self, event: dict):
+        try:
+            self.reply.put_nowait(event)
+        except asyncio.QueueFull:
+            pass  # 연결이 끊길 상황이면 ack는 버림 (클라이언트가 같은 client_id로 재전송)
+
+
+def _insert_batch(batch: List[PendingMessage]) -> Dict[tuple, tuple]:
+    """(project_id, user_id, client_id) → (id, created_at, 새로 저장됐는지)"""
+    now = datetime.now()
+    with Session(engine) as db:
+        rows = db.execute(
+            pg_insert(ChatMessage)
+            .values([
+                {
+                    "project_id": p.project_id,
+                    "user_id": p.user_id,
+                    "content": p.content,
+                    "client_id": p.client_id,
+                    "created_at": now,
+                }
+                for p in batch
+            ])
+            .on_conflict_do_nothing(index_elements=["project_id", "user_id", "client_id"])
+            .returning(ChatMessage.id, ChatMessage.project_id, ChatMessage.user_id,
+                       ChatMessage.client_id, ChatMessage.created_at)
+        ).all()
+        result = {
+            (row.project_id, row.user_id, row.client_id): (row.id, row.created_at, True) for row in rows
+        }
+
+        # 재전송(이미 저장된 client_id) → 기존 메시지 id로 ack
+        duplicates = [p for p in batch if (p.project_id, p.user_id, p.client_id) not in result]
+        if duplicates:
+            existing = db.exec(
+                select(ChatMessage)
+                .where(ChatMessage.project_id.in_({p.project_id for p in duplicates}))
+                .where(ChatMessage.user_id.in_({p.user_id for p in duplicates}))
+                .where(ChatMessage.client_id.in_({p.client_id for p in duplicates}))
+            ).all()
+            for message in existing:
+                result.setdefault(
+                    (message.project_id, message.user_id, message.client_id),
+                    (message.id, message.created_at, False)
+                )
+
+        db.commit()
+    return result
+
+
+class ChatWriter:
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, pending: PendingMessage):
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        self._queue.put_nowait(pending)
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            # 짧게 기다리며 같이 보낼 메시지를 모음
+            deadline = asyncio.get_running_loop().time() + BATCH_WINDOW_SECONDS
+            while len(batch) < BATCH_SIZE:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                saved = await asyncio.to_thread(_insert_batch, batch)
+            except Exception as e:
+                print(f"❌ [Chat] Batch insert failed: {e}", flush=True)
+                for p in batch:
+                    p.respond({"type": "error", "client_id": p.client_id, "detail": "메시지를 저장하지 못했습니다."})
+                continue
+
+            published = set()
+            for p in batch:
+                entry = saved.get((p.project_id, p.user_id, p.client_id))
+                if not entry:
+                    continue
+                message_id, created_at, is_new = entry
+                p.respond({
+                    "type": "ack",
+                    "client_id": p.client_id,
+                    "id": message_id,
+                    "created_at": created_at.isoformat(),
+                })
+                if is_new and message_id not in published:
+                    published.add(message_id)
+                    unread.invalidate_project(p.project_id)
+                    chat_bus.publish(p.project_id, {
+                        "type": "message",
+                        "message": message_payload(
+                            message_id, p.project_id, p.user_id, p.content, created_at, p.client_id, p.user
+                        ),
+                    })
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+chat_writer = ChatWriter()
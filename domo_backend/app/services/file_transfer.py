@@ -0,0 +1,122 @@
+# app/services/file_transfer.py
+
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from mimetypes import guess_type
+from urllib.parse import quote
+
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import FileResponse, RedirectResponse
+
+from app.services.storage import storage, StorageError
+
+# nginx 등 리버스 프록시가 sendfile(zero-copy)로 직접 파일을 보내도록 위임할 때 사용
+# 예) DOWNLOAD_ACCEL_REDIRECT_PREFIX=/protected-uploads/
+#     → nginx: location /protected-uploads/ { internal; alias /app/uploads/; }
+# 설정하지 않으면 앱이 직접 전송합니다. (Range 처리는 Starlette FileResponse가 담당)
+ACCEL_REDIRECT_PREFIX = os.environ.get("DOWNLOAD_ACCEL_REDIRECT_PREFIX")
+
+# 버전 파일은 내용이 바뀌지 않으므로 매번 재검증(304)만 하도록 설정
+CACHE_CONTROL = "private, no-cache"
+
+
+def version_etag(version) -> str:
+    """FileVersion 단위의 강한(strong) ETag - 같은 버전이면 항상 같은 값"""
+    return f'"fv{version.id}-{version.file_size}"'
+
+
+def version_last_modified(version) -> str:
+    return formatdate(version.created_at.timestamp(), usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: str) -> bool:
+    """
+    조건부 요청 판단 (RFC 9110)
+    If-None-Match가 있으면 그것만 보고, 없을 때만 If-Modified-Since를 확인합니다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [t.strip() for t in if_none_match.split(",")]
+        # If-None-Match는 약한 비교 → W/ 접두어는 무시
+        return "*" in tags or etag in [t.removeprefix("W/") for t in tags]
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(last_modified)
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def version_file_response(
+        request: Request,
+        version,
+        filename: str,
+        inline: bool = False
+) -> Response:
+    """
+    FileVersion 다운로드 응답 생성
+    - ETag / Last-Modified 기반 304 응답
+    - Range / If-Range 요청 시 206 부분 응답 (동영상 탐색 등)
+    - 원본 파일명 기준 Content-Type
+    - (선택) X-Accel-Redirect로 프록시에 zero-copy 전송 위임
+    - 오브젝트 스토리지면 presigned URL로 리다이렉트 (Range 등은 스토리지가 처리)
+    """
+    key = storage.normalize_key(version.saved_path)
+    etag = version_etag(version)
+    last_modified = version_last_modified(version)
+    validators = {
+        "etag": etag,
+        "last-modified": last_modified,
+        "cache-control": CACHE_CONTROL,
+    }
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=validators)
+
+    media_type = guess_type(filename)[0] or "application/octet-stream"
+    disposition_type = "inline" if inline else "attachment"
+
+    presigned_url = storage.presign(key, filename=filename, content_type=media_type, inline=inline)
+    if presigned_url:
+        return RedirectResponse(presigned_url, status_code=307, headers={"cache-control": "no-store"})
+
+    if ACCEL_REDIRECT_PREFIX:
+        # 본문 없이 헤더만 보내고, 실제 전송(Range 포함)은 프록시의 sendfile이 처리
+        return Response(
+            media_type=media_type,
+            headers={
+                **validators,
+                "x-accel-redirect": ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(key),
+                "content-disposition": f"{disposition_type}; filename*=utf-8''{quote(filename)}",
+            }
+        )
+
+    # 서버가 http.response.pathsend 확장을 지원하면 FileResponse가 zero-copy로 전송합니다.
+    path = storage.local_path(key)
+    return FileResponse(
+        path=path,
+        filename=filename,
+        media_type=media_type,
+        headers=validators,
+        stat_result=os.stat(path),
+        content_disposition_type=disposition_type
+    )
+
+
+def stored_object_response(key: str, headers: dict = None) -> Response:
+    """
+    저장소의 파일을 그대로 응답 (이미지/썸네일 등)
+    로컬이면 직접 전송, 오브젝트 스토리지면 presigned URL로 리다이렉트
+    """
+    presigned_url = storage.presign(key)
+    if presigned_url:
+        return RedirectResponse(presigned_url, status_code=307)
+    try:
+        path = storage.local_path(key)
+    except StorageError:
+        # 저장소 루트를 벗어나는 키 (../ 등)
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    return FileResponse(path, headers=headers)
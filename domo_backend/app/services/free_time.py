@@ -0,0 +1,318 @@
+# app/services/free_time.py
+
+import time as time_module
+from threading import Lock
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, replace
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlmodel import Session, select
+
+from app.models.schedule import Schedule, ProjectEvent
+from app.models.workspace import WorkspaceMember, Project
+from app.services import recurrence
+from app.services.recurrence import EventOccurrence
+
+# =================================================================
+# 🕒 공통 빈 시간 계산 엔진
+# 모든 시간은 '그 날 00:00부터 몇 분'(0~1440)인 정수 구간 [start, end)으로 다룹니다.
+# 1) 시간표/프로젝트 일정을 한 번 훑으면서 요일별·멤버별로 나눔 (bucket)
+# 2) 멤버별 바쁜 구간을 정렬 후 병합 (O(n log n))
+# 3) 스윕 라인으로 "n명 중 k명 이상 비는 구간"을 계산
+# =================================================================
+
+MINUTES_PER_DAY = 24 * 60
+
+Interval = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class FreeTimeQuery:
+    window_start: int = 9 * 60    # 09:00
+    window_end: int = 22 * 60     # 22:00
+    min_minutes: int = 30
+    days: Tuple[int, ...] = (0, 1, 2, 3, 4)  # 월~금
+    member_ids: Optional[Tuple[int, ...]] = None  # None이면 워크스페이스 전체
+    quorum: Optional[int] = None  # None이면 전원
+    week_start: Optional[date] = None  # 프로젝트 일정을 반영할 주의 월요일
+
+
+@dataclass
+class FreeSlot:
+    day_of_week: int
+    start: int
+    end: int
+    available_count: int
+
+    @property
+    def start_time(self) -> time:
+        return minutes_to_time(self.start)
+
+    @property
+    def end_time(self) -> time:
+        # 24:00은 time으로 표현할 수 없으므로 23:59로 표시
+        return minutes_to_time(min(self.end, MINUTES_PER_DAY - 1))
+
+
+def time_to_minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def minutes_to_time(value: int) -> time:
+    return time(value // 60, value % 60)
+
+
+def week_monday(day: Optional[date] = None) -> date:
+    day = day or date.today()
+    return day - timedelta(days=day.weekday())
+
+
+# -----------------------------------------------------------------
+# 1. 구간 연산
+# -----------------------------------------------------------------
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """겹치거나 맞닿은 구간을 합침"""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def busy_segments(
+        busy_by_member: Dict[int, List[Interval]],
+        window: Interval
+) -> List[Tuple[int, int, int]]:
+    """
+    스윕 라인: 창(window)을 '동시에 바쁜 인원 수'가 일정한 구간들로 나눔
+    반환값은 빈틈 없이 이어지는 (start, end, 바쁜 인원) 목록
+    """
+    window_start, window_end = window
+    points: List[Tuple[int, int]] = []
+    for intervals in busy_by_member.values():
+        # 멤버별로 먼저 병합해야 한 사람이 두 번 세어지지 않음
+        for start, end in merge_intervals(intervals):
+            start, end = max(start, window_start), min(end, window_end)
+            if start < end:
+                points.append((start, 1))
+                points.append((end, -1))
+    points.sort()
+
+    segments: List[Tuple[int, int, int]] = []
+    busy = 0
+    cursor = window_start
+    index = 0
+    while cursor < window_end:
+        # cursor 시점의 변화량을 모두 반영
+        while index < len(points) and points[index][0] <= cursor:
+            busy += points[index][1]
+            index += 1
+        next_point = points[index][0] if index < len(points) else window_end
+        next_point = min(next_point, window_end)
+        segments.append((cursor, next_point, busy))
+        cursor = next_point
+
+    return segments
+
+
+def quorum_free_slots(
+        busy_by_member: Dict[int, List[Interval]],
+        member_count: int,
+        window: Interval,
+        quorum: int
+) -> List[Tuple[int, int, int]]:
+    """'비어 있는 인원 >= quorum'인 구간을 (start, end, 최소 가용 인원)으로 반환"""
+    slots: List[Tuple[int, int, int]] = []
+    for start, end, busy in busy_segments(busy_by_member, window):
+        available = member_count - busy
+        if available < quorum:
+            continue
+        if slots and slots[-1][1] == start:
+            # 이어지는 구간은 하나로 합치고 가용 인원은 최솟값으로 표시
+            prev_start, _, prev_available = slots[-1]
+            slots[-1] = (prev_start, end, min(prev_available, available))
+        else:
+            slots.append((start, end, available))
+
+    return slots
+
+
+# -----------------------------------------------------------------
+# 2. 요일별 바쁜 구간 모으기 (한 번의 순회)
+# -----------------------------------------------------------------
+def bucket_busy_intervals(
+        schedules: Sequence[Schedule],
+        events: Sequence[EventOccurrence],
+        member_ids: Sequence[int],
+        week_start: date
+) -> Dict[int, Dict[int, List[Interval]]]:
+    """요일 → 멤버 → 바쁜 구간 목록"""
+    buckets: Dict[int, Dict[int, List[Interval]]] = defaultdict(lambda: defaultdict(list))
+
+    for s in schedules:
+        buckets[s.day_of_week][s.user_id].append(schedule_interval(s))
+
+    # 프로젝트 일정(회의 등)은 해당 주에 한해 모든 멤버가 바쁜 것으로 간주
+    for day, start, end in event_day_intervals(events, week_start):
+        for member_id in member_ids:
+            buckets[day][member_id].append((start, end))
+
+    return buckets
+
+
+def event_day_intervals(events: Sequence[EventOccurrence], week_start: date) -> Iterable[Tuple[int, int, int]]:
+    """프로젝트 일정을 해당 주 안에서 하루 단위 (요일, 시작분, 종료분)으로 자름"""
+    week_begin = datetime.combine(week_start, time.min)
+    week_end = week_begin + timedelta(days=7)
+    for event in events:
+        start = max(event.start_datetime, week_begin)
+        end = min(event.end_datetime, week_end)
+        # 여러 날에 걸친 일정은 하루 단위로 잘라서 넣음
+        while start < end:
+            day_end = datetime.combine(start.date() + timedelta(days=1), time.min)
+            segment_end = min(end, day_end)
+            yield (
+                start.weekday(),
+                time_to_minutes(start.time()),
+                MINUTES_PER_DAY if segment_end == day_end else time_to_minutes(segment_end.time())
+            )
+            start = segment_end
+
+
+def schedule_interval(schedule: Schedule) -> Interval:
+    start, end = time_to_minutes(schedule.start_time), time_to_minutes(schedule.end_time)
+    if end <= start:  # 자정을 넘기는 수업
+        end = MINUTES_PER_DAY
+    return start, end
+
+
+def compute_free_slots(
+        busy: Dict[int, Dict[int, List[Interval]]],
+        member_ids: Sequence[int],
+        query: FreeTimeQuery
+) -> List[FreeSlot]:
+    member_set = set(member_ids)
+    quorum = query.quorum or len(member_set)
+    window = (query.window_start, query.window_end)
+
+    result: List[FreeSlot] = []
+    for day in sorted(set(query.days)):
+        day_busy = {uid: intervals for uid, intervals in busy.get(day, {}).items() if uid in member_set}
+        for start, end, available in quorum_free_slots(day_busy, len(member_set), window, quorum):
+            if end - start >= query.min_minutes:
+                result.append(FreeSlot(day, start, end, available))
+    return result
+
+
+# -----------------------------------------------------------------
+# 3. 워크스페이스 단위 캐시
+# - 멤버 시간표/프로젝트 일정/멤버 구성이 바뀌면 해당 워크스페이스 캐시를 비웁니다.
+# - 워커가 여러 개면 다른 워커의 캐시는 무효화되지 않으므로 TTL을 짧게 둡니다.
+# - 조회 조건 조합이 제각각이라 항목 수를 CACHE_MAX_ENTRIES로 묶음 (오래 안 쓴 것부터 제거)
+# -----------------------------------------------------------------
+CACHE_TTL_SECONDS = 300
+CACHE_MAX_ENTRIES = 1024
+
+
+class FreeTimeCache:
+    def __init__(self, ttl: int = CACHE_TTL_SECONDS, max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries: "OrderedDict[Tuple[int, FreeTimeQuery], Tuple[float, List[FreeSlot]]]" = OrderedDict()
+
+    def get(self, workspace_id: int, query: FreeTimeQuery) -> Optional[List[FreeSlot]]:
+        key = (workspace_id, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time_module.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, workspace_id: int, query: FreeTimeQuery, slots: List[FreeSlot]):
+        with self._lock:
+            key = (workspace_id, query)
+            self._entries[key] = (time_module.monotonic() + self.ttl, slots)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, workspace_id: int):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == workspace_id]:
+                del self._entries[key]
+
+
+free_time_cache = FreeTimeCache()
+
+
+def invalidate_workspace(workspace_id: int):
+    free_time_cache.invalidate(workspace_id)
+
+
+def invalidate_user(db: Session, user_id: int):
+    """개인 시간표가 바뀐 유저가 속한 모든 워크스페이스의 캐시를 비움"""
+    workspace_ids = db.exec(
+        select(WorkspaceMember.workspace_id).where(WorkspaceMember.user_id == user_id)
+    ).all()
+    for workspace_id in workspace_ids:
+        free_time_cache.invalidate(workspace_id)
+
+
+def invalidate_project(db: Session, project_id: int):
+    project = db.get(Project, project_id)
+    if project:
+        free_time_cache.invalidate(project.workspace_id)
+
+
+# -----------------------------------------------------------------
+# 4. 진입점
+# -----------------------------------------------------------------
+def get_week_events(db: Session, workspace_id: int, week_start: date) -> List[EventOccurrence]:
+    """워크스페이스의 모든 프로젝트 일정 중 해당 주와 겹치는 회차 (반복 일정은 펼쳐서)"""
+    week_begin = datetime.combine(week_start, time.min)
+    week_end = week_begin + timedelta(days=7)
+    events = db.exec(
+        select(ProjectEvent)
+        .join(Project, Project.id == ProjectEvent.project_id)
+        .where(Project.workspace_id == workspace_id)
+        .where(recurrence.overlaps_window(week_begin, week_end))
+    ).all()
+    return recurrence.expand_events(events, week_begin, week_end)
+
+
+def get_workspace_free_slots(
+        db: Session,
+        workspace_id: int,
+        all_member_ids: Sequence[int],
+        query: FreeTimeQuery
+) -> List[FreeSlot]:
+    # 주가 바뀌면 다른 캐시 키가 되도록 기준 주를 먼저 확정
+    query = replace(query, week_start=week_monday(query.week_start))
+    cached = free_time_cache.get(workspace_id, query)
+    if cached is not None:
+        return cached
+
+    member_ids = list(query.member_ids or all_member_ids)
+    week_start = query.week_start
+
+    schedules = db.exec(
+        select(Schedule)
+        .where(Schedule.user_id.in_(member_ids))
+        .where(Schedule.day_of_week.in_(query.days))
+    ).all()
+    events = get_week_events(db, workspace_id, week_start)
+
+    busy = bucket_busy_intervals(schedules, events, member_ids, week_start)
+    slots = compute_free_slots(busy, member_ids, query)
+
+    free_time_cache.set(workspace_id, query, slots)
+    return slots
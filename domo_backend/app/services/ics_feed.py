@@ -0,0 +1,93 @@
+# app/services/ics_feed.py
+
+from datetime import datetime
+from typing import Iterator
+
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models.schedule import ProjectEvent
+
+# =================================================================
+# 📆 ICS(iCalendar, RFC 5545) 피드
+# 일정 수와 상관없이 메모리를 일정하게 쓰도록 DB에서 조금씩 읽어 바로 내보냅니다.
+# (응답이 끝날 때까지 요청 세션을 잡고 있지 않도록 전용 세션 사용)
+# =================================================================
+
+ICS_FETCH_SIZE = 200
+PRODID = "-//DOMO//Project Calendar//KO"
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """한 줄이 75바이트를 넘으면 CRLF + 공백으로 접기 (UTF-8 글자 중간에서 자르지 않음)"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts, current, size = [], "", 0
+    limit = 75
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > limit:
+            parts.append(current)
+            current, size, limit = "", 0, 74  # 이어지는 줄은 앞의 공백 1바이트 제외
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _format_datetime(value: datetime) -> str:
+    # 서버는 naive(로컬) 시각을 저장하므로 floating time으로 내보냄
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def event_to_ics(event: ProjectEvent, stamp: str) -> str:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:project-event-{event.id}@domo",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{_format_datetime(event.start_datetime)}",
+        f"DTEND:{_format_datetime(event.end_datetime)}",
+        f"SUMMARY:{_escape(event.title)}",
+    ]
+    if event.description:
+        lines.append(f"DESCRIPTION:{_escape(event.description)}")
+    if event.recurrence_rule:
+        lines.append(f"RRULE:{event.recurrence_rule}")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+def stream_project_calendar(project_id: int, calendar_name: str) -> Iterator[str]:
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+
+    yield "".join(_fold(line) for line in [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_escape(calendar_name)}",
+    ])
+
+    with Session(engine) as db:
+        events = db.exec(
+            select(ProjectEvent)
+            .where(ProjectEvent.project_id == project_id)
+            .order_by(ProjectEvent.start_datetime)
+            .execution_options(yield_per=ICS_FETCH_SIZE)
+        )
+        for event in events:
+            yield event_to_ics(event, stamp)
+
+    yield "END:VCALENDAR\r\n"
@@ -0,0 +1,203 @@
+# app/services/meeting_suggestions.py
+
+import heapq
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlmodel import Session, select
+
+from app.models.board import Card
+from app.models.schedule import ProjectEvent, Schedule
+from app.models.workspace import Project
+from app.services import recurrence
+from app.services.free_time import (
+    Interval, bucket_busy_intervals, busy_segments, merge_intervals, minutes_to_time
+)
+
+# =================================================================
+# 🤝 회의 시간 추천
+# 후보 시간(step 간격)마다 점수를 매기고 작은 최소 힙(k × CANDIDATE_POOL_FACTOR)으로 상위 후보만 유지합니다.
+#   점수 = 참석 가능 비율 × W_AVAILABILITY
+#        + 곧 마감되는 카드와의 근접도 × W_DUE_DATE   (마감 직전 점검 회의 우대)
+#        + 빠른 날짜 가산점 × W_EARLINESS
+#        - 기존 프로젝트 일정과 겹치는 비율 × W_EVENT_OVERLAP
+# 시간표로 바쁜 인원은 free_time의 스윕 라인 구간(인원 수가 일정한 구간)으로 계산합니다.
+# =================================================================
+
+W_AVAILABILITY = 0.6
+W_DUE_DATE = 0.25
+W_EARLINESS = 0.05
+W_EVENT_OVERLAP = 0.4
+
+# 회의 후 이 기간 안에 마감되는 카드를 근접도 계산에 반영
+DUE_HORIZON = timedelta(days=3)
+DUE_DECAY_HOURS = 24.0
+
+# 서로 겹치지 않는 결과를 고르기 위해 k의 몇 배까지 후보를 유지할지
+CANDIDATE_POOL_FACTOR = 4
+
+
+@dataclass
+class MeetingOptions:
+    duration_minutes: int = 60
+    start_date: Optional[date] = None
+    days_ahead: int = 7
+    window_start: int = 9 * 60
+    window_end: int = 22 * 60
+    min_available: Optional[int] = None
+    project_id: Optional[int] = None
+    top_k: int = 5
+    step_minutes: int = 30
+
+
+@dataclass
+class MeetingCandidate:
+    start_datetime: datetime
+    end_datetime: datetime
+    score: float
+    available_count: int
+    member_count: int
+    overlapping_event_minutes: int
+    upcoming_due_count: int
+
+
+def _min_available(segments: List[Tuple[int, int, int]], start: int, end: int, member_count: int, first: int) -> int:
+    """[start, end)에 걸친 구간들 중 가장 적은 가용 인원 (first: start를 포함하는 구간 위치)"""
+    worst_busy = 0
+    index = first
+    while index < len(segments) and segments[index][0] < end:
+        worst_busy = max(worst_busy, segments[index][2])
+        index += 1
+    return member_count - worst_busy
+
+
+def _overlap_minutes(intervals: List[Interval], start: int, end: int) -> int:
+    total = 0
+    for busy_start, busy_end in intervals:
+        if busy_start >= end:
+            break
+        total += max(0, min(end, busy_end) - max(start, busy_start))
+    return total
+
+
+def _due_proximity(due_timestamps: List[float], meeting_end: datetime) -> Tuple[float, int]:
+    """회의가 끝난 뒤 DUE_HORIZON 안에 마감되는 카드들에 대한 근접도 (0~1)와 개수"""
+    begin = meeting_end.timestamp()
+    lo = bisect_left(due_timestamps, begin)
+    hi = bisect_right(due_timestamps, begin + DUE_HORIZON.total_seconds())
+    weight = sum(
+        math.exp(-(due_timestamps[i] - begin) / 3600 / DUE_DECAY_HOURS)
+        for i in range(lo, hi)
+    )
+    return 1 - math.exp(-weight), hi - lo
+
+
+def suggest_meetings(
+        db: Session,
+        workspace_id: int,
+        member_ids: Sequence[int],
+        options: MeetingOptions,
+        now: Optional[datetime] = None
+) -> List[MeetingCandidate]:
+    now = now or datetime.now()
+    first_day = options.start_date or now.date()
+    range_begin = datetime.combine(first_day, time.min)
+    range_end = range_begin + timedelta(days=options.days_ahead)
+    member_count = len(member_ids)
+    quorum = options.min_available or member_count
+    window = (options.window_start, options.window_end)
+
+    # 1. 데이터 로드 (시간표 / 기간 내 프로젝트 일정 / 마감일)
+    project_filter = (
+        [Project.id == options.project_id] if options.project_id else [Project.workspace_id == workspace_id]
+    )
+    schedules = db.exec(select(Schedule).where(Schedule.user_id.in_(member_ids))).all()
+    events = db.exec(
+        select(ProjectEvent)
+        .join(Project, Project.id == ProjectEvent.project_id)
+        .where(*project_filter)
+        .where(recurrence.overlaps_window(range_begin, range_end))
+    ).all()
+    due_dates = db.exec(
+        select(Card.due_date)
+        .join(Project, Project.id == Card.project_id)
+        .where(*project_filter)
+        .where(Card.due_date >= range_begin)
+        .where(Card.due_date < range_end + DUE_HORIZON)
+    ).all()
+    due_timestamps = sorted(d.timestamp() for d in due_dates)
+
+    # 요일별 시간표 (한 번의 순회로 버킷팅) / 날짜별 일정 구간
+    busy_by_day = bucket_busy_intervals(schedules, [], member_ids, first_day)
+    events_by_date: Dict[date, List[Interval]] = {}
+    for occurrence in recurrence.expand_events(events, range_begin, range_end):
+        current = occurrence.start_datetime
+        while current < occurrence.end_datetime:
+            day_end = datetime.combine(current.date() + timedelta(days=1), time.min)
+            segment_end = min(occurrence.end_datetime, day_end)
+            start_min = current.hour * 60 + current.minute
+            end_min = 24 * 60 if segment_end == day_end else segment_end.hour * 60 + segment_end.minute
+            events_by_date.setdefault(current.date(), []).append((start_min, end_min))
+            current = segment_end
+
+    # 2. 후보 생성 + 상위 후보만 힙에 유지
+    pool_size = options.top_k * CANDIDATE_POOL_FACTOR
+    heap: List[Tuple[float, float, MeetingCandidate]] = []
+    duration = options.duration_minutes
+    total_minutes = options.days_ahead * 24 * 60
+
+    for offset in range(options.days_ahead):
+        day = first_day + timedelta(days=offset)
+        segments = busy_segments(busy_by_day.get(day.weekday(), {}), window)
+        day_events = merge_intervals(events_by_date.get(day, []))
+
+        segment_index = 0
+        start = options.window_start
+        while start + duration <= options.window_end:
+            while segments[segment_index][1] <= start:
+                segment_index += 1
+
+            start_dt = datetime.combine(day, minutes_to_time(start))
+            if start_dt >= now:
+                available = _min_available(segments, start, start + duration, member_count, segment_index)
+                if available >= quorum:
+                    overlap = _overlap_minutes(day_events, start, start + duration)
+                    end_dt = start_dt + timedelta(minutes=duration)
+                    due_score, due_count = _due_proximity(due_timestamps, end_dt)
+                    minutes_from_begin = offset * 24 * 60 + start
+                    score = (
+                        W_AVAILABILITY * available / member_count
+                        + W_DUE_DATE * due_score
+                        + W_EARLINESS * (1 - minutes_from_begin / total_minutes)
+                        - W_EVENT_OVERLAP * overlap / duration
+                    )
+                    candidate = MeetingCandidate(
+                        start_datetime=start_dt,
+                        end_datetime=end_dt,
+                        score=round(score, 4),
+                        available_count=available,
+                        member_count=member_count,
+                        overlapping_event_minutes=overlap,
+                        upcoming_due_count=due_count
+                    )
+                    # 동점이면 더 이른 후보 우선 (-시각을 두 번째 키로)
+                    item = (score, -start_dt.timestamp(), candidate)
+                    if len(heap) < pool_size:
+                        heapq.heappush(heap, item)
+                    elif item[:2] > heap[0][:2]:
+                        heapq.heapreplace(heap, item)
+
+            start += options.step_minutes
+
+    # 3. 점수 순으로 정렬 후 서로 겹치지 않는 k개 선택
+    ranked = [item[2] for item in sorted(heap, key=lambda item: item[:2], reverse=True)]
+    picked: List[MeetingCandidate] = []
+    for candidate in ranked:
+        if all(candidate.end_datetime <= p.start_datetime or candidate.start_datetime >= p.end_datetime for p in picked):
+            picked.append(candidate)
+            if len(picked) >= options.top_k:
+                break
+    return picked
@@ -0,0 +1,293 @@
+# app/services/recommendation.py
+
+import math
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.models.match import (
+    Application, ApplicationStatus, PositionSlot, Recruitment, RecruitmentPosition,
+    RecruitmentStatus, RecruitmentTechStack
+)
+
+# =================================================================
+# 🎯 모집 공고 추천
+# 공고마다 (기술 스택 + 아직 자리가 남은 포지션) 희소 벡터를 미리 만들어 두고,
+# 사용자의 지난 지원 이력으로 만든 선호 벡터와의 코사인 유사도를 한 번의 벡터 연산으로 계산합니다.
+#   점수 = 코사인 유사도 × W_SIMILARITY
+#        + 지원 이력 중 같은 지역 비율 × W_REGION
+#        + 최신 가산점(반감기 RECENCY_HALF_LIFE_DAYS) × W_RECENCY
+# - 공고 벡터(CSR: data / indices / indptr)는 공고가 바뀌거나 CACHE_TTL_SECONDS가 지나면 다시 만듭니다.
+# - 사용자별 상위 N개는 캐시하고, 공고가 바뀌면(버전 증가) 또는 본인이 지원하면 무효화합니다.
+# - 캐시는 워커 프로세스별이라 다른 워커의 변경은 인덱스 TTL(CACHE_TTL_SECONDS) 안에 반영됩니다.
+#   (사용자별 결과도 계산에 쓴 인덱스보다 오래 남지 않음)
+# =================================================================
+
+W_SIMILARITY = 0.7
+W_REGION = 0.15
+W_RECENCY = 0.15
+RECENCY_HALF_LIFE_DAYS = 14.0
+
+# 지원 결과별 선호 가중치 (거절된 지원도 관심의 표시이므로 약하게 반영)
+APPLICATION_WEIGHTS = {
+    ApplicationStatus.accepted: 1.0,
+    ApplicationStatus.pending: 1.0,
+    ApplicationStatus.rejected: 0.5,
+}
+
+CACHE_TOP_N = 50
+CACHE_TTL_SECONDS = int(os.getenv("RECOMMENDATION_CACHE_TTL", "600"))
+
+POSITIONS = list(RecruitmentPosition)
+OPEN_STATUSES = (RecruitmentStatus.recruiting, RecruitmentStatus.closing_soon)
+
+
+@dataclass
+class RecruitmentIndex:
+    """모집 중인 공고들의 희소 특징 행렬 (행 = 공고, 열 = 기술 스택들 + 포지션들)"""
+    ids: np.ndarray            # (n,) 공고 id
+    owner_ids: np.ndarray      # (n,) 작성자 id
+    regions: np.ndarray        # (n,) 지역 문자열
+    created_at: np.ndarray     # (n,) 작성 시각 (epoch 초)
+    data: np.ndarray           # CSR 값 (행마다 L2 정규화)
+    indices: np.ndarray        # CSR 열 번호
+    indptr: np.ndarray         # (n + 1,) 행 경계
+    stack_columns: Dict[int, int]
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    def position_column(self, position: RecruitmentPosition) -> int:
+        return len(self.stack_columns) + POSITIONS.index(position)
+
+    @property
+    def dimension(self) -> int:
+        return len(self.stack_columns) + len(POSITIONS)
+
+
+def build_index(db: Session) -> RecruitmentIndex:
+    rows = db.exec(
+        select(Recruitment.id, Recruitment.user_id, Recruitment.region, Recruitment.created_at)
+        .where(Recruitment.status.in_(OPEN_STATUSES))
+        .order_by(Recruitment.id)
+    ).all()
+    ids = [row[0] for row in rows]
+
+    features: Dict[int, List[int]] = {rid: [] for rid in ids}
+    stack_columns: Dict[int, int] = {}
+    if ids:
+        for rid, stack_id in db.exec(
+            select(RecruitmentTechStack.recruitment_id, RecruitmentTechStack.tech_stack_id)
+            .where(RecruitmentTechStack.recruitment_id.in_(ids))
+        ).all():
+            column = stack_columns.setdefault(stack_id, len(stack_columns))
+            features[rid].append(column)
+
+        open_slots = db.exec(
+            select(PositionSlot.recruitment_id, PositionSlot.position)
+            .where(PositionSlot.recruitment_id.in_(ids))
+            .where(PositionSlot.filled < PositionSlot.total)
+        ).all()
+    else:
+        open_slots = []
+
+    index = RecruitmentIndex(
+        ids=np.array(ids, dtype=np.int64),
+        owner_ids=np.array([row[1] for row in rows], dtype=np.int64),
+        regions=np.array([str(getattr(row[2], "value", row[2])) for row in rows], dtype=object),
+        created_at=np.array([row[3].timestamp() for row in rows], dtype=np.float64),
+        data=np.empty(0, dtype=np.float32),
+        indices=np.empty(0, dtype=np.int64),
+        indptr=np.zeros(len(ids) + 1, dtype=np.int64),
+        stack_columns=stack_columns,
+    )
+    for rid, position in open_slots:
+        features[rid].append(index.position_column(position))
+
+    # CSR 조립 (한 공고에 같은 특징이 두 번 들어가지 않도록 중복 제거)
+    columns = [sorted(set(features[rid])) for rid in ids]
+    lengths = np.array([len(c) for c in columns], dtype=np.int64)
+    index.indptr[1:] = np.cumsum(lengths)
+    index.indices = np.fromiter((c for row in columns for c in row), dtype=np.int64, count=int(lengths.sum()))
+    # 특징 값이 모두 1이므로 L2 정규화된 값은 1 / sqrt(특징 수)
+    norms = np.where(lengths > 0, 1.0 / np.sqrt(np.maximum(lengths, 1)), 0.0)
+    index.data = np.repeat(norms, lengths).astype(np.float32)
+    return index
+
+
+@dataclass
+class UserProfile:
+    weights: Dict[Tuple[str, int], float]   # ("stack", tech_stack_id) / ("position", index) → 가중치
+    region_share: Dict[str, float]
+    applied_ids: set
+
+
+def build_profile(db: Session, user_id: int) -> UserProfile:
+    applications = db.exec(
+        select(Application.recruitment_id, Application.position, Application.status, Recruitment.region)
+        .join(Recruitment, Recruitment.id == Application.recruitment_id)
+        .where(Application.user_id == user_id)
+    ).all()
+
+    weights: Dict[Tuple[str, int], float] = {}
+    region_weights: Dict[str, float] = {}
+    weight_by_recruitment: Dict[int, float] = {}
+    for rid, position, status, region in applications:
+        weight = APPLICATION_WEIGHTS.get(status, 1.0)
+        weight_by_recruitment[rid] = weight
+        key = ("position", POSITIONS.index(position))
+        weights[key] = weights.get(key, 0.0) + weight
+        region_key = str(getattr(region, "value", region))
+        region_weights[region_key] = region_weights.get(region_key, 0.0) + weight
+
+    if weight_by_recruitment:
+        for rid, stack_id in db.exec(
+            select(RecruitmentTechStack.recruitment_id, RecruitmentTechStack.tech_stack_id)
+            .where(RecruitmentTechStack.recruitment_id.in_(list(weight_by_recruitment)))
+        ).all():
+            key = ("stack", stack_id)
+            weights[key] = weights.get(key, 0.0) + weight_by_recruitment[rid]
+
+    total_region = sum(region_weights.values()) or 1.0
+    return UserProfile(
+        weights=weights,
+        region_share={region: w / total_region for region, w in region_weights.items()},
+        applied_ids=set(weight_by_recruitment)
+    )
+
+
+def score_recruitments(index: RecruitmentIndex, profile: UserProfile, user_id: int, now: float) -> np.ndarray:
+    """모든 모집 중 공고의 점수를 한 번에 계산 (제외 대상은 -inf)"""
+    if index.size == 0:
+        return np.empty(0, dtype=np.float64)
+
+    # 사용자 선호 벡터 (dense, 공고 인덱스와 같은 열 배치)
+    user_vector = np.zeros(index.dimension, dtype=np.float64)
+    for (kind, key), weight in profile.weights.items():
+        if kind == "stack":
+            column = index.stack_columns.get(key)
+            if column is None:
+                continue
+        else:
+            column = len(index.stack_columns) + key
+        user_vector[column] = weight
+    user_norm = np.linalg.norm(user_vector)
+
+    # 코사인 유사도: 행마다 sum(data × u[indices]) — 빈 행은 reduceat 결과를 쓰지 않음
+    similarity = np.zeros(index.size, dtype=np.float64)
+    if user_norm > 0 and len(index.data):
+        products = index.data * user_vector[index.indices]
+        non_empty = index.indptr[1:] > index.indptr[:-1]
+        sums = np.add.reduceat(products, index.indptr[:-1][non_empty])
+        similarity[non_empty] = sums / user_norm
+
+    region = np.array([profile.region_share.get(r, 0.0) for r in index.regions], dtype=np.float64)
+    age_days = np.maximum(now - index.created_at, 0) / 86400
+    recency = np.exp(-math.log(2) * age_days / RECENCY_HALF_LIFE_DAYS)
+
+    scores = W_SIMILARITY * similarity + W_REGION * region + W_RECENCY * recency
+
+    # 본인 글 / 이미 지원한 글 제외
+    excluded = index.owner_ids == user_id
+    if profile.applied_ids:
+        excluded |= np.isin(index.ids, np.fromiter(profile.applied_ids, dtype=np.int64))
+    scores[excluded] = -np.inf
+    return scores
+
+
+def top_k(index: RecruitmentIndex, scores: np.ndarray, k: int) -> List[Tuple[int, float]]:
+    candidates = np.flatnonzero(np.isfinite(scores))
+    if len(candidates) > k:
+        # 전체 정렬 대신 상위 k개만 골라낸 뒤 그 안에서 정렬
+        candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    # 점수 내림차순, 동점이면 최신 공고 우선
+    order = np.lexsort((-index.ids[candidates], -scores[candidates]))
+    return [(int(index.ids[i]), round(float(scores[i]), 4)) for i in candidates[order]]
+
+
+# -----------------------------------------------------------------
+# 캐시 (공고 인덱스 1개 + 사용자별 상위 N)
+# -----------------------------------------------------------------
+class RecommendationCache:
+    def __init__(self, ttl: int = CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = Lock()
+        self._version = 0
+        self._index: Optional[Tuple[int, float, RecruitmentIndex]] = None  # (버전, 만료 시각, 인덱스)
+        self._users: Dict[int, Tuple[int, float, List[Tuple[int, float]]]] = {}
+
+    def index(self, db: Session) -> Tuple[int, RecruitmentIndex]:
+        with self._lock:
+            if self._index and self._index[1] <= time.monotonic():
+                # TTL 만료 → 다른 워커에서 바뀐 공고를 반영하도록 사용자 캐시까지 함께 무효화
+                self._bump()
+            version, cached = self._version, self._index
+        if cached and cached[0] == version:
+            return version, cached[2]
+        index = build_index(db)
+        with self._lock:
+            # 만드는 동안 공고가 또 바뀌었으면 저장하지 않음 (다음 요청에서 다시 만듦)
+            if self._version == version:
+                self._index = (version, time.monotonic() + self.ttl, index)
+        return version, index
+
+    def get_user(self, user_id: int) -> Optional[List[Tuple[int, float]]]:
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry and entry[0] == self._version and entry[1] > time.monotonic():
+                return entry[2]
+        return None
+
+    def set_user(self, user_id: int, version: int, ranked: List[Tuple[int, float]]):
+        with self._lock:
+            if version == self._version:
+                # 계산에 쓴 인덱스보다 오래 남지 않도록 인덱스 만료 시각을 넘기지 않음
+                expires_at = time.monotonic() + self.ttl
+                if self._index and self._index[0] == version:
+                    expires_at = min(expires_at, self._index[1])
+                self._users[user_id] = (version, expires_at, ranked)
+
+    def _bump(self):
+        self._version += 1
+        self._index = None
+        self._users.clear()
+
+    def invalidate_recruitments(self):
+        with self._lock:
+            self._bump()
+
+    def invalidate_user(self, user_id: int):
+        with self._lock:
+            self._users.pop(user_id, None)
+
+
+recommendation_cache = RecommendationCache()
+
+
+def invalidate_recruitments():
+    """공고 생성/수정/삭제/상태 변경, 포지션 충원 시 호출"""
+    recommendation_cache.invalidate_recruitments()
+
+
+def invalidate_user(user_id: int):
+    """사용자가 지원하거나 지원을 취소하면 호출 (선호 벡터가 바뀜)"""
+    recommendation_cache.invalidate_user(user_id)
+
+
+def recommend(db: Session, user_id: int, limit: int = 20) -> List[Tuple[int, float]]:
+    """(공고 id, 점수) 목록 — 상위 CACHE_TOP_N개를 캐시해 두고 앞에서 limit개를 잘라 씀"""
+    ranked = recommendation_cache.get_user(user_id)
+    if ranked is None:
+        version, index = recommendation_cache.index(db)
+        profile = build_profile(db, user_id)
+        scores = score_recruitments(index, profile, user_id, datetime.now().timestamp())
+        ranked = top_k(index, scores, CACHE_TOP_N)
+        recommendation_cache.set_user(user_id, version, ranked)
+    return ranked[:limit]
@@ -0,0 +1,140 @@
+# app/services/recruitment_scheduler.py
+
+import os
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import text, update
+
+from app.database import engine
+from app.models.match import Recruitment, RecruitmentStatus
+from app.services import recommendation
+from app.utils.connection_manager import match_event_manager
+
+# =================================================================
+# ⏳ 모집 마감 스케줄러
+# 마감일(deadline)이 다가오거나 지난 공고의 상태를 주기적으로 한 번에 바꿉니다.
+#   recruiting                → closing_soon  (마감 CLOSING_SOON_HOURS 전부터)
+#   recruiting / closing_soon → closed        (마감일이 지나면)
+# - 공고마다 읽고 쓰지 않고 deadline 인덱스를 타는 UPDATE ... RETURNING 두 번으로 처리
+# - 바뀐 공고 id는 /match/ws 로 브로드캐스트하고 추천 인덱스를 무효화
+#   단, 둘 다 잠금을 잡고 실행한 워커 안에서만 일어납니다.
+#   · 다른 워커의 추천 캐시는 인덱스 TTL(RECOMMENDATION_CACHE_TTL, 기본 600초) 안에 다시 만들어져
+#     마감된 공고가 빠짐 → 마감 후 추천에 남는 시간 ≤ STATUS_INTERVAL_SECONDS + 추천 TTL
+#   · 다른 워커에 붙은 /match/ws 클라이언트는 이 이벤트를 받지 못하므로 목록을 다시 조회해야 함
+# - 마감일이 지난 공고를 다시 열려면 deadline을 늘려야 합니다 (다음 주기에 다시 closed 처리됨)
+# =================================================================
+
+STATUS_INTERVAL_SECONDS = int(os.getenv("RECRUITMENT_STATUS_INTERVAL_SECONDS", "300"))
+CLOSING_SOON_HOURS = int(os.getenv("RECRUITMENT_CLOSING_SOON_HOURS", "72"))
+STATUS_LOCK_KEY = 710_044  # pg_advisory_lock 키 (여러 워커 중 하나만 실행)
+
+
+@dataclass
+class StatusTransitions:
+    closing_soon: List[int] = field(default_factory=list)
+    closed: List[int] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.closing_soon or self.closed)
+
+
+def apply_deadlines(conn, now: Optional[datetime] = None) -> StatusTransitions:
+    now = now or datetime.now()
+    transitions = StatusTransitions()
+
+    # 1. 마감일이 지난 공고 → closed
+    transitions.closed = list(conn.execute(
+        update(Recruitment)
+        .where(Recruitment.status.in_((RecruitmentStatus.recruiting, RecruitmentStatus.closing_soon)))
+        .where(Recruitment.deadline <= now)
+        .values(status=RecruitmentStatus.closed, updated_at=now)
+        .returning(Recruitment.id)
+    ).scalars())
+
+    # 2. 마감 임박 공고 → closing_soon
+    transitions.closing_soon = list(conn.execute(
+        update(Recruitment)
+        .where(Recruitment.status == RecruitmentStatus.recruiting)
+        .where(Recruitment.deadline > now)
+        .where(Recruitment.deadline <= now + timedelta(hours=CLOSING_SOON_HOURS))
+        .values(status=RecruitmentStatus.closing_soon, updated_at=now)
+        .returning(Recruitment.id)
+    ).scalars())
+
+    return transitions
+
+
+def run_once(now: Optional[datetime] = None) -> StatusTransitions:
+    """다른 워커가 이미 실행 중이면 건너뜀 (PostgreSQL advisory lock)"""
+    with engine.connect() as conn:
+        use_lock = engine.dialect.name == "postgresql"
+        if use_lock:
+            acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": STATUS_LOCK_KEY}).scalar()
+            conn.commit()  # 세션 단위 잠금이라 트랜잭션을 끝내도 유지됨
+            if not acquired:
+                return StatusTransitions()
+
+        try:
+            with conn.begin():
+                transitions = apply_deadlines(conn, now)
+        finally:
+            if use_lock:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": STATUS_LOCK_KEY})
+                conn.commit()
+
+    if transitions.changed:
+        recommendation.invalidate_recruitments()
+        print(
+            f"⏳ [Recruitment Status] closing_soon={len(transitions.closing_soon)} closed={len(transitions.closed)}",
+            flush=True
+        )
+    return transitions
+
+
+async def broadcast(transitions: StatusTransitions):
+    for status, ids in (
+        (RecruitmentStatus.closing_soon, transitions.closing_soon),
+        (RecruitmentStatus.closed, transitions.closed),
+    ):
+        if ids:
+            await match_event_manager.broadcast({
+                "type": "RECRUITMENT_STATUS_CHANGED",
+                "data": {"status": status.value, "recruitment_ids": ids}
+            })
+
+
+# =================================================================
+# ⏰ 주기 실행 (main.py lifespan에서 시작/종료)
+# =================================================================
+_task = None
+
+
+async def _loop():
+    while True:
+        try:
+            transitions = await asyncio.to_thread(run_once)
+            await broadcast(transitions)
+        except Exception as e:
+            print(f"❌ [Recruitment Status] Failed: {e}", flush=True)
+        await asyncio.sleep(STATUS_INTERVAL_SECONDS)
+
+
+def start():
+    global _task
+    if STATUS_INTERVAL_SECONDS > 0 and _task is None:
+        _task = asyncio.create_task(_loop())
+
+
+async def stop():
+    global _task
+    if _task:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
@@ -0,0 +1,184 @@
+# app/services/recruitment_search.py
+
+import json
+import base64
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import Numeric, and_, cast, exists, func, literal, or_, tuple_
+from sqlmodel import Session
+
+from app.models.match import (
+    PositionSlot, Recruitment, RecruitmentPosition, RecruitmentTechStack, TechStack
+)
+from app.services.search import like_pattern
+
+# =================================================================
+# 🔍 모집 공고 검색 / 커서 페이지네이션
+# - 제목/설명 ILIKE와 word_similarity(오타 허용)를 pg_trgm GIN 인덱스로 처리
+# - 검색어가 있으면 관련도(제목 가중치 2배) → 최신순, 없으면 최신순
+# - OFFSET 대신 마지막 행의 (관련도, created_at, id)를 커서로 넘겨 다음 페이지를 가져옴
+#   → 글이 많아져도 뒤쪽 페이지 비용이 일정
+# - 포지션/기술 스택 필터는 EXISTS 서브쿼리라 JOIN으로 행이 불어나지 않고
+#   LIMIT이 그대로 한 페이지가 됨 (any: 하나라도 / all: 모두 포함)
+# =================================================================
+
+TITLE_WEIGHT = 2
+MAX_FILTER_VALUES = 10
+MATCH_MODES = ("any", "all")
+
+RECRUITMENT_SCHEMA_STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    # 목록 필터 + 최신순 정렬 (status = ? AND region = ? AND category = ? ORDER BY created_at DESC)
+    "CREATE INDEX IF NOT EXISTS ix_recruitments_status_region_category_created "
+    "ON recruitments (status, region, category, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_recruitments_title_trgm ON recruitments USING GIN (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_recruitments_description_trgm ON recruitments USING GIN (description gin_trgm_ops)",
+    # 포지션 필터 EXISTS (recruitment_id = ? AND position IN (...))
+    "CREATE INDEX IF NOT EXISTS ix_position_slots_recruitment_position ON position_slots (recruitment_id, position)",
+    # 기술 스택 필터 EXISTS는 recruitment_tech_stacks PK(recruitment_id, tech_stack_id)와 tech_stacks.name 인덱스 사용
+]
+
+
+class RecruitmentQueryError(ValueError):
+    pass
+
+
+def split_values(value: Optional[str]) -> List[str]:
+    """'react,vue' / 'react, vue' → ['react', 'vue'] (중복 제거, 순서 유지)"""
+    if not value:
+        return []
+    values = list(dict.fromkeys(v.strip() for v in value.split(",") if v.strip()))
+    if len(values) > MAX_FILTER_VALUES:
+        raise RecruitmentQueryError(f"필터 값은 최대 {MAX_FILTER_VALUES}개까지 지정할 수 있습니다.")
+    return values
+
+
+def _check_mode(mode: str):
+    if mode not in MATCH_MODES:
+        raise RecruitmentQueryError("매칭 방식은 any 또는 all 이어야 합니다.")
+
+
+def position_filter(positions: Sequence[str], mode: str = "any"):
+    """해당 포지션 슬롯이 있는 공고 (any: 하나라도 / all: 모두)"""
+    _check_mode(mode)
+    try:
+        values = [RecruitmentPosition(p) for p in positions]
+    except ValueError:
+        raise RecruitmentQueryError("알 수 없는 포지션이 포함되어 있습니다.")
+
+    def has_position(condition):
+        return exists().where(PositionSlot.recruitment_id == Recruitment.id, condition)
+
+    if mode == "any":
+        return has_position(PositionSlot.position.in_(values))
+    return and_(*[has_position(PositionSlot.position == v) for v in values])
+
+
+def tech_stack_filter(names: Sequence[str], mode: str = "any"):
+    """해당 기술 스택이 연결된 공고 (any: 하나라도 / all: 모두)"""
+    _check_mode(mode)
+
+    def has_stack(condition):
+        return exists().where(
+            RecruitmentTechStack.recruitment_id == Recruitment.id,
+            TechStack.id == RecruitmentTechStack.tech_stack_id,
+            condition
+        )
+
+    if mode == "any":
+        return has_stack(TechStack.name.in_(names))
+    return and_(*[has_stack(TechStack.name == name) for name in names])
+
+
+def encode_cursor(score: Optional[float], created_at: datetime, id_: int) -> str:
+    raw = json.dumps([score, created_at.isoformat(), id_], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[float], datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, created_at, id_ = json.loads(base64.urlsafe_b64decode(padded))
+        return (
+            None if score is None else float(score),
+            datetime.fromisoformat(created_at),
+            int(id_)
+        )
+    except (ValueError, TypeError):
+        raise RecruitmentQueryError("잘못된 커서입니다.")
+
+
+def relevance(term: str):
+    """제목/설명과 검색어의 word_similarity 가중합 (소수 6자리로 고정해 커서 비교가 안정적이도록)"""
+    return func.round(
+        cast(
+            TITLE_WEIGHT * func.word_similarity(term, Recruitment.title)
+            + func.word_similarity(term, Recruitment.description),
+            Numeric
+        ),
+        6
+    )
+
+
+def search_condition(term: str):
+    """부분 일치(ILIKE) 또는 제목과 비슷한 단어(<%, 오타 허용) — 모두 트라이그램 인덱스 사용"""
+    pattern = like_pattern(term)
+    return or_(
+        Recruitment.title.ilike(pattern),
+        Recruitment.description.ilike(pattern),
+        literal(term).op("<%")(Recruitment.title)
+    )
+
+
+def paginate_recruitments(
+        db: Session,
+        query,
+        search: Optional[str],
+        limit: int,
+        cursor: Optional[str] = None,
+        offset: int = 0
+) -> Tuple[List[Recruitment], Optional[str]]:
+    """
+    필터가 적용된 select(Recruitment)에 검색/정렬/커서를 붙여 한 페이지를 가져옴
+    (cursor가 없으면 offset부터 — 기존 page 파라미터 호환용)
+    """
+    term = (search or "").strip() or None
+    score = relevance(term) if term else None
+
+    if term:
+        query = query.add_columns(score.label("score")).where(search_condition(term))
+        query = query.order_by(score.desc(), Recruitment.created_at.desc(), Recruitment.id.desc())
+    else:
+        query = query.order_by(Recruitment.created_at.desc(), Recruitment.id.desc())
+
+    if cursor:
+        cursor_score, cursor_created_at, cursor_id = decode_cursor(cursor)
+        if (cursor_score is None) != (term is None):
+            raise RecruitmentQueryError("커서가 현재 검색 조건과 맞지 않습니다.")
+        if term:
+            query = query.where(
+                tuple_(score, Recruitment.created_at, Recruitment.id)
+                < tuple_(cast(cursor_score, Numeric), cursor_created_at, cursor_id)
+            )
+        else:
+            query = query.where(
+                tuple_(Recruitment.created_at, Recruitment.id) < tuple_(cursor_created_at, cursor_id)
+            )
+    elif offset:
+        query = query.offset(offset)
+
+    rows = db.exec(query.limit(limit + 1)).all()
+
+    if term:
+        items = [row[0] for row in rows[:limit]]
+        scores = [float(row[1]) for row in rows[:limit]]
+    else:
+        items = list(rows[:limit])
+        scores = [None] * len(items)
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(scores[-1], last.created_at, last.id)
+    return items, next_cursor
@@ -0,0 +1,216 @@
+# app/services/recurrence.py
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from dateutil.relativedelta import relativedelta
+from dateutil.rrule import rrulestr
+from sqlalchemy import and_, or_
+
+from app.models.schedule import ProjectEvent
+
+# =================================================================
+# 🔁 반복 일정 (RFC 5545 RRULE)
+# 예) FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10 / FREQ=MONTHLY;UNTIL=20261231T000000
+# - DB에는 시리즈 1건만 저장하고, 조회 요청 구간 안의 회차만 그때그때 펼칩니다.
+# - recurrence_until에는 마지막 회차의 종료 시각을 저장해 구간 조회 시 인덱스로 거릅니다.
+#   (끝이 없는 반복이면 NULL)
+# - 하루보다 촘촘한 반복(HOURLY/MINUTELY/SECONDLY, BYHOUR/BYMINUTE/BYSECOND)은 받지 않음
+#   → 회차는 하루 최대 1번이라 최대 조회 구간(366일) 안에서도 수백 개로 묶임
+# - 구간을 펼칠 때는 DTSTART부터 세지 않고, 시작 시각을 주기(FREQ × INTERVAL)의 정수배만큼
+#   구간 직전으로 옮긴 규칙에서 시작 (COUNT 규칙은 전체가 상한 이하라 그대로)
+# =================================================================
+
+# COUNT/UNTIL로 끝나는 규칙의 전체 회차 수 상한
+MAX_OCCURRENCES_PER_EVENT = 1000
+
+SUB_DAILY_FREQS = {"HOURLY", "MINUTELY", "SECONDLY"}
+SUB_DAILY_PARTS = {"BYHOUR", "BYMINUTE", "BYSECOND"}
+# 주기 길이가 일정한 FREQ (그 외 MONTHLY/YEARLY는 달 단위로 이동)
+FIXED_PERIODS = {
+    "WEEKLY": timedelta(weeks=1),
+    "DAILY": timedelta(days=1),
+    "HOURLY": timedelta(hours=1),
+    "MINUTELY": timedelta(minutes=1),
+    "SECONDLY": timedelta(seconds=1),
+}
+# 이 중 하나라도 있으면 MONTHLY/YEARLY가 DTSTART의 날짜를 기본값으로 쓰지 않음
+DAY_PARTS = {"BYMONTHDAY", "BYDAY", "BYYEARDAY", "BYWEEKNO", "BYEASTER"}
+
+
+class RecurrenceError(ValueError):
+    pass
+
+
+@dataclass
+class EventOccurrence:
+    """반복 일정의 한 회차 (ProjectEventResponse와 같은 모양)"""
+    id: int
+    project_id: int
+    title: str
+    description: Optional[str]
+    start_datetime: datetime
+    end_datetime: datetime
+    created_by: int
+    created_at: datetime
+    recurrence_rule: Optional[str]
+    recurrence_until: Optional[datetime]
+
+
+def parse_rule(rule: str, dtstart: datetime):
+    value = rule.strip()
+    if value.upper().startswith("RRULE:"):
+        value = value[len("RRULE:"):]
+    try:
+        return rrulestr(value, dtstart=dtstart)
+    except (ValueError, TypeError) as e:
+        raise RecurrenceError(f"반복 규칙(RRULE) 형식이 올바르지 않습니다: {e}")
+
+
+def _rule_parts(rule: str) -> Dict[str, str]:
+    """정규화된 규칙 문자열 → {"FREQ": "WEEKLY", "INTERVAL": "2", ...}"""
+    return dict(part.split("=", 1) for part in rule.split(";") if "=" in part)
+
+
+def normalize_rule(rule: Optional[str]) -> Optional[str]:
+    """'RRULE:' 접두어를 떼고 대문자로 통일 (빈 문자열이면 반복 해제)"""
+    if not rule or not rule.strip():
+        return None
+    value = rule.strip()
+    if value.upper().startswith("RRULE:"):
+        value = value[len("RRULE:"):]
+    return value.upper()
+
+
+def series_end(event: ProjectEvent) -> Optional[datetime]:
+    """
+    반복 시리즈의 마지막 회차 종료 시각 (COUNT/UNTIL이 없으면 None)
+    일정 저장 시 recurrence_until 컬럼에 채워 넣습니다.
+    """
+    if not event.recurrence_rule:
+        return event.end_datetime
+
+    # 끝없는 반복이어도 규칙 형식은 먼저 검증
+    rule = parse_rule(event.recurrence_rule, event.start_datetime)
+    parts = _rule_parts(event.recurrence_rule)
+    if parts.get("FREQ") in SUB_DAILY_FREQS or SUB_DAILY_PARTS & parts.keys():
+        raise RecurrenceError("반복 일정은 하루 단위 이상(DAILY/WEEKLY/MONTHLY/YEARLY)으로만 만들 수 있습니다.")
+    if "COUNT=" not in event.recurrence_rule and "UNTIL=" not in event.recurrence_rule:
+        return None
+
+    # 회차 수가 상한을 넘는 규칙(FREQ=SECONDLY;COUNT=1000000 등)은 끝까지 펼치지 않고 거절
+    occurrences = list(islice(rule, MAX_OCCURRENCES_PER_EVENT + 1))
+    if len(occurrences) > MAX_OCCURRENCES_PER_EVENT:
+        raise RecurrenceError(f"반복 일정은 최대 {MAX_OCCURRENCES_PER_EVENT}회까지 만들 수 있습니다.")
+    last_start = occurrences[-1] if occurrences else None
+    if last_start is None:
+        return event.end_datetime
+    return last_start + (event.end_datetime - event.start_datetime)
+
+
+def overlaps_window(window_start: datetime, window_end: datetime):
+    """
+    [window_start, window_end)와 겹칠 수 있는 일정 조건
+    (project_id, start_datetime) 복합 인덱스로 start_datetime < window_end를 먼저 거릅니다.
+    """
+    return and_(
+        ProjectEvent.start_datetime < window_end,
+        or_(
+            # 단일 일정: 실제 종료 시각으로 판단
+            and_(ProjectEvent.recurrence_rule.is_(None), ProjectEvent.end_datetime > window_start),
+            # 반복 일정: 마지막 회차 종료 시각(없으면 무한)으로 판단
+            and_(
+                ProjectEvent.recurrence_rule.is_not(None),
+                or_(ProjectEvent.recurrence_until.is_(None), ProjectEvent.recurrence_until > window_start)
+            )
+        )
+    )
+
+
+def _occurrence(event: ProjectEvent, start: datetime, end: datetime) -> EventOccurrence:
+    return EventOccurrence(
+        id=event.id,
+        project_id=event.project_id,
+        title=event.title,
+        description=event.description,
+        start_datetime=start,
+        end_datetime=end,
+        created_by=event.created_by,
+        created_at=event.created_at,
+        recurrence_rule=event.recurrence_rule,
+        recurrence_until=event.recurrence_until
+    )
+
+
+def _seek_rule(event: ProjectEvent, target: datetime):
+    """
+    target 이전 마지막 주기 경계로 시작 시각을 옮긴 규칙 (회차 집합은 원래 규칙과 같음)
+    DTSTART에서 기본값을 가져오는 필드(요일/날짜/시각)는 옮기기 전 값으로 고정합니다.
+    """
+    dtstart = event.start_datetime
+    rule = parse_rule(event.recurrence_rule, dtstart)
+    parts = _rule_parts(event.recurrence_rule)
+    if target <= dtstart or "COUNT" in parts:
+        return rule
+
+    freq = parts.get("FREQ")
+    interval = int(parts.get("INTERVAL", 1))
+
+    if freq in FIXED_PERIODS:
+        # 주기의 정수배만큼 옮기면 요일/시각이 그대로라 기본값도 그대로
+        step = FIXED_PERIODS[freq] * interval
+        return rule.replace(dtstart=dtstart + step * ((target - dtstart) // step))
+
+    # MONTHLY / YEARLY: 주기 첫날 0시로 옮기고 DTSTART 기준 기본값은 명시
+    months = (target.year - dtstart.year) * 12 + target.month - dtstart.month
+    period = interval if freq == "MONTHLY" else interval * 12
+    if months < period:
+        return rule
+    start = (dtstart + relativedelta(months=months // period * period)).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    if freq == "YEARLY":
+        start = start.replace(month=1)
+
+    defaults = {}
+    if not DAY_PARTS & parts.keys():
+        defaults["bymonthday"] = dtstart.day
+        if freq == "YEARLY" and "BYMONTH" not in parts:
+            defaults["bymonth"] = dtstart.month
+    for name, value in (("byhour", dtstart.hour), ("byminute", dtstart.minute), ("bysecond", dtstart.second)):
+        if name.upper() not in parts:
+            defaults[name] = value
+    return rule.replace(dtstart=start, **defaults)
+
+
+def iter_occurrences(event: ProjectEvent, window_start: datetime, window_end: datetime) -> Iterator[EventOccurrence]:
+    """요청 구간과 겹치는 회차만 순서대로 생성 (구간 앞 회차는 한 주기 안에서만 건너뜀)"""
+    duration = event.end_datetime - event.start_datetime
+
+    if not event.recurrence_rule:
+        if event.start_datetime < window_end and event.end_datetime > window_start:
+            yield _occurrence(event, event.start_datetime, event.end_datetime)
+        return
+
+    # 구간 시작 직전에 시작해 구간 안까지 이어지는 회차도 포함
+    after = window_start - duration
+    for start in _seek_rule(event, after).xafter(after, inc=False):
+        if start >= window_end:
+            break
+        yield _occurrence(event, start, start + duration)
+
+
+def expand_events(
+        events: Iterable[ProjectEvent],
+        window_start: datetime,
+        window_end: datetime
+) -> List[EventOccurrence]:
+    occurrences = [
+        occurrence
+        for event in events
+        for occurrence in iter_occurrences(event, window_start, window_end)
+    ]
+    occurrences.sort(key=lambda o: (o.start_datetime, o.id))
+    return occurrences
@@ -0,0 +1,215 @@
+# app/services/search.py
+
+import re
+import json
+import html
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+# =================================================================
+# 🔎 프로젝트 통합 검색 (PostgreSQL Full-Text Search + pg_trgm)
+# - 테이블마다 search_vector(tsvector) 생성 컬럼을 두고 GIN 인덱스를 겁니다.
+#   GENERATED ... STORED 컬럼이라 INSERT/UPDATE 시 DB가 자동으로 갱신합니다.
+# - 한국어는 형태소 사전이 없으므로 두 가지를 함께 씁니다.
+#   1) 'simple' 설정 + 접두어 검색(회의:*) → '회의를', '회의록'처럼 조사/복합어가 붙어도 매칭
+#   2) pg_trgm 트라이그램 GIN 인덱스 → 단어 중간 일치(ILIKE '%..%')도 인덱스로 처리
+# - 결과는 (점수, 종류, id) 기준 keyset 페이지네이션 (OFFSET 없음)
+# - 채팅은 chat_messages(핫 테이블)만 검색 → chat_archive로 보관된 오래된 채팅은 나오지 않음
+# =================================================================
+
+SEARCH_CONFIG = "simple"
+MAX_TERMS = 8
+
+# ts_headline 강조 구분자 (본문을 HTML 이스케이프한 뒤 <mark>로 바꿈)
+_MARK_START = "\ue000"
+_MARK_END = "\ue001"
+HEADLINE_OPTIONS = f"StartSel={_MARK_START}, StopSel={_MARK_END}, MaxWords=20, MinWords=8, MaxFragments=2"
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    type: str
+    table: str
+    document: str        # 검색 대상 텍스트 식 (인덱스 식과 완전히 같아야 인덱스를 탐)
+    title: str           # 결과 제목으로 보여줄 식
+    project_filter: str  # :project_id 로 프로젝트를 거르는 조건
+
+
+SEARCH_SOURCES: Dict[str, SearchSource] = {
+    source.type: source for source in [
+        SearchSource(
+            type="card", table="cards",
+            document="coalesce(title, '') || ' ' || coalesce(content, '')",
+            title="t.title",
+            project_filter="t.project_id = :project_id",
+        ),
+        SearchSource(
+            type="post", table="posts",
+            document="coalesce(title, '') || ' ' || coalesce(content, '')",
+            title="t.title",
+            project_filter="t.project_id = :project_id",
+        ),
+        SearchSource(
+            type="post_comment", table="post_comments",
+            document="coalesce(content, '')",
+            title="(SELECT p.title FROM posts p WHERE p.id = t.post_id)",
+            project_filter="t.post_id IN (SELECT p.id FROM posts p WHERE p.project_id = :project_id)",
+        ),
+        SearchSource(
+            type="chat", table="chat_messages",
+            document="coalesce(content, '')",
+            title="NULL",
+            project_filter="t.project_id = :project_id",
+        ),
+        SearchSource(
+            type="file", table="files",
+            document="coalesce(filename, '')",
+            title="t.filename",
+            project_filter="t.project_id = :project_id",
+        ),
+    ]
+}
+
+
+def search_schema_statements() -> List[str]:
+    """database.SCHEMA_UPGRADES에 포함되는 DDL (생성 컬럼 + GIN 인덱스)"""
+    statements = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+    for source in SEARCH_SOURCES.values():
+        statements += [
+            f"ALTER TABLE {source.table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('{SEARCH_CONFIG}', {source.document})) STORED",
+            f"CREATE INDEX IF NOT EXISTS ix_{source.table}_search_vector "
+            f"ON {source.table} USING GIN (search_vector)",
+            f"CREATE INDEX IF NOT EXISTS ix_{source.table}_search_trgm "
+            f"ON {source.table} USING GIN (({source.document}) gin_trgm_ops)",
+        ]
+    return statements
+
+
+class SearchQueryError(ValueError):
+    pass
+
+
+def build_tsquery(query: str) -> str:
+    """
+    검색어 → 접두어 tsquery ('회의 일정' → '회의:* & 일정:*')
+    단어 문자만 남기므로 tsquery 문법 문자가 섞여 들어가지 않습니다.
+    """
+    terms = [term.lower() for term in re.findall(r"\w+", query)][:MAX_TERMS]
+    if not terms:
+        raise SearchQueryError("검색어에 글자나 숫자가 포함되어야 합니다.")
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def like_pattern(query: str) -> str:
+    escaped = query.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# -----------------------------------------------------------------
+# 커서 (점수, 종류, id) ↔ 문자열
+# -----------------------------------------------------------------
+def encode_cursor(rank: float, type_: str, id_: int) -> str:
+    raw = json.dumps([rank, type_, id_], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, type_, id_ = json.loads(base64.urlsafe_b64decode(padded))
+        return float(rank), str(type_), int(id_)
+    except (ValueError, TypeError):
+        raise SearchQueryError("잘못된 커서입니다.")
+
+
+def render_headline(headline: Optional[str]) -> Optional[str]:
+    """사용자 입력은 이스케이프하고 강조 구간만 <mark>로 감쌈"""
+    if headline is None:
+        return None
+    return html.escape(headline).replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+
+@dataclass
+class SearchHit:
+    type: str
+    id: int
+    title: Optional[str]
+    headline: Optional[str]
+    created_at: datetime
+    rank: float
+
+
+def search_project(
+        db: Session,
+        project_id: int,
+        query: str,
+        types: Optional[Sequence[str]] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+) -> Tuple[List[SearchHit], Optional[str]]:
+    sources = [SEARCH_SOURCES[t] for t in (types or SEARCH_SOURCES)]
+    params = {
+        "project_id": project_id,
+        "tsquery": build_tsquery(query),
+        "term": query.strip(),
+        "pattern": like_pattern(query),
+        "headline_options": HEADLINE_OPTIONS,
+        "limit": limit + 1,
+    }
+
+    # 종류별 후보: tsvector 일치(접두어) 또는 트라이그램 부분 일치
+    # 점수 = ts_rank_cd + word_similarity (소수 6자리로 고정해 커서 비교가 안정적이도록)
+    branches = [
+        f"""
+        SELECT '{source.type}' AS type, t.id AS id, {source.title} AS title,
+               {source.document} AS document, t.created_at AS created_at,
+               round((ts_rank_cd(t.search_vector, q) + word_similarity(:term, {source.document}))::numeric, 6) AS rank
+        FROM {source.table} t, to_tsquery('{SEARCH_CONFIG}', :tsquery) q
+        WHERE {source.project_filter}
+          AND (t.search_vector @@ q OR ({source.document}) ILIKE :pattern)
+        """
+        for source in sources
+    ]
+
+    keyset = ""
+    if cursor:
+        params["cursor_rank"], params["cursor_type"], params["cursor_id"] = decode_cursor(cursor)
+        keyset = "WHERE (r.rank, r.type, r.id) < (CAST(:cursor_rank AS numeric), :cursor_type, :cursor_id)"
+
+    # 하이라이트(ts_headline)는 비용이 크므로 페이지로 잘린 결과에만 적용
+    statement = text(f"""
+        SELECT page.type, page.id, page.title, page.created_at, page.rank,
+               ts_headline('{SEARCH_CONFIG}', page.document, to_tsquery('{SEARCH_CONFIG}', :tsquery), :headline_options) AS headline
+        FROM (
+            SELECT r.* FROM ({" UNION ALL ".join(branches)}) r
+            {keyset}
+            ORDER BY r.rank DESC, r.type DESC, r.id DESC
+            LIMIT :limit
+        ) page
+        ORDER BY page.rank DESC, page.type DESC, page.id DESC
+    """)
+
+    rows = db.execute(statement, params).all()
+
+    hits = [
+        SearchHit(
+            type=row.type,
+            id=row.id,
+            title=row.title,
+            headline=render_headline(row.headline),
+            created_at=row.created_at,
+            rank=float(row.rank)
+        )
+        for row in rows[:limit]
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        last = hits[-1]
+        next_cursor = encode_cursor(last.rank, last.type, last.id)
+    return hits, next_cursor
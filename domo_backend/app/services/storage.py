@@ -0,0 +1,313 @@
+# app/services/storage.py
+
+import os
+import shutil
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional
+from urllib.parse import quote
+
+try:
+    import boto3
+    from botocore.config import Config as BotoConfig
+    from botocore.exceptions import ClientError
+except ImportError:
+    boto3 = None
+    BotoConfig = None
+    ClientError = None
+
+# =================================================================
+# 🗄️ 파일 저장소 추상화
+# 업로드 파일은 '키'(예: files/uuid.pdf, community/abc.png)로 저장/조회합니다.
+# - STORAGE_BACKEND=local (기본값): /app/uploads 디렉터리 (StaticFiles로 /static 제공)
+# - STORAGE_BACKEND=s3: S3 호환 오브젝트 스토리지 (AWS S3, MinIO 등)
+#   → 다운로드는 presigned URL로 리다이렉트하므로 앱 워커가 파일을 중계하지 않습니다.
+# =================================================================
+
+LOCAL_ROOT = "/app/uploads"
+STATIC_PREFIX = "/static/"
+CHUNK_SIZE = 64 * 1024
+
+
+class StorageError(Exception):
+    pass
+
+
+@dataclass
+class StoredObject:
+    key: str
+    size: int
+    modified_at: float  # epoch seconds
+
+
+class StorageBackend(ABC):
+    """저장소 공통 인터페이스"""
+
+    def setup(self):
+        """서버 시작 시 1회 호출 (버킷/디렉터리 준비)"""
+        pass
+
+    @abstractmethod
+    def put(self, key: str, fileobj: BinaryIO, content_type: Optional[str] = None) -> int:
+        """파일 객체를 저장하고 저장된 바이트 수를 반환"""
+
+    @abstractmethod
+    def put_file(self, key: str, local_path: str, content_type: Optional[str] = None) -> int:
+        """로컬 파일을 저장소로 옮김 (원본 로컬 파일은 제거됨)"""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        ...
+
+    @abstractmethod
+    def stream(self, key: str, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        """start~end(포함) 구간을 청크 단위로 읽기"""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """없는 키를 지워도 에러를 내지 않음"""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def size(self, key: str) -> int:
+        ...
+
+    def presign(
+            self,
+            key: str,
+            expires_in: int = 3600,
+            filename: Optional[str] = None,
+            content_type: Optional[str] = None,
+            inline: bool = False
+    ) -> Optional[str]:
+        """직접 다운로드 가능한 임시 URL (지원하지 않는 저장소는 None)"""
+        return None
+
+    def local_path(self, key: str) -> Optional[str]:
+        """로컬 디스크 경로 (로컬 저장소가 아니면 None)"""
+        return None
+
+    @abstractmethod
+    def iter_objects(self, prefix: str = "") -> Iterator[StoredObject]:
+        """
+        저장된 객체를 하나씩 흘려보냄 (전체 목록을 메모리에 올리지 않음)
+        prefix는 키의 문자열 접두어입니다. (디렉터리면 "community/"처럼 /로 끝나게)
+        '.'으로 시작하는 경로(업로드 세션 등 내부용)는 제외합니다.
+        """
+
+    # -----------------------------------------------------------------
+    # 키 <-> URL/경로 변환
+    # -----------------------------------------------------------------
+    @staticmethod
+    def normalize_key(value: str) -> str:
+        """
+        DB에 저장된 값을 저장소 키로 변환
+        - 예전 데이터: /app/uploads/files/abc.pdf (절대 경로)
+        - 이미지 URL: /static/community/abc.png
+        - 새 데이터: files/abc.pdf (키 그대로)
+        """
+        if value.startswith(LOCAL_ROOT + "/"):
+            return value[len(LOCAL_ROOT) + 1:]
+        if value.startswith(STATIC_PREFIX):
+            return value[len(STATIC_PREFIX):]
+        return value.lstrip("/")
+
+    @staticmethod
+    def url(key: str) -> str:
+        """클라이언트에 내려줄 URL (/static/{key})"""
+        return STATIC_PREFIX + key
+
+
+class LocalStorage(StorageBackend):
+    def __init__(self, root: str = LOCAL_ROOT):
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        path = os.path.realpath(os.path.join(self.root, key))
+        if not path.startswith(os.path.realpath(self.root) + os.sep):
+            raise StorageError(f"Invalid storage key: {key}")
+        return path
+
+    def put(self, key, fileobj, content_type=None):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as buffer:
+            shutil.copyfileobj(fileobj, buffer)
+        return os.path.getsize(path)
+
+    def put_file(self, key, local_path, content_type=None):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.move(local_path, path)
+        return os.path.getsize(path)
+
+    def get(self, key):
+        with open(self._path(key), "rb") as f:
+            return f.read()
+
+    def stream(self, key, start=0, end=None):
+        with open(self._path(key), "rb") as f:
+            f.seek(start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                chunk = f.read(CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def exists(self, key):
+        try:
+            return os.path.isfile(self._path(key))
+        except StorageError:
+            return False
+
+    def size(self, key):
+        return os.path.getsize(self._path(key))
+
+    def local_path(self, key):
+        return self._path(key)
+
+    def iter_objects(self, prefix=""):
+        # os.walk 대신 scandir 재귀 → 디렉터리 항목을 한 번에 리스트로 만들지 않음
+        def walk(directory: str, key_prefix: str, name_prefix: str = ""):
+            try:
+                entries = os.scandir(directory)
+            except FileNotFoundError:
+                return
+            with entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.name.startswith(name_prefix):
+                        continue
+                    key = key_prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from walk(entry.path, key + "/")
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        yield StoredObject(key=key, size=stat.st_size, modified_at=stat.st_mtime)
+
+        # S3와 같은 문자열 접두어 의미: "community/abc" → community 디렉터리에서 abc로 시작하는 항목
+        directory, _, name_prefix = prefix.rpartition("/")
+        start_dir = os.path.join(self.root, directory) if directory else self.root
+        yield from walk(start_dir, directory + "/" if directory else "", name_prefix)
+
+
+class S3Storage(StorageBackend):
+    """S3 프로토콜 저장소 (로컬 개발/테스트는 MinIO 컨테이너로 대체 가능)"""
+
+    def __init__(
+            self,
+            bucket: str,
+            endpoint_url: Optional[str] = None,
+            public_endpoint_url: Optional[str] = None,
+            access_key: Optional[str] = None,
+            secret_key: Optional[str] = None,
+            region: Optional[str] = None
+    ):
+        if boto3 is None:
+            raise RuntimeError("STORAGE_BACKEND=s3 requires the 'boto3' package.")
+
+        self.bucket = bucket
+        options = dict(
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region,
+            config=BotoConfig(signature_version="s3v4", s3={"addressing_style": "path"})
+        )
+        self.client = boto3.client("s3", endpoint_url=endpoint_url, **options)
+        # presigned URL은 브라우저가 접근하는 주소로 서명해야 함
+        # (컨테이너 내부 주소 http://minio:9000 과 외부 주소가 다를 수 있음)
+        self.presign_client = (
+            boto3.client("s3", endpoint_url=public_endpoint_url, **options)
+            if public_endpoint_url else self.client
+        )
+
+    def setup(self):
+        try:
+            self.client.head_bucket(Bucket=self.bucket)
+        except ClientError:
+            self.client.create_bucket(Bucket=self.bucket)
+
+    def put(self, key, fileobj, content_type=None):
+        extra = {"ContentType": content_type} if content_type else None
+        self.client.upload_fileobj(fileobj, self.bucket, key, ExtraArgs=extra)
+        return self.size(key)
+
+    def put_file(self, key, local_path, content_type=None):
+        extra = {"ContentType": content_type} if content_type else None
+        # 큰 파일은 boto3가 자동으로 멀티파트 업로드로 나눠 전송
+        self.client.upload_file(local_path, self.bucket, key, ExtraArgs=extra)
+        size = os.path.getsize(local_path)
+        os.remove(local_path)
+        return size
+
+    def get(self, key):
+        return self.client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+    def stream(self, key, start=0, end=None):
+        byte_range = f"bytes={start}-{'' if end is None else end}"
+        body = self.client.get_object(Bucket=self.bucket, Key=key, Range=byte_range)["Body"]
+        yield from body.iter_chunks(CHUNK_SIZE)
+
+    def delete(self, key):
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def exists(self, key):
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError:
+            return False
+
+    def size(self, key):
+        return self.client.head_object(Bucket=self.bucket, Key=key)["ContentLength"]
+
+    def iter_objects(self, prefix=""):
+        # list_objects_v2는 1000개 단위 페이지로 나눠 받음
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for item in page.get("Contents", []):
+                key = item["Key"]
+                if any(part.startswith(".") for part in key.split("/")):
+                    continue
+                yield StoredObject(key=key, size=item["Size"], modified_at=item["LastModified"].timestamp())
+
+    def presign(self, key, expires_in=3600, filename=None, content_type=None, inline=False):
+        params = {"Bucket": self.bucket, "Key": key}
+        if filename:
+            disposition_type = "inline" if inline else "attachment"
+            params["ResponseContentDisposition"] = f"{disposition_type}; filename*=utf-8''{quote(filename)}"
+        if content_type:
+            params["ResponseContentType"] = content_type
+        return self.presign_client.generate_presigned_url("get_object", Params=params, ExpiresIn=expires_in)
+
+
+def create_storage() -> StorageBackend:
+    backend = os.environ.get("STORAGE_BACKEND", "local")
+
+    if backend == "s3":
+        return S3Storage(
+            bucket=os.environ.get("S3_BUCKET", "domo-uploads"),
+            endpoint_url=os.environ.get("S3_ENDPOINT_URL"),
+            public_endpoint_url=os.environ.get("S3_PUBLIC_ENDPOINT_URL"),
+            access_key=os.environ.get("S3_ACCESS_KEY"),
+            secret_key=os.environ.get("S3_SECRET_KEY"),
+            region=os.environ.get("S3_REGION")
+        )
+
+    return LocalStorage(os.environ.get("LOCAL_STORAGE_ROOT", LOCAL_ROOT))
+
+
+# 싱글톤 인스턴스
+storage = create_storage()
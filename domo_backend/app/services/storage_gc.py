@@ -0,0 +1,187 @@
+# app/services/storage_gc.py
+
+import os
+import re
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Iterable, List, Set
+
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models.file import FileVersion
+from app.models.user import User
+from app.models.community import CommunityPost
+from app.models.chat import ChatArchiveSegment
+from app.services.storage import storage, LOCAL_ROOT
+from app.services.thumbnails import THUMBNAIL_SIZES, IMAGE_EXTENSIONS
+
+# =================================================================
+# 🧹 저장소 정리(GC) 작업
+# 저장소의 파일 목록과 DB 참조(FileVersion.saved_path, User.profile_image,
+# CommunityPost.image_url, ChatArchiveSegment.storage_key)를 비교해 아무도 참조하지 않는 파일을 지웁니다.
+# - 방금 업로드되어 아직 커밋 전인 파일을 지우지 않도록 유예 기간(grace period)을 둡니다.
+# - 목록은 청크 단위로 흘려보내며 비교하므로 파일 수가 많아도 메모리 사용량이 일정합니다.
+# =================================================================
+
+GC_INTERVAL_SECONDS = int(os.environ.get("STORAGE_GC_INTERVAL_SECONDS", 6 * 60 * 60))
+GC_GRACE_SECONDS = int(os.environ.get("STORAGE_GC_GRACE_SECONDS", 24 * 60 * 60))
+GC_CHUNK_SIZE = 500
+
+# 여러 워커가 동시에 돌지 않도록 잡는 PostgreSQL advisory lock 키
+GC_LOCK_KEY = 710_032
+
+# DB에서 참조하지 않지만 지우면 안 되는 파일
+PROTECTED_KEYS = {"default_profile.png"}
+
+VARIANT_RE = re.compile(r"^(?P<stem>.+)\.(?:" + "|".join(THUMBNAIL_SIZES) + r")\.webp$")
+
+
+@dataclass
+class GCReport:
+    scanned: int = 0
+    deleted: int = 0
+    reclaimed_bytes: int = 0
+    failed: int = 0
+    dry_run: bool = False
+
+
+def _chunks(items: Iterable, size: int):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _referenced_keys(db: Session, keys: List[str]) -> Set[str]:
+    """청크에 포함된 키 중 DB에서 참조 중인 키 (인덱스를 타는 IN 조회 4번)"""
+    # saved_path는 키(files/..) 또는 예전 절대 경로(/app/uploads/files/..)로 저장되어 있음
+    path_candidates = keys + [f"{LOCAL_ROOT}/{key}" for key in keys]
+    url_candidates = [storage.url(key) for key in keys]
+
+    referenced = set()
+    referenced.update(db.exec(
+        select(FileVersion.saved_path).where(FileVersion.saved_path.in_(path_candidates))
+    ).all())
+    referenced.update(db.exec(
+        select(User.profile_image).where(User.profile_image.in_(url_candidates))
+    ).all())
+    referenced.update(db.exec(
+        select(CommunityPost.image_url).where(CommunityPost.image_url.in_(url_candidates))
+    ).all())
+    referenced.update(db.exec(
+        select(ChatArchiveSegment.storage_key).where(ChatArchiveSegment.storage_key.in_(keys))
+    ).all())
+
+    return {storage.normalize_key(value) for value in referenced}
+
+
+def _has_original(stem: str) -> bool:
+    """썸네일(abc.sm.webp)의 원본(abc.png, abc.JPG 등)이 아직 저장소에 있는지"""
+    if any(storage.exists(stem + ext) for ext in IMAGE_EXTENSIONS):
+        return True
+    # 확장자 대소문자가 다른 원본(abc.PNG 등) → stem으로 시작하는 키 목록에서 대소문자 무시하고 비교
+    for obj in storage.iter_objects(stem + "."):
+        root, ext = os.path.splitext(obj.key)
+        if root == stem and ext.lower() in IMAGE_EXTENSIONS:
+            return True
+    return False
+
+
+def collect_garbage(dry_run: bool = False) -> GCReport:
+    report = GCReport(dry_run=dry_run)
+    cutoff = time.time() - GC_GRACE_SECONDS
+
+    # 유예 기간이 지난 파일만 후보로 삼음
+    candidates = (
+        obj for obj in storage.iter_objects()
+        if obj.modified_at < cutoff and obj.key not in PROTECTED_KEYS
+    )
+
+    with Session(engine) as db:
+        for chunk in _chunks(candidates, GC_CHUNK_SIZE):
+            report.scanned += len(chunk)
+
+            originals = [obj for obj in chunk if not VARIANT_RE.match(obj.key)]
+            referenced = _referenced_keys(db, [obj.key for obj in originals]) if originals else set()
+
+            orphans = [obj for obj in originals if obj.key not in referenced]
+            # 썸네일은 원본이 남아 있으면 유지 (원본이 지워질 때 함께 정리됨)
+            orphans += [
+                obj for obj in chunk
+                if (match := VARIANT_RE.match(obj.key)) and not _has_original(match.group("stem"))
+            ]
+
+            for obj in orphans:
+                if not dry_run:
+                    try:
+                        storage.delete(obj.key)
+                    except Exception as e:
+                        report.failed += 1
+                        print(f"⚠️ [Storage GC] Failed to delete {obj.key}: {e}", flush=True)
+                        continue
+                report.deleted += 1
+                report.reclaimed_bytes += obj.size
+
+    return report
+
+
+def run_once(dry_run: bool = False) -> GCReport:
+    """다른 워커가 이미 GC 중이면 건너뜀 (PostgreSQL advisory lock)"""
+    with engine.connect() as conn:
+        use_lock = engine.dialect.name == "postgresql"
+        if use_lock and not conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": GC_LOCK_KEY}).scalar():
+            print("⏭️  [Storage GC] Another worker is running GC. Skipped.", flush=True)
+            return GCReport(dry_run=dry_run)
+
+        try:
+            report = collect_garbage(dry_run=dry_run)
+        finally:
+            if use_lock:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": GC_LOCK_KEY})
+
+    print(
+        f"🧹 [Storage GC] scanned={report.scanned} deleted={report.deleted} "
+        f"reclaimed={report.reclaimed_bytes / (1024 * 1024):.1f}MB failed={report.failed}"
+        + (" (dry run)" if dry_run else ""),
+        flush=True
+    )
+    return report
+
+
+# =================================================================
+# ⏰ 주기 실행 (main.py lifespan에서 시작/종료)
+# =================================================================
+_task = None
+
+
+async def _loop():
+    while True:
+        await asyncio.sleep(GC_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(run_once)
+        except Exception as e:
+            print(f"❌ [Storage GC] Failed: {e}", flush=True)
+
+
+def start():
+    global _task
+    if GC_INTERVAL_SECONDS > 0 and _task is None:
+        _task = asyncio.create_task(_loop())
+
+
+async def stop():
+    global _task
+    if _task:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
@@ -0,0 +1,148 @@
+# app/services/tech_stacks.py
+
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, select
+
+from app.models.match import TechStack
+
+# =================================================================
+# 🧰 기술 스택 사전 (프로세스 전역 캐시)
+# - 처음 한 번 전체를 읽어 이름 → id 사전과 소문자 이름 정렬 목록을 만들어 둡니다.
+# - 공고 생성 시 이름 확인은 메모리에서, 새 이름만 INSERT ... ON CONFLICT DO NOTHING RETURNING 한 번으로 추가
+#   (대소문자만 다른 이름은 기존 스택을 재사용)
+# - 자동완성은 정렬 목록에서 bisect로 접두어 구간만 잘라 응답
+# - 다른 워커가 추가한 스택은 CACHE_TTL_SECONDS 뒤 다시 읽어 반영
+# =================================================================
+
+CACHE_TTL_SECONDS = 300
+MAX_NAME_LENGTH = 50
+
+
+class TechStackError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class TechStackEntry:
+    id: int
+    name: str
+    color: Optional[str]
+
+
+class TechStackCache:
+    def __init__(self, ttl: int = CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = Lock()
+        self._by_key: Dict[str, TechStackEntry] = {}
+        self._sorted_keys: List[str] = []
+        self._expires_at = 0.0
+
+    # -----------------------------------------------------------------
+    # 로드 / 갱신
+    # -----------------------------------------------------------------
+    def _ensure_loaded(self, db: Session):
+        if self._expires_at > time.monotonic():
+            return
+        stacks = db.exec(select(TechStack)).all()
+        entries = {stack.name.lower(): TechStackEntry(stack.id, stack.name, stack.color) for stack in stacks}
+        with self._lock:
+            self._by_key = entries
+            self._sorted_keys = sorted(entries)
+            self._expires_at = time.monotonic() + self.ttl
+
+    def add(self, entries: Sequence[TechStackEntry]):
+        """새로 만든 스택을 반영 (트랜잭션 커밋 후에 호출 — 롤백된 id가 캐시에 남지 않도록)"""
+        with self._lock:
+            for entry in entries:
+                key = entry.name.lower()
+                if key not in self._by_key:
+                    self._by_key[key] = entry
+                    self._sorted_keys.insert(bisect_left(self._sorted_keys, key), key)
+
+    def invalidate(self):
+        with self._lock:
+            self._expires_at = 0.0
+
+    # -----------------------------------------------------------------
+    # 조회
+    # -----------------------------------------------------------------
+    def search(self, db: Session, prefix: str = "", limit: int = 20) -> List[TechStackEntry]:
+        """접두어 자동완성 (대소문자 무시, 이름순)"""
+        self._ensure_loaded(db)
+        key = prefix.strip().lower()
+        with self._lock:
+            start = bisect_left(self._sorted_keys, key)
+            result = []
+            for name_key in self._sorted_keys[start:]:
+                if not name_key.startswith(key) or len(result) >= limit:
+                    break
+                result.append(self._by_key[name_key])
+        return result
+
+    def resolve(self, db: Session, names: Sequence[str]) -> Tuple[List[int], List[TechStackEntry]]:
+        """
+        이름 목록 → (tech_stacks.id 목록, 캐시에 반영할 스택) (입력 순서 유지, 중복 제거)
+        캐시에 없는 이름은 DB에서 대소문자 무시로 한 번 더 찾고, 그래도 없는 것만 한 번의 INSERT로 추가
+        (동시에 같은 이름을 추가해도 ON CONFLICT로 안전)
+        """
+        self._ensure_loaded(db)
+
+        cleaned: Dict[str, str] = {}
+        for name in names:
+            name = name.strip()
+            if not name:
+                continue
+            if len(name) > MAX_NAME_LENGTH:
+                raise TechStackError(f"기술 스택 이름은 {MAX_NAME_LENGTH}자 이하여야 합니다.")
+            cleaned.setdefault(name.lower(), name)
+
+        with self._lock:
+            known = {key: self._by_key[key] for key in cleaned if key in self._by_key}
+        missing = [cleaned[key] for key in cleaned if key not in known]
+
+        created = self._find_or_insert(db, missing) if missing else []
+        known.update({entry.name.lower(): entry for entry in created})
+
+        return [known[key].id for key in cleaned if key in known], created
+
+    def _find_by_lower(self, db: Session, names: List[str]) -> List[TechStackEntry]:
+        return [
+            TechStackEntry(stack.id, stack.name, stack.color)
+            for stack in db.exec(
+                select(TechStack).where(func.lower(TechStack.name).in_({name.lower() for name in names}))
+            ).all()
+        ]
+
+    def _find_or_insert(self, db: Session, names: List[str]) -> List[TechStackEntry]:
+        # 다른 워커가 TTL 안에 추가한 스택은 이 워커 캐시에 없음 → ON CONFLICT(name)은 대소문자를
+        # 구분하므로 INSERT 전에 소문자로 다시 찾아 "React"가 있는데 "react"를 또 만들지 않도록
+        entries = self._find_by_lower(db, names)
+        found = {entry.name.lower() for entry in entries}
+        names = [name for name in names if name.lower() not in found]
+        if not names:
+            return entries
+
+        statement = (
+            pg_insert(TechStack)
+            .values([{"name": name} for name in names])
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(TechStack.id, TechStack.name, TechStack.color)
+        )
+        inserted = [TechStackEntry(*row) for row in db.execute(statement).all()]
+
+        # 다른 요청이 먼저 넣어 RETURNING에 안 나온 이름은 다시 조회
+        returned = {entry.name for entry in inserted}
+        conflicted = [name for name in names if name not in returned]
+        if conflicted:
+            inserted += self._find_by_lower(db, conflicted)
+        return entries + inserted
+
+
+tech_stack_cache = TechStackCache()
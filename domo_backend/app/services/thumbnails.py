@@ -0,0 +1,112 @@
+# app/services/thumbnails.py
+
+import os
+import io
+import logging
+from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    print("⚠️ Warning: 'Pillow' module not found. Thumbnail generation will be disabled.")
+    Image = None
+    ImageOps = None
+
+from app.services.storage import storage, STATIC_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# 사이즈 이름 → 긴 변의 최대 픽셀
+THUMBNAIL_SIZES: Dict[str, int] = {
+    "sm": 160,   # 아바타, 목록 아이콘
+    "md": 480,   # 피드 카드, 보드 미리보기
+    "lg": 1280,  # 상세 화면
+}
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
+
+# 업로드 요청과 분리된 썸네일 작업용 워커 풀
+# (Pillow의 resize/encode는 GIL을 놓기 때문에 스레드 풀로도 병렬 처리됩니다)
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("THUMBNAIL_WORKERS", 2)),
+    thread_name_prefix="thumbnail"
+)
+
+
+def is_image_path(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
+
+
+def variant_path(key: str, size: str) -> str:
+    """원본 옆에 저장되는 썸네일 키 (abc.png → abc.sm.webp)"""
+    root, _ = os.path.splitext(key)
+    return f"{root}.{size}.webp"
+
+
+def thumbnail_urls(image_url: Optional[str]) -> Optional[Dict[str, str]]:
+    """
+    /static/... 이미지 URL에 대한 사이즈별 썸네일 URL
+    썸네일이 아직 만들어지지 않았으면 해당 URL은 원본을 돌려줍니다.
+    """
+    if not image_url or not image_url.startswith(STATIC_PREFIX) or not is_image_path(image_url):
+        return None
+    relative_path = image_url[len(STATIC_PREFIX):]
+    return {size: f"/api/images/{size}/{relative_path}" for size in THUMBNAIL_SIZES}
+
+
+def generate_thumbnails(key: str):
+    """원본 이미지로부터 모든 사이즈의 썸네일 생성 (워커 스레드에서 실행)"""
+    if Image is None:
+        return
+
+    try:
+        with Image.open(io.BytesIO(storage.get(key))) as original:
+            # 스마트폰 사진의 회전 정보(EXIF) 반영
+            image = ImageOps.exif_transpose(original)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+            for size, max_px in THUMBNAIL_SIZES.items():
+                # 원본이 이미 작으면 만들지 않음 (URL은 원본으로 대체됨)
+                if max(image.size) <= max_px:
+                    continue
+
+                thumb = image.copy()
+                thumb.thumbnail((max_px, max_px), Image.LANCZOS)
+
+                # 메모리에서 인코딩을 끝낸 뒤 한 번에 저장 → 생성 중인 썸네일이 노출되지 않음
+                buffer = io.BytesIO()
+                thumb.save(buffer, format="WEBP", quality=80, method=4)
+                buffer.seek(0)
+                storage.put(variant_path(key, size), buffer, content_type="image/webp")
+    except Exception as e:
+        logger.warning(f"[Thumbnail] Failed to generate thumbnails for {key}: {e}")
+
+
+def schedule_thumbnails(key: str):
+    """업로드 직후 호출 - 요청을 기다리게 하지 않고 워커 풀에 작업만 넘깁니다."""
+    if Image is None or not is_image_path(key):
+        return
+    _executor.submit(generate_thumbnails, key)
+
+
+def remove_thumbnails(key: str):
+    for size in THUMBNAIL_SIZES:
+        storage.delete(variant_path(key, size))
+
+
+def resolve_variant(key: str, size: str) -> Optional[str]:
+    """
+    /api/images/{size}/{key} 요청을 실제 저장소 키로 변환
+    썸네일이 있으면 썸네일, 없으면 원본 키 (원본이 없으면 None)
+    """
+    if not storage.exists(key):
+        return None
+
+    variant = variant_path(key, size)
+    return variant if storage.exists(variant) else key
+
+
+def shutdown():
+    _executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,208 @@
+# app/services/unread.py
+
+import os
+import time
+from datetime import datetime
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, func, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, select
+
+from app.models.board import Card, CardComment
+from app.models.chat import ChatArchiveSegment, ChatMessage
+from app.models.post import Post
+from app.models.read_cursor import ReadChannel, ReadCursor
+from app.models.workspace import Project, WorkspaceMember
+
+# =================================================================
+# 📬 읽음 커서 / 안 읽은 수
+# 사용자 × 프로젝트 × 채널(chat / posts / card_comments)마다 마지막으로 읽은 id만 저장하고,
+# 안 읽은 수 = 커서보다 큰 id 중 남이 쓴 것의 개수로 계산합니다.
+# - 개수는 (project_id, id) / (card_id, id) 인덱스 범위에서 UNREAD_COUNT_CAP개까지만 셈
+#   → 커서가 없거나 오래 안 읽어도 채널당 읽는 행 수가 상한으로 묶임 (화면에서는 상한 이상을 "99+"로 표시)
+# - 커서는 채널의 현재 최대 id를 넘지 못함 (큰 값으로 앞으로 올 알림이 가려지지 않도록)
+# - 전체 요약은 사용자의 모든 프로젝트를 한 번의 쿼리로 계산해 사용자별로 캐시
+#   → 커서를 옮기면 본인 캐시, 새 메시지/글/댓글이 생기면 그 프로젝트를 가진 캐시를 무효화
+#   (다른 워커에서 생긴 변경은 UNREAD_CACHE_TTL 안에 반영)
+# - 보관(아카이브)된 채팅은 이미 오래된 메시지라 안 읽은 수에 포함하지 않음
+# =================================================================
+
+UNREAD_CACHE_TTL = int(os.environ.get("UNREAD_CACHE_TTL", "30"))
+UNREAD_COUNT_CAP = 100  # 채널별 안 읽은 수 상한 (이 값이면 "그 이상")
+
+
+def _cursor(user_id: int, channel: ReadChannel):
+    return func.coalesce(
+        select(ReadCursor.last_read_id)
+        .where(ReadCursor.user_id == user_id)
+        .where(ReadCursor.project_id == Project.id)
+        .where(ReadCursor.channel == channel.value)
+        .correlate(Project)
+        .scalar_subquery(),
+        0
+    )
+
+
+def _capped_count(rows):
+    """SELECT count(*) FROM (... LIMIT UNREAD_COUNT_CAP) — 상한까지만 읽고 멈춤"""
+    limited = rows.limit(UNREAD_COUNT_CAP).correlate(Project).subquery()
+    return select(func.count()).select_from(limited).scalar_subquery()
+
+
+def summary_statement(user_id: int):
+    chat = _capped_count(
+        select(literal(1))
+        .select_from(ChatMessage)
+        .where(ChatMessage.project_id == Project.id)
+        .where(ChatMessage.id > _cursor(user_id, ReadChannel.chat))
+        .where(ChatMessage.user_id != user_id)
+    )
+    posts = _capped_count(
+        select(literal(1))
+        .select_from(Post)
+        .where(Post.project_id == Project.id)
+        .where(Post.id > _cursor(user_id, ReadChannel.posts))
+        .where(Post.user_id != user_id)
+    )
+    card_comments = _capped_count(
+        select(literal(1))
+        .select_from(CardComment)
+        .join(Card, Card.id == CardComment.card_id)
+        .where(Card.project_id == Project.id)
+        .where(CardComment.id > _cursor(user_id, ReadChannel.card_comments))
+        .where(CardComment.user_id != user_id)
+    )
+    return (
+        select(Project.id, Project.name, Project.workspace_id, chat, posts, card_comments)
+        .join(WorkspaceMember, and_(
+            WorkspaceMember.workspace_id == Project.workspace_id,
+            WorkspaceMember.user_id == user_id
+        ))
+        .order_by(Project.id)
+    )
+
+
+def load_summary(db: Session, user_id: int) -> List[dict]:
+    return [
+        {
+            "project_id": project_id,
+            "project_name": name,
+            "workspace_id": workspace_id,
+            "chat": chat,
+            "posts": posts,
+            "card_comments": card_comments,
+            "total": chat + posts + card_comments,
+        }
+        for project_id, name, workspace_id, chat, posts, card_comments
+        in db.exec(summary_statement(user_id)).all()
+    ]
+
+
+# -----------------------------------------------------------------
+# 사용자별 요약 캐시
+# -----------------------------------------------------------------
+class UnreadCache:
+    def __init__(self, ttl: int = UNREAD_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = Lock()
+        self._users: Dict[int, Tuple[float, List[dict]]] = {}
+        self._project_users: Dict[int, Set[int]] = {}
+
+    def get(self, user_id: int) -> Optional[List[dict]]:
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+        return None
+
+    def set(self, user_id: int, projects: List[dict]):
+        with self._lock:
+            self._drop(user_id)
+            self._users[user_id] = (time.monotonic() + self.ttl, projects)
+            for project in projects:
+                self._project_users.setdefault(project["project_id"], set()).add(user_id)
+
+    def _drop(self, user_id: int):
+        entry = self._users.pop(user_id, None)
+        if entry:
+            for project in entry[1]:
+                users = self._project_users.get(project["project_id"])
+                if users:
+                    users.discard(user_id)
+                    if not users:
+                        del self._project_users[project["project_id"]]
+
+    def invalidate_user(self, user_id: int):
+        with self._lock:
+            self._drop(user_id)
+
+    def invalidate_project(self, project_id: int):
+        with self._lock:
+            for user_id in list(self._project_users.get(project_id, ())):
+                self._drop(user_id)
+
+
+unread_cache = UnreadCache()
+
+
+def invalidate_project(project_id: int):
+    """프로젝트에 채팅/게시글/카드 댓글이 새로 생기면 호출"""
+    unread_cache.invalidate_project(project_id)
+
+
+def unread_summary(db: Session, user_id: int) -> List[dict]:
+    projects = unread_cache.get(user_id)
+    if projects is None:
+        projects = load_summary(db, user_id)
+        unread_cache.set(user_id, projects)
+    return projects
+
+
+def latest_id(db: Session, project_id: int, channel: ReadChannel) -> int:
+    """채널의 현재 최대 id (채팅은 핫 테이블이 비었으면 보관된 세그먼트의 마지막 id)"""
+    if channel == ReadChannel.chat:
+        latest = db.exec(select(func.max(ChatMessage.id)).where(ChatMessage.project_id == project_id)).one()
+        if latest is None:
+            latest = db.exec(
+                select(func.max(ChatArchiveSegment.last_message_id))
+                .where(ChatArchiveSegment.project_id == project_id)
+            ).one()
+    elif channel == ReadChannel.posts:
+        latest = db.exec(select(func.max(Post.id)).where(Post.project_id == project_id)).one()
+    else:
+        latest = db.exec(
+            select(func.max(CardComment.id))
+            .join(Card, Card.id == CardComment.card_id)
+            .where(Card.project_id == project_id)
+        ).one()
+    return latest or 0
+
+
+def mark_read(db: Session, user_id: int, project_id: int, channel: ReadChannel, last_read_id: int) -> int:
+    """커서를 앞으로만 옮김 (늦게 도착한 예전 요청이 커서를 되돌리지 않도록) → 저장된 커서 반환
+    채널의 현재 최대 id보다 큰 값은 최대 id로 맞춤"""
+    last_read_id = min(last_read_id, latest_id(db, project_id, channel))
+    statement = pg_insert(ReadCursor).values(
+        user_id=user_id,
+        project_id=project_id,
+        channel=channel.value,
+        last_read_id=last_read_id,
+        updated_at=datetime.now()
+    )
+    db.execute(statement.on_conflict_do_update(
+        index_elements=["user_id", "project_id", "channel"],
+        set_={"last_read_id": statement.excluded.last_read_id, "updated_at": statement.excluded.updated_at},
+        where=ReadCursor.last_read_id < statement.excluded.last_read_id
+    ))
+    stored = db.exec(
+        select(ReadCursor.last_read_id)
+        .where(ReadCursor.user_id == user_id)
+        .where(ReadCursor.project_id == project_id)
+        .where(ReadCursor.channel == channel.value)
+    ).one()
+    db.commit()
+
+    unread_cache.invalidate_user(user_id)
+    return stored
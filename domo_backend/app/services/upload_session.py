@@ -0,0 +1,243 @@
+# app/services/upload_session.py
+
+import os
+import re
+import json
+import uuid
+import fcntl
+from typing import Optional
+from datetime import datetime, timedelta
+from dataclasses import dataclass, asdict
+
+# 이어 올리기(Resumable Upload) 세션 저장 위치
+# - {upload_id}.json : 세션 메타데이터 (파일명, 전체 크기, 만료 시각 등)
+# - {upload_id}.part : 지금까지 받은 바이트 (파일 크기 = 현재 offset)
+# 디스크에 상태를 두기 때문에 워커가 재시작되어도 업로드를 이어갈 수 있습니다.
+# 조각은 항상 로컬(공유) 디스크에 모으고, 완료 시점에 저장소(storage)로 옮깁니다.
+SESSION_DIR = os.environ.get("UPLOAD_SESSION_DIR", "/app/uploads/.upload_sessions")
+SESSION_TTL = timedelta(hours=24)
+os.makedirs(SESSION_DIR, exist_ok=True)
+
+CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+class UploadSessionError(Exception):
+    """세션 처리 중 발생하는 오류 (status_code는 라우터에서 HTTP 응답으로 변환)"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+@dataclass
+class UploadSession:
+    upload_id: str
+    project_id: int
+    user_id: int
+    filename: str
+    total_size: int
+    created_at: str
+    expires_at: str
+
+    @property
+    def meta_path(self) -> str:
+        return os.path.join(SESSION_DIR, f"{self.upload_id}.json")
+
+    @property
+    def part_path(self) -> str:
+        return os.path.join(SESSION_DIR, f"{self.upload_id}.part")
+
+    @property
+    def offset(self) -> int:
+        """지금까지 디스크에 기록된 바이트 수"""
+        try:
+            return os.path.getsize(self.part_path)
+        except FileNotFoundError:
+            return 0
+
+    @property
+    def is_complete(self) -> bool:
+        return self.offset >= self.total_size
+
+    def is_expired(self) -> bool:
+        return datetime.fromisoformat(self.expires_at) < datetime.now()
+
+
+def _write_meta(session: UploadSession):
+    # 임시 파일에 쓰고 rename → 중간에 죽어도 깨진 JSON이 남지 않음
+    tmp_path = f"{session.meta_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(asdict(session), f, ensure_ascii=False)
+    os.replace(tmp_path, session.meta_path)
+
+
+def create_session(project_id: int, user_id: int, filename: str, total_size: int) -> UploadSession:
+    purge_expired_sessions()
+
+    now = datetime.now()
+    session = UploadSession(
+        upload_id=uuid.uuid4().hex,
+        project_id=project_id,
+        user_id=user_id,
+        filename=filename,
+        total_size=total_size,
+        created_at=now.isoformat(),
+        expires_at=(now + SESSION_TTL).isoformat()
+    )
+    open(session.part_path, "wb").close()
+    _write_meta(session)
+    return session
+
+
+def load_session(upload_id: str) -> Optional[UploadSession]:
+    # upload_id는 uuid hex만 허용 (경로 조작 방지)
+    if not re.fullmatch(r"[0-9a-f]{32}", upload_id):
+        return None
+
+    meta_path = os.path.join(SESSION_DIR, f"{upload_id}.json")
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return UploadSession(**json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError, TypeError):
+        return None
+
+
+def delete_session(session: UploadSession, keep_part: bool = False):
+    paths = [session.meta_path] if keep_part else [session.meta_path, session.part_path]
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def purge_expired_sessions():
+    """만료된 세션 정리 (세션 생성 시 함께 실행)"""
+    for entry in os.scandir(SESSION_DIR):
+        if not entry.name.endswith(".json"):
+            continue
+        session = load_session(entry.name[:-len(".json")])
+        if session and session.is_expired():
+            delete_session(session)
+
+
+def parse_content_range(header: Optional[str], total_size: int):
+    """
+    'Content-Range: bytes start-end/total' 헤더 파싱
+    헤더가 없으면 본문 전체를 현재 offset에 이어 붙이는 것으로 간주합니다.
+    """
+    if header is None:
+        return None
+
+    match = CONTENT_RANGE_RE.match(header.strip())
+    if not match:
+        raise UploadSessionError(400, "Content-Range 헤더 형식이 올바르지 않습니다. (bytes start-end/total)")
+
+    start, end, total = (int(v) for v in match.groups())
+    if total != total_size:
+        raise UploadSessionError(400, "Content-Range의 전체 크기가 세션과 일치하지 않습니다.")
+    if start > end or end >= total_size:
+        raise UploadSessionError(416, "요청한 범위가 파일 크기를 벗어납니다.")
+
+    return start, end
+
+
+class ChunkWriter:
+    """
+    세션의 .part 파일에 청크를 이어 쓰는 컨텍스트
+    - flock으로 같은 세션에 대한 동시 PUT(다른 워커 포함)을 막습니다.
+    - 클라이언트가 이미 받은 구간을 재전송하면 겹치는 앞부분은 버리고 이어 씁니다.
+    - Content-Range(start-end)가 있으면 본문 길이가 end - start + 1과 정확히 같아야 합니다.
+      다르면 이번 요청으로 쓴 부분을 되돌리고(abort) 400을 냅니다.
+    - 파일 I/O는 블로킹이므로 라우터에서는 스레드풀에서 호출합니다.
+    """
+
+    def __init__(self, session: UploadSession, start: int, end: Optional[int] = None):
+        self.session = session
+        self.skip = 0
+        self.start = start
+        self.expected = None if end is None else end - start + 1
+        self.received = 0
+        self.base = 0
+        self.file = None
+
+    def open(self):
+        self.file = open(self.session.part_path, "ab")
+        try:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self.file.close()
+            self.file = None
+            raise UploadSessionError(409, "같은 업로드에 대한 다른 요청이 진행 중입니다.")
+
+        offset = self.session.offset
+        if self.start > offset:
+            self.close()
+            raise UploadSessionError(409, f"업로드 위치가 맞지 않습니다. 현재 offset: {offset}")
+        self.base = offset
+        self.skip = offset - self.start
+        return self
+
+    def write(self, chunk: bytes):
+        self.received += len(chunk)
+        if self.expected is not None and self.received > self.expected:
+            raise UploadSessionError(400, "본문 길이가 Content-Range와 일치하지 않습니다.")
+
+        if self.skip:
+            if len(chunk) <= self.skip:
+                self.skip -= len(chunk)
+                return
+            chunk = chunk[self.skip:]
+            self.skip = 0
+
+        remaining = self.session.total_size - self.file.tell()
+        if len(chunk) > remaining:
+            raise UploadSessionError(416, "전체 파일 크기를 초과하는 데이터입니다.")
+        self.file.write(chunk)
+
+    def finish(self):
+        if self.expected is not None and self.received != self.expected:
+            raise UploadSessionError(400, "본문 길이가 Content-Range와 일치하지 않습니다.")
+
+    def abort(self):
+        """이번 요청으로 쓴 바이트를 버림 (offset을 요청 전으로 되돌림)"""
+        if self.file:
+            self.file.truncate(self.base)
+
+    def close(self):
+        if self.file:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def finalize_part(session: UploadSession, put_file):
+    """
+    완료 처리: 세션 잠금을 잡은 채로 .part 파일을 저장소로 옮기고 세션을 지움
+    같은 세션에 complete가 동시에 들어오면 한 요청만 진행하고 나머지는 409
+    """
+    try:
+        part = open(session.part_path, "rb")
+    except FileNotFoundError:
+        raise UploadSessionError(409, "이미 완료 처리된 업로드입니다.")
+
+    with part:
+        try:
+            fcntl.flock(part.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadSessionError(409, "같은 업로드에 대한 다른 요청이 진행 중입니다.")
+        # 잠금을 기다리는 사이 다른 요청이 완료했을 수 있음
+        if not os.path.exists(session.meta_path):
+            raise UploadSessionError(409, "이미 완료 처리된 업로드입니다.")
+        put_file(session.part_path)
+        delete_session(session, keep_part=True)
@@ -0,0 +1,125 @@
+# app/services/view_counter.py
+
+import os
+import time
+import asyncio
+import threading
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, update
+
+from app.database import engine
+from app.models.match import Recruitment
+
+# =================================================================
+# 👀 모집 공고 조회수 버퍼
+# 상세 조회마다 행을 잠그고 커밋하는 대신 워커 메모리에 증가분을 모아두고
+# 주기적으로 UPDATE ... SET view_count = view_count + :delta 로 한 번에 반영합니다.
+# - 같은 사람(세션, 없으면 IP)이 VIEW_DEDUP_SECONDS 안에 다시 보면 세지 않음
+# - 워커마다 따로 모으지만 증가분만 더하므로 여러 워커가 동시에 반영해도 안전
+# - 서버 종료 시 남은 증가분을 마지막으로 반영
+# =================================================================
+
+VIEW_FLUSH_SECONDS = int(os.getenv("VIEW_FLUSH_SECONDS", "10"))
+VIEW_DEDUP_SECONDS = int(os.getenv("VIEW_DEDUP_SECONDS", str(30 * 60)))
+# 중복 판별용 기록이 무한히 커지지 않도록 (넘치면 오래된 것부터 정리)
+MAX_SEEN_ENTRIES = 100_000
+
+
+class ViewCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Counter = Counter()
+        self._seen: Dict[Tuple[int, str], float] = {}
+
+    def record(self, recruitment_id: int, viewer_key: Optional[str] = None) -> bool:
+        """조회 1회 기록 (중복 조회로 판단되면 False)"""
+        now = time.monotonic()
+        with self._lock:
+            if viewer_key:
+                key = (recruitment_id, viewer_key)
+                expires_at = self._seen.get(key)
+                if expires_at and expires_at > now:
+                    return False
+                if len(self._seen) >= MAX_SEEN_ENTRIES:
+                    self._prune(now)
+                self._seen[key] = now + VIEW_DEDUP_SECONDS
+            self._pending[recruitment_id] += 1
+            return True
+
+    def pending(self, recruitment_id: int) -> int:
+        """아직 DB에 반영되지 않은 증가분 (응답의 조회수에 더해 보여줌)"""
+        with self._lock:
+            return self._pending.get(recruitment_id, 0)
+
+    def _prune(self, now: float):
+        self._seen = {key: exp for key, exp in self._seen.items() if exp > now}
+        # 전부 유효하면 가장 오래된 절반을 버림 (dict는 삽입 순서를 유지)
+        if len(self._seen) >= MAX_SEEN_ENTRIES:
+            keep = list(self._seen.items())[len(self._seen) // 2:]
+            self._seen = dict(keep)
+
+    def flush(self) -> int:
+        """모인 증가분을 한 트랜잭션으로 반영하고 반영한 공고 수를 반환"""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._prune(time.monotonic())
+        if not pending:
+            return 0
+
+        # id 순으로 갱신해 워커 간 행 잠금 순서를 맞춤 (교착 방지)
+        rows = [{"rid": rid, "delta": delta} for rid, delta in sorted(pending.items())]
+        statement = (
+            update(Recruitment)
+            .where(Recruitment.id == bindparam("rid"))
+            .values(view_count=Recruitment.view_count + bindparam("delta"))
+        )
+        try:
+            with engine.begin() as conn:
+                conn.execute(statement, rows)
+        except Exception:
+            # 실패하면 다음 주기에 다시 반영되도록 되돌려 놓음
+            with self._lock:
+                self._pending.update(pending)
+            raise
+        return len(rows)
+
+
+view_counter = ViewCounter()
+
+
+# -----------------------------------------------------------------
+# 주기적 반영 (main.py lifespan에서 start/stop)
+# -----------------------------------------------------------------
+_task = None
+
+
+async def _loop():
+    while True:
+        await asyncio.sleep(VIEW_FLUSH_SECONDS)
+        try:
+            await asyncio.to_thread(view_counter.flush)
+        except Exception as e:
+            print(f"❌ [View Counter] Flush failed: {e}", flush=True)
+
+
+def start():
+    global _task
+    if _task is None:
+        _task = asyncio.create_task(_loop())
+
+
+async def stop():
+    global _task
+    if _task:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
+    try:
+        await asyncio.to_thread(view_counter.flush)
+    except Exception as e:
+        print(f"❌ [View Counter] Final flush failed: {e}", flush=True)
@@ -0,0 +1,82 @@
+# app/services/workspace_templates.py
+
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from app.models.board import BoardColumn
+from app.models.match import RecruitmentCategory
+from app.models.workspace import Project
+
+# =================================================================
+# 🧩 워크스페이스 템플릿
+# 모집 완료 후 워크스페이스를 만들 때 프로젝트와 보드 컬럼을 미리 만들어 둡니다.
+# 프로젝트 전체를 INSERT 한 번, 컬럼 전체를 INSERT 한 번으로 넣어
+# 호출한 쪽 트랜잭션 안에서 처리합니다 (커밋은 호출한 쪽에서).
+# =================================================================
+
+# 템플릿 이름 → [(프로젝트 이름, [컬럼 제목, ...]), ...]
+WORKSPACE_TEMPLATES: Dict[str, List[Tuple[str, List[str]]]] = {
+    "hackathon": [
+        ("기획", ["아이디어", "할 일", "진행 중", "완료"]),
+        ("개발", ["백로그", "진행 중", "리뷰", "완료"]),
+        ("발표", ["자료 준비", "리허설", "완료"]),
+    ],
+    "side_project": [
+        ("기획/디자인", ["아이디어", "할 일", "진행 중", "완료"]),
+        ("개발", ["백로그", "이번 주", "진행 중", "리뷰", "완료"]),
+    ],
+    "study": [
+        ("스터디", ["학습 목록", "이번 주", "발표 준비", "완료"]),
+    ],
+    "mentoring": [
+        ("멘토링", ["질문", "과제", "피드백 대기", "완료"]),
+    ],
+}
+
+# template="auto"면 모집 카테고리에 맞는 템플릿 사용
+AUTO_TEMPLATE = "auto"
+
+COLUMN_WIDTH = 300.0
+COLUMN_GAP = 40.0
+
+
+class TemplateError(ValueError):
+    pass
+
+
+def resolve_template(template: Optional[str], category: RecruitmentCategory) -> Optional[str]:
+    if not template:
+        return None
+    if template == AUTO_TEMPLATE:
+        template = getattr(category, "value", category)
+    if template not in WORKSPACE_TEMPLATES:
+        raise TemplateError(f"알 수 없는 템플릿입니다: {template}")
+    return template
+
+
+def apply_template(db: Session, workspace_id: int, template: str) -> List[int]:
+    """템플릿의 프로젝트/컬럼을 만들고 생성된 프로젝트 id 목록을 반환"""
+    spec = WORKSPACE_TEMPLATES[template]
+
+    project_ids = list(db.execute(
+        insert(Project)
+        .values([{"name": name, "workspace_id": workspace_id} for name, _ in spec])
+        .returning(Project.id)
+    ).scalars())
+
+    columns = [
+        {
+            "project_id": project_id,
+            "title": title,
+            "order": order,
+            "local_x": order * (COLUMN_WIDTH + COLUMN_GAP),
+            "width": COLUMN_WIDTH,
+        }
+        for project_id, (_, titles) in zip(project_ids, spec)
+        for order, title in enumerate(titles)
+    ]
+    if columns:
+        db.execute(insert(BoardColumn).values(columns))
+    return project_ids
@@ -179,7 +179,33 @@ class BoardEventManager:
                 await connection.send_json(message)
 
 
+class MatchEventManager:
+    """
+    매칭 페이지 전역 이벤트 (모집 상태 변경 등)
+    프로젝트 구분 없이 접속한 모든 클라이언트에 전송하고, 끊긴 연결은 정리합니다.
+    """
+    def __init__(self):
+        self.active_connections: List[WebSocket] = []
+
+    async def connect(self, websocket: WebSocket):
+        await websocket.accept()
+        self.active_connections.append(websocket)
+
+    def disconnect(self, websocket: WebSocket):
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
+
+    async def broadcast(self, message: dict):
+        for connection in list(self.active_connections):
+            try:
+                await connection.send_json(message)
+            except Exception as e:
+                logger.warning(f"[MatchEventManager] Dropping connection: {e}")
+                self.disconnect(connection)
+
+
 # 싱글톤 인스턴스
 manager = ConnectionManager()
 voice_manager = VoiceConnectionManager()
 board_event_manager = BoardEventManager()
+match_event_manager = MatchEventManager()
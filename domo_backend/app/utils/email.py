@@ -1,4 +1,6 @@
 import os
+from html import escape as html_escape
+from typing import List
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from pydantic import EmailStr
 
@@ -33,4 +35,26 @@ async def send_verification_email(email: EmailStr, code: str):
     )
 
     fm = FastMail(conf)
-    await fm.send_message(message)
\ No newline at end of file
+    await fm.send_message(message)
+
+async def send_workspace_welcome_email(emails: List[EmailStr], workspace_name: str, link: str):
+    """모집 완료로 만들어진 워크스페이스 합류 안내 (받는 사람끼리 주소가 보이지 않도록 BCC)"""
+    if not emails:
+        return
+
+    html = f"""
+    <h3>Domo 워크스페이스에 합류했습니다</h3>
+    <p>지원하신 모집이 완료되어 워크스페이스 <b>{html_escape(workspace_name)}</b>의 멤버가 되었습니다.</p>
+    <p><a href="{link}">Domo에서 팀원들과 시작하기</a></p>
+    """
+
+    message = MessageSchema(
+        subject=f"[Domo] '{workspace_name}' 워크스페이스에 초대되었습니다",
+        recipients=[conf.MAIL_FROM],
+        bcc=emails,
+        body=html,
+        subtype=MessageType.html
+    )
+
+    fm = FastMail(conf)
+    await fm.send_message(message)
@@ -6,10 +6,12 @@ def log_activity(
         user_id: int,
         content: str,
         action_type: str,
-        workspace_id: int = None
+        workspace_id: int = None,
+        commit: bool = True
 ):
     """
     활동 로그를 DB에 저장하는 헬퍼 함수
+    commit=False면 호출한 쪽의 트랜잭션에 포함시키고 커밋은 호출한 쪽에서 합니다.
     """
     log = ActivityLog(
         user_id=user_id,
@@ -18,4 +20,5 @@ def log_activity(
         workspace_id=workspace_id
     )
     db.add(log)
-    db.commit()
\ No newline at end of file
+    if commit:
+        db.commit()
\ No newline at end of file
@@ -0,0 +1,40 @@
+# app/utils/origin.py
+
+import os
+from typing import Optional
+from urllib.parse import urlsplit
+
+# =================================================================
+# 🌐 허용 출처(Origin)
+# main.py의 CORSMiddleware와 WebSocket 엔드포인트의 Origin 검사가 같은 목록을 씁니다.
+# WebSocket에는 CORS가 적용되지 않고 세션 쿠키(samesite=none)가 그대로 실리므로,
+# 쿠키로 인증하는 소켓은 accept() 전에 Origin을 직접 확인해야 합니다.
+# =================================================================
+
+origins = [
+    "http://localhost:3000",      # 프론트엔드 개발 서버
+    "http://localhost:3001",      # (혹시 포트가 다를 경우 대비)
+    "http://127.0.0.1:3000",
+    "*"                           # 테스트용 (보안상 나중엔 특정 도메인만 허용 추천)
+]
+
+# 배포된 프론트엔드 주소 + 추가로 허용할 출처 (쉼표 구분)
+origins += [
+    value.strip().rstrip("/")
+    for value in [os.environ.get("FRONTEND_URL", ""), *os.environ.get("CORS_ORIGINS", "").split(",")]
+    if value.strip()
+]
+
+
+def is_allowed_websocket_origin(origin: Optional[str], host: Optional[str]) -> bool:
+    """
+    쿠키 인증 WebSocket의 Origin 확인
+    - 목록에 명시된 출처 또는 같은 호스트에서 연 연결만 허용 ("*"는 쿠키 인증 소켓에 적용하지 않음)
+    - Origin이 없으면 브라우저가 아닌 클라이언트이므로 허용 (브라우저는 항상 Origin을 보냄)
+    """
+    if origin is None:
+        return True
+    origin = origin.rstrip("/")
+    if origin in origins and origin != "*":
+        return True
+    return bool(host) and urlsplit(origin).netloc == host